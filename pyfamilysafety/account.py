@@ -3,15 +3,21 @@
 
 import asyncio
 import logging
-from datetime import datetime, date, time
-from urllib.parse import quote_plus
+from datetime import datetime, date, timedelta
 
 from .api import FamilySafetyAPI
+from .const import DEFAULT_UPDATE_TIMEOUT, WEB_RESTRICTIONS_BATCH_SIZE
 from .device import Device
-from .application import Application
-from .enum import OverrideTarget, OverrideType
-from .schedule import DeviceLimitsSchedule
-from .helpers import localise_datetime, standardise_datetime, API_TIMEZONE
+from .application import Application, AppActivityReport
+from .spending import Spending
+from .enum import OverrideTarget, OverrideType, RequestPriority
+from .schedule import CompiledSchedule, DeviceLimitsSchedule, ScheduleStatus, diff_schedules
+from .usage_history import UsageHistory
+from .web_restrictions import WebRestrictions, normalise_website
+from .content_restrictions import ContentRestrictions
+from .helpers import format_query_time, localise_datetime, standardise_datetime, API_TIMEZONE
+from .update_cycle import UpdateCycle
+from .exceptions import AggregatorException, CircuitOpen, HttpException, UpdateFailed
 from .utils import is_awaitable
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,14 +33,38 @@ class Account:
         profile_picture: Profile image URL.
         devices: Registered devices, populated by :meth:`update`.
         applications: Apps from the activity report, populated by :meth:`update`.
+            Reading this builds every :class:`Application`; prefer
+            :attr:`app_activity` or :meth:`get_application` for large reports.
+        app_activity: Lazy view of the latest app activity report.
         today_screentime_usage: Total device screen time today in milliseconds.
         average_screentime_usage: Daily average screen time from the API.
-        screentime_usage: Raw device screen-time report JSON.
-        application_usage: Raw app activity report JSON.
+        screentime_usage: Raw device screen-time report JSON; ``None`` in
+            lean mode.
+        application_usage: Raw app activity report JSON; ``None`` in lean
+            mode.
         blocked_platforms: Platforms with an active device override block.
-        account_balance: Microsoft Store allowance balance when available.
+        account_balance: Microsoft Store allowance balance when available. If
+            there are several balances this is the first; see :attr:`spending`.
         account_currency: Currency code for ``account_balance``.
+        spending: Cached spending balances and payment methods, refreshed by
+            :meth:`update` once every ``spending.refresh_interval``.
         experimental: Mirrors the parent :class:`FamilySafety` experimental flag.
+        lean: Mirrors the parent :class:`FamilySafety` lean flag. When set,
+            raw report payloads are dropped once their fields are parsed and
+            only the fields :attr:`app_activity` needs are kept per app.
+        update_timeout: Overall deadline in seconds for :meth:`update`.
+        last_updated: UTC time each field was last refreshed, keyed by
+            ``devices``, ``screentime_usage``, ``applications``,
+            ``blocked_platforms`` and ``account_balance``.
+        device_limits: Last known device limits schedule per platform, as
+            applied through :meth:`set_device_limits`.
+        web_restrictions: Cached web restrictions, loaded by
+            :meth:`get_web_restrictions`.
+        content_restrictions: Cached content restrictions, loaded by
+            :meth:`get_content_restrictions`.
+        usage_history: Today's screen time samples for the whole account.
+        device_usage_history: Today's screen time samples per device ID.
+        day: Local date that today's usage fields and histories belong to.
     """
 
     def __init__(self, api) -> None:
@@ -45,17 +75,28 @@ class Account:
         self.first_name = None
         self.surname = None
         self.devices: list[Device] = None
-        self.applications: list[Application] = []
+        self.app_activity: AppActivityReport = AppActivityReport(api, None)
         self.today_screentime_usage: int = None
         self.average_screentime_usage: float = None
         self.screentime_usage: dict = None
         self.application_usage: dict = None
         self.blocked_platforms: list[OverrideTarget] = None
         self.experimental: bool = False
+        self.lean: bool = False
         self._api: FamilySafetyAPI = api
         self.account_balance: float = 0.0
         self.account_currency: str = ""
+        self.spending: Spending = Spending(api, None)
         self._account_callbacks: list = []
+        self._device_blocked: dict[str, bool] = {}
+        self.update_timeout: float = DEFAULT_UPDATE_TIMEOUT
+        self.last_updated: dict[str, datetime] = {}
+        self.device_limits: dict[OverrideTarget, DeviceLimitsSchedule] = {}
+        self.web_restrictions: WebRestrictions = None
+        self.content_restrictions: ContentRestrictions = None
+        self.usage_history: UsageHistory = UsageHistory()
+        self.device_usage_history: dict[str, UsageHistory] = {}
+        self.day: date = None
 
     def add_account_callback(self, callback):
         """Add a callback to the account."""
@@ -71,129 +112,321 @@ class Account:
         if callback in self._account_callbacks:
             self._account_callbacks.remove(callback)
 
-    async def update(self) -> None:
-        """Update all account details."""
-        begin_time, end_time = self._default_usage_time_range()
-        (
-            devices_response,
-            device_usage,
-            application_usage,
-            overrides_response,
-            _,
-        ) = await asyncio.gather(
-            self._api.async_get_user_devices(user_id=self.user_id),
-            self._api.async_get_user_device_screentime_usage(
-                user_id=self.user_id,
-                begin_time=begin_time,
-                end_time=end_time,
-                device_count=4,
-                platform="ALL",
-            ),
-            self._api.async_get_user_app_screentime_usage(
-                user_id=self.user_id,
-                begin_time=begin_time,
-                end_time=end_time,
-                platform="ALL",
-            ),
-            self._api.async_get_override_device_restrictions(user_id=self.user_id),
-            self._get_account_balance(),
-        )
-        self._apply_screentime_usage(device_usage.get("json"), application_usage.get("json"))
-        self.devices = Device.from_dict(devices_response.get("json"), self.screentime_usage)
-        self._apply_applications()
-        self._update_device_blocked(overrides_response.get("json"))
+    async def update(self, cycle: UpdateCycle = None) -> None:
+        """Update all account details.
+
+        Each subrequest (devices, device usage, app usage, overrides and spending)
+        is applied as soon as it completes, so one slow or failing endpoint does
+        not discard the others. Each request is limited by the API's
+        ``request_timeout``.
+        Subrequests still running after :attr:`update_timeout` are cancelled and
+        the previous data for those fields is kept. The time each field was last
+        refreshed is recorded in :attr:`last_updated`; responses served from
+        cache while a circuit is open do not count. Spending is only fetched
+        once it is older than ``spending.refresh_interval``.
+
+        Args:
+            cycle: The refresh cycle shared by all accounts; a new one for the
+                current local day is used if omitted.
+
+        Raises:
+            UpdateFailed: Every subrequest failed, timed out or missed the deadline.
+            HttpException: Every subrequest failed and one was refused with a
+                non-transient error such as ``Unauthorized``.
+        """
+        cycle = cycle or UpdateCycle()
+        self._roll_over(cycle.day)
+        begin_time, end_time = cycle.begin_param, cycle.end_param
+        tasks = [
+            asyncio.ensure_future(self._run_subrequest(name, coro))
+            for name, coro in (
+                ("devices", self._get_devices()),
+                ("screentime_usage", self._get_device_usage(begin_time, end_time)),
+                ("applications", self._get_application_usage(begin_time, end_time)),
+                ("blocked_platforms", self._get_overrides()),
+            )
+        ]
+        if self.spending.needs_refresh:
+            tasks.append(asyncio.ensure_future(self._run_subrequest("account_balance", self._get_account_balance())))
+        done, pending = await asyncio.wait(tasks, timeout=self.update_timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            _LOGGER.warning("Account %s update deadline of %ss exceeded, %s subrequest(s) cancelled",
+                            self.user_id, self.update_timeout, len(pending))
+            await asyncio.gather(*pending, return_exceptions=True)
+        errors = [task.result() for task in done if task.result() is not None]
+        errors.extend(asyncio.TimeoutError() for _ in pending)
+        if len(errors) == len(tasks):
+            for err in errors:
+                if isinstance(err, HttpException) and not isinstance(err, AggregatorException):
+                    raise err
+            raise UpdateFailed(self.user_id, errors) from errors[0]
         for cb in self._account_callbacks:
             if is_awaitable(cb):
                 await cb()
             else:
                 cb()
 
-    def _default_usage_time_range(self) -> tuple[str, str]:
-        """Returns the default begin/end time query params for today's usage."""
-        start_time = localise_datetime(datetime.combine(date.today(), time(0, 0, 0), tzinfo=API_TIMEZONE))
-        end_time = localise_datetime(datetime.combine(date.today(), time(23, 59, 59), tzinfo=API_TIMEZONE))
-        return (
-            quote_plus(start_time.strftime('%Y-%m-%dT%H:%M:%S%z')),
-            quote_plus(end_time.strftime('%Y-%m-%dT%H:%M:%S%z')),
-        )
+    async def _run_subrequest(self, name: str, coro) -> Exception | None:
+        """Run a single update subrequest, returning the error instead of raising.
+
+        ``coro`` returns ``True`` when it was answered from the stale cache, in
+        which case the field keeps its previous refresh time.
+        """
+        try:
+            stale = await coro
+        except asyncio.TimeoutError as err:
+            _LOGGER.warning("Account %s %s refresh timed out after %ss", self.user_id, name, self._api.request_timeout)
+            return err
+        except CircuitOpen as err:
+            _LOGGER.debug("Account %s %s refresh skipped: %s", self.user_id, name, err)
+            return err
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Account %s %s refresh failed: %s", self.user_id, name, err)
+            return err
+        if stale:
+            _LOGGER.debug("Account %s %s served from cache", self.user_id, name)
+            return None
+        self.last_updated[name] = datetime.now(tz=API_TIMEZONE)
+        return None
+
+    def data_age(self, name: str) -> timedelta:
+        """Return how long ago a field was refreshed.
+
+        Args:
+            name: A :attr:`last_updated` key, such as ``screentime_usage``.
 
-    def _apply_screentime_usage(self, device_usage: dict, application_usage: dict) -> None:
+        Returns:
+            The age, or ``None`` if the field has never been refreshed.
+        """
+        updated = self.last_updated.get(name)
+        if updated is None:
+            return None
+        return datetime.now(tz=API_TIMEZONE) - updated
+
+    def data_ages(self) -> dict[str, timedelta]:
+        """Return the age of every field refreshed so far, keyed as :attr:`last_updated`."""
+        now = datetime.now(tz=API_TIMEZONE)
+        return {name: now - updated for name, updated in self.last_updated.items() if updated is not None}
+
+    def _roll_over(self, day: date) -> None:
+        """Clear today's usage when a new local day starts, once per day."""
+        if self.day is not None and day > self.day:
+            _LOGGER.debug("Account %s rolled over from %s to %s", self.user_id, self.day, day)
+            self.today_screentime_usage = None
+            self.screentime_usage = None
+            self.application_usage = None
+            self.app_activity.clear()
+            self.usage_history.clear()
+            self.device_usage_history.clear()
+            for device in self.devices or []:
+                device.today_time_used = None
+        if self.day is None or day > self.day:
+            self.day = day
+
+    def _apply_screentime_usage(self, device_usage: dict, application_usage: dict, stale: bool = False) -> None:
         """Store screentime usage payloads on the account."""
-        self.screentime_usage = device_usage
+        self._apply_device_usage(device_usage, stale)
+        if self.lean:
+            self._apply_application_usage(application_usage)
+        else:
+            self.application_usage = application_usage
+
+    def _apply_device_usage(self, device_usage: dict, stale: bool = False) -> None:
+        """Store the device screentime report and refresh per-device usage.
+
+        A ``stale`` report was served from cache and is not added to the
+        usage history, as it does not describe usage at the current time.
+        """
+        self.screentime_usage = None if self.lean else device_usage
         self.today_screentime_usage = device_usage["deviceUsageAggregates"]["totalScreenTime"]
         self.average_screentime_usage = device_usage["deviceUsageAggregates"]["dailyAverage"]
-        self.application_usage = application_usage
+        for device in self.devices or []:
+            device.read_screentime_report(device_usage)
+        if not stale:
+            self._record_usage_history(device_usage["deviceUsageAggregates"])
+
+    def _record_usage_history(self, aggregates: dict) -> None:
+        """Add the latest usage totals to the intraday history."""
+        now = datetime.now(tz=API_TIMEZONE)
+        self.usage_history.append(aggregates["totalScreenTime"], now)
+        for device in aggregates.get("deviceAggregates", []):
+            device_id = device["deviceId"].replace("g:", "")
+            if device_id not in self.device_usage_history:
+                self.device_usage_history[device_id] = UsageHistory()
+            self.device_usage_history[device_id].append(device.get("timeUsed"), now)
+
+    def _get_usage_history(self, device_id: str = None) -> UsageHistory:
+        """Return the account or device usage history."""
+        if device_id is None:
+            return self.usage_history
+        if device_id not in self.device_usage_history:
+            raise IndexError("No usage history for device")
+        return self.device_usage_history[device_id]
+
+    def get_burn_rate(self, device_id: str = None, window: timedelta = timedelta(minutes=30)) -> float:
+        """Return the current screen time burn rate.
+
+        Computed locally from the samples recorded by each :meth:`update`.
+
+        Args:
+            device_id: Device to report on; defaults to the whole account.
+            window: How far back to look.
+
+        Returns:
+            Screen time used per second of wall-clock time (``1.0`` is
+            continuous use), or ``None`` if there are not enough samples.
+        """
+        return self._get_usage_history(device_id).burn_rate(window)
+
+    def get_time_to_limit(
+            self,
+            allowance: int,
+            device_id: str = None,
+            window: timedelta = timedelta(minutes=30)) -> timedelta:
+        """Project how long until today's usage reaches an allowance.
+
+        Args:
+            allowance: Daily allowance in milliseconds.
+            device_id: Device to report on; defaults to the whole account.
+            window: How far back to look when computing the burn rate.
+
+        Returns:
+            Projected time left, ``timedelta(0)`` if the allowance is already
+            used, or ``None`` if no usage is currently being recorded.
+        """
+        return self._get_usage_history(device_id).time_to_limit(allowance, window)
 
-    def _apply_applications(self) -> list[Application]:
+    def _apply_application_usage(self, application_usage: dict) -> AppActivityReport:
+        """Store the app activity report and refresh applications."""
+        self.app_activity.read_report(application_usage, compact=self.lean)
+        self.application_usage = None if self.lean else application_usage
+        return self.app_activity
+
+    def _apply_applications(self) -> AppActivityReport:
         """Refresh application state from the latest activity report."""
         if self.application_usage is None:
+            if self.lean:
+                # the report was read into app_activity when it arrived
+                return self.app_activity
             raise ValueError("Application usage not collected, call 'get_screentime_usage' first.")
-        parsed_applications = Application.from_app_activity_report(
-            self.application_usage,
-            self._api,
-            self.user_id)
-        for app in parsed_applications:
-            try:
-                self.get_application(app.app_id).update(app)
-            except IndexError:
-                self.applications.append(app)
-        return self.applications
+        self.app_activity.read_report(self.application_usage)
+        return self.app_activity
+
+    @property
+    def applications(self) -> list[Application]:
+        """Apps from the latest activity report."""
+        return self.app_activity.applications()
 
-    async def _get_devices(self) -> list[Device]:
-        """Returns all devices on the account."""
+    async def _get_devices(self) -> bool:
+        """Refreshes all devices on the account, returning whether the response was stale."""
         response = await self._api.async_get_user_devices(user_id=self.user_id)
-        self.devices = Device.from_dict(response.get("json"), self.screentime_usage)
-        return self.devices
+        devices = Device.from_dict(response.get("json"), self.screentime_usage)
+        for device in devices:
+            device.blocked = self._device_blocked.get(device.device_id)
+            if self.lean and device.device_id in self.device_usage_history:
+                device.today_time_used = self.device_usage_history[device.device_id].latest
+        self.devices = devices
+        return response.get("stale")
+
+    async def _get_device_usage(self, begin_time: str, end_time: str) -> bool:
+        """Collects today's device screentime report, returning whether the response was stale."""
+        response = await self._api.async_get_user_device_screentime_usage(
+            user_id=self.user_id,
+            begin_time=begin_time,
+            end_time=end_time,
+            device_count=4,
+            platform="ALL",
+        )
+        self._apply_device_usage(response.get("json"), response.get("stale"))
+        return response.get("stale")
 
-    async def _get_overrides(self):
+    async def _get_application_usage(self, begin_time: str, end_time: str) -> bool:
+        """Collects today's app activity report and refreshes applications."""
+        response = await self._api.async_get_user_app_screentime_usage(
+            user_id=self.user_id,
+            begin_time=begin_time,
+            end_time=end_time,
+            platform="ALL",
+        )
+        self._apply_application_usage(response.get("json"))
+        return response.get("stale")
+
+    async def _get_overrides(self) -> bool:
         """Collects overrides."""
         response = await self._api.async_get_override_device_restrictions(
             user_id=self.user_id)
         self._update_device_blocked(response.get("json"))
+        return response.get("stale")
 
     async def _get_applications(self) -> list[Application]:
         """Returns all applications on the account."""
-        return self._apply_applications()
+        self._apply_applications()
+        return self.applications
 
-    async def _get_account_balance(self):
-        """Updates the account balance."""
-        response = await self._api.async_get_user_spending(
-            user_id=self.user_id
-        )
-        response = response["json"]
-        balances = response.get("balances", [])
-        if len(balances) == 1:
-            self.account_balance = balances[0]["balance"]
-            self.account_currency = balances[0]["currency"]
+    async def _get_account_balance(self, force: bool = False) -> bool:
+        """Updates the account balance, returning whether the balances were not refreshed."""
+        refreshed = self.spending.last_refreshed
+        await self.spending.refresh(force)
+        if len(self.spending.balances) > 0:
+            self.account_balance = self.spending.balances[0]["balance"]
+            self.account_currency = self.spending.balances[0]["currency"]
+        return self.spending.last_refreshed == refreshed
+
+    async def refresh_spending(self) -> list[dict]:
+        """Fetch spending balances now, regardless of the refresh interval.
+
+        Returns:
+            Every balance entry returned by the API.
+        """
+        await self._get_account_balance(force=True)
+        self.last_updated["account_balance"] = self.spending.last_refreshed
+        return self.spending.balances
+
+    async def get_payment_methods(self, cid: str, refresh: bool = False) -> dict:
+        """Return the payment methods for this member.
+
+        Args:
+            cid: Customer ID sent as the ``cid`` query parameter.
+            refresh: Fetch again even if a cached response exists.
+
+        Returns:
+            Parsed JSON from the payment methods API, shared by concurrent callers.
+        """
+        return await self.spending.get_payment_methods(cid, refresh)
 
     async def get_screentime_usage(self,
                                    start_time: datetime = None,
                                    end_time: datetime = None,
                                    device_count: int = 4,
-                                   platform: str = "ALL") -> dict:
+                                   platform: str = "ALL",
+                                   priority: RequestPriority = None) -> dict:
         """Return screen time usage for a time range.
 
         Args:
-            start_time: Range start; defaults to start of today (local).
+            start_time: Range start; defaults to start of today (local). Naive
+                datetimes are taken to be local time.
             end_time: Range end; defaults to end of today (local).
             device_count: Maximum devices in the device usage report.
             platform: Platform filter (e.g. ``ALL``, ``WINDOWS``, ``XBOX``).
+            priority: Dispatch lane; defaults to ``NORMAL`` for today and
+                ``BULK`` for custom ranges.
 
         Returns:
             When default times are used, returns cached ``screentime_usage`` after
-            updating account fields. Otherwise a dict with ``devices`` and
+            updating account fields (``None`` in lean mode). Otherwise a dict with ``devices`` and
             ``applications`` keys containing raw JSON payloads.
         """
-        default = False
-        if start_time is None:
-            default = True
-            start_time = localise_datetime(datetime.combine(date.today(), time(0,0,0), tzinfo=API_TIMEZONE))
-        if end_time is None:
-            default = True
-            end_time = localise_datetime(datetime.combine(date.today(), time(23,59,59), tzinfo=API_TIMEZONE))
-
-        begin_time = quote_plus(start_time.strftime('%Y-%m-%dT%H:%M:%S%z'))
-        end_time_param = quote_plus(end_time.strftime('%Y-%m-%dT%H:%M:%S%z'))
+        default = start_time is None or end_time is None
+        cycle = None
+        if default:
+            cycle = UpdateCycle()
+            self._roll_over(cycle.day)
+        begin_time = cycle.begin_param if start_time is None else format_query_time(start_time)
+        end_time_param = cycle.end_param if end_time is None else format_query_time(end_time)
+        if priority is None:
+            priority = RequestPriority.NORMAL if default else RequestPriority.BULK
 
         device_usage, application_usage = await asyncio.gather(
             self._api.async_get_user_device_screentime_usage(
@@ -201,18 +434,21 @@ class Account:
                 begin_time=begin_time,
                 end_time=end_time_param,
                 device_count=device_count,
-                platform=platform
+                platform=platform,
+                priority=priority
             ),
             self._api.async_get_user_app_screentime_usage(
                 user_id=self.user_id,
                 begin_time=begin_time,
                 end_time=end_time_param,
-                platform=platform
+                platform=platform,
+                priority=priority
             ),
         )
 
         if default:
-            self._apply_screentime_usage(device_usage.get("json"), application_usage.get("json"))
+            self._apply_screentime_usage(
+                device_usage.get("json"), application_usage.get("json"), device_usage.get("stale"))
             return self.screentime_usage
         return {
             "devices": device_usage.get("json"),
@@ -221,30 +457,102 @@ class Account:
 
     def get_device(self, device_id) -> Device:
         """Returns a single device."""
-        return [x for x in self.devices if x.device_id == device_id][0]
+        return [x for x in self.devices or [] if x.device_id == device_id][0]
 
     def get_application(self, application_id) -> Application:
         """Returns a single application."""
-        return [x for x in self.applications if x.app_id == application_id][0]
+        return self.app_activity.get_application(application_id)
 
-    async def set_device_limits(self, schedule: DeviceLimitsSchedule) -> dict:
+    async def set_device_limits(self, schedule: DeviceLimitsSchedule, skip_unchanged: bool = False) -> dict:
         """Set screen time limits for a platform on the account.
 
         Args:
             schedule: Platform-specific limits built from
                 :class:`~pyfamilysafety.schedule.DeviceLimitsSchedule`.
+            skip_unchanged: Skip the request when ``schedule`` matches the one
+                cached in :attr:`device_limits`. The cache only holds
+                schedules sent from this process, so changes made in the
+                Family Safety app are not detected.
 
         Returns:
-            The API response body, if present.
+            The API response body, if present. ``None`` if the request was
+            skipped.
         """
+        if skip_unchanged and not diff_schedules(self.device_limits.get(schedule.platform), schedule):
+            _LOGGER.debug("Device limits for %s on %s unchanged, skipping update", schedule.platform, self.user_id)
+            return None
         body = schedule.to_dict()
         body["time"] = localise_datetime(datetime.now()).strftime("%Y-%m-%dT%H:%M:%S%z")
         response = await self._api.async_update_schedule(
             user_id=self.user_id,
             body=body,
         )
+        self._cache_device_limits(schedule, response.get("json"))
         return response.get("json")
 
+    def _cache_device_limits(self, schedule: DeviceLimitsSchedule, raw_response) -> None:
+        """Cache the applied schedule, preferring the server's copy if returned."""
+        if isinstance(raw_response, dict) and "dailyRestrictions" in raw_response:
+            try:
+                schedule = DeviceLimitsSchedule.from_dict({"appliesTo": str(schedule.platform), **raw_response})
+            except (KeyError, ValueError):
+                _LOGGER.debug("Unable to parse schedule response, caching requested schedule")
+        self.device_limits[schedule.platform] = schedule
+
+    async def update_device_limits(
+            self,
+            schedules: list[DeviceLimitsSchedule],
+            skip_unchanged: bool = False) -> dict[OverrideTarget, dict[str, tuple]]:
+        """Apply several platform schedules concurrently.
+
+        Args:
+            schedules: One schedule per platform.
+            skip_unchanged: Only send platforms whose schedule differs from
+                the one cached in :attr:`device_limits`; see
+                :meth:`set_device_limits`.
+
+        Returns:
+            Changes against the cached schedule per platform sent, as returned
+            by :func:`~pyfamilysafety.schedule.diff_schedules`. Skipped
+            platforms are omitted.
+        """
+        changes = {}
+        for schedule in schedules:
+            diff = diff_schedules(self.device_limits.get(schedule.platform), schedule)
+            if diff or not skip_unchanged:
+                changes[schedule.platform] = diff
+        await asyncio.gather(*(
+            self.set_device_limits(schedule)
+            for schedule in schedules if schedule.platform in changes
+        ))
+        return changes
+
+    def evaluate_device_limits(
+            self,
+            schedule: DeviceLimitsSchedule | CompiledSchedule,
+            device_id: str = None,
+            when: datetime = None) -> ScheduleStatus:
+        """Evaluate device limits locally against the latest observed usage.
+
+        Args:
+            schedule: Platform schedule, compiled or not. Compile it once with
+                :class:`~pyfamilysafety.schedule.CompiledSchedule` when
+                evaluating repeatedly.
+            device_id: Use this device's usage; defaults to the account total.
+            when: Local time to evaluate; defaults to now.
+
+        Returns:
+            Whether use is allowed, the remaining allowance and the next
+            window transition.
+        """
+        if not isinstance(schedule, CompiledSchedule):
+            schedule = CompiledSchedule(schedule)
+        if device_id is None:
+            used = self.today_screentime_usage
+        else:
+            used = self.get_device(device_id).today_time_used
+        return schedule.evaluate(when, used or 0)
+
     async def override_device(self,
                               target: OverrideTarget,
                               override: OverrideType,
@@ -281,14 +589,24 @@ class Account:
         )
         self._update_device_blocked(response.get("json"))
 
-    async def get_web_restrictions(self) -> dict:
+    async def get_web_restrictions(self, refresh: bool = False) -> dict:
         """Return current web filtering settings for this member.
 
+        The first call fetches from the API and caches the result in
+        :attr:`web_restrictions`; later calls return the cache, which is kept
+        in sync with changes made through :meth:`update_web_restrictions`.
+
+        Args:
+            refresh: Fetch from the API even if a cached copy exists, for
+                example to pick up changes made in the Family Safety app.
+
         Returns:
             Parsed JSON from the web restrictions API.
         """
-        response = await self._api.async_get_user_web_restrictions(user_id=self.user_id)
-        return response.get("json")
+        if self.web_restrictions is None or refresh:
+            response = await self._api.async_get_user_web_restrictions(user_id=self.user_id)
+            self.web_restrictions = WebRestrictions(response.get("json") or {})
+        return self.web_restrictions.raw
 
     async def update_web_restrictions(self, operations: list[dict]) -> dict:
         """Apply web filtering changes using JSON Patch operations.
@@ -303,8 +621,106 @@ class Account:
             user_id=self.user_id,
             body={"operations": operations},
         )
+        if self.web_restrictions is not None:
+            self.web_restrictions.apply_operations(operations)
         return response.get("json")
 
+    async def add_web_exceptions(
+            self,
+            websites: list[str],
+            allowed: bool = False,
+            source: str = "",
+            batch_size: int = WEB_RESTRICTIONS_BATCH_SIZE) -> list[dict]:
+        """Add web filtering exceptions for many websites at once.
+
+        Websites that already have the same exception are skipped, and an
+        existing exception with the opposite setting is replaced. Operations are
+        sent in as few requests as possible, ``batch_size`` at a time.
+
+        Args:
+            websites: Domains or URLs to except from the default filter.
+            allowed: ``True`` to always allow; ``False`` to always block.
+            source: Optional source label sent to the API.
+            batch_size: Maximum operations per request.
+
+        Returns:
+            The patch operations that were sent.
+        """
+        await self.get_web_restrictions()
+        groups = []
+        for website in self._unique_websites(websites):
+            current = self.web_restrictions.get_exception(website)
+            if current is not None and current.get("allowed") == allowed:
+                continue
+            group = []
+            if current is not None:
+                group.append(self._web_exception_operation("Remove", current["website"], current.get("allowed"), source))
+            group.append(self._web_exception_operation("Add", website, allowed, source))
+            groups.append(group)
+        return await self._send_web_operation_groups(groups, batch_size)
+
+    async def remove_web_exceptions(
+            self,
+            websites: list[str],
+            source: str = "",
+            batch_size: int = WEB_RESTRICTIONS_BATCH_SIZE) -> list[dict]:
+        """Remove web filtering exceptions for many websites at once.
+
+        Websites without an exception are skipped.
+
+        Args:
+            websites: Domains or URLs to remove exceptions for.
+            source: Optional source label sent to the API.
+            batch_size: Maximum operations per request.
+
+        Returns:
+            The patch operations that were sent.
+        """
+        await self.get_web_restrictions()
+        groups = []
+        for website in self._unique_websites(websites):
+            current = self.web_restrictions.get_exception(website)
+            if current is None:
+                continue
+            groups.append([self._web_exception_operation("Remove", current["website"], current.get("allowed"), source)])
+        return await self._send_web_operation_groups(groups, batch_size)
+
+    @staticmethod
+    def _unique_websites(websites: list[str]) -> list[str]:
+        """Drop duplicate websites, keeping the first spelling."""
+        unique = {}
+        for website in websites:
+            unique.setdefault(normalise_website(website), website)
+        return list(unique.values())
+
+    @staticmethod
+    def _web_exception_operation(op: str, website: str, allowed: bool, source: str) -> dict:
+        """Build a single exceptions patch operation."""
+        return {
+            "op": op,
+            "path": "/exceptions",
+            "source": source,
+            "value": {
+                "website": website,
+                "allowed": allowed,
+            },
+        }
+
+    async def _send_web_operation_groups(self, groups: list[list[dict]], batch_size: int) -> list[dict]:
+        """Send operation groups in chunks, never splitting a group across requests."""
+        sent = []
+        chunk = []
+        for group in groups:
+            if chunk and len(chunk) + len(group) > batch_size:
+                await self.update_web_restrictions(chunk)
+                sent.extend(chunk)
+                chunk = []
+            chunk.extend(group)
+        if chunk:
+            await self.update_web_restrictions(chunk)
+            sent.extend(chunk)
+        return sent
+
     async def add_web_exception(
             self,
             website: str,
@@ -330,6 +746,42 @@ class Account:
             },
         }])
 
+    async def get_content_restrictions(self, refresh: bool = False) -> dict:
+        """Return current content restrictions (age rating, app exceptions) for this member.
+
+        The first call fetches from the API and caches the result in
+        :attr:`content_restrictions`; later calls return the cache.
+
+        Args:
+            refresh: Fetch from the API even if a cached copy exists.
+
+        Returns:
+            Parsed JSON from the content restrictions API.
+        """
+        if self.content_restrictions is None or refresh:
+            response = await self._api.async_get_user_content_restrictions(user_id=self.user_id)
+            self.content_restrictions = ContentRestrictions(response.get("json") or {})
+        return self.content_restrictions.raw
+
+    async def update_content_restrictions(self, operations: list[dict]) -> dict:
+        """Apply content restriction changes using JSON Patch operations.
+
+        The cached :attr:`content_restrictions` is cleared, so the next
+        :meth:`get_content_restrictions` call fetches the server's copy.
+
+        Args:
+            operations: List of patch operation dicts (``op``, ``path``, ``value``).
+
+        Returns:
+            Parsed JSON response from the API, if present.
+        """
+        response = await self._api.async_update_content_restrictions(
+            user_id=self.user_id,
+            body={"operations": operations},
+        )
+        self.content_restrictions = None
+        return response.get("json")
+
     def _update_device_blocked(self, raw_response: dict):
         """updates device(s) blocked status from a overrides response."""
         platforms = raw_response.get("lockablePlatforms")
@@ -341,14 +793,22 @@ class Account:
                 blocked_platforms.append(OverrideTarget.from_pretty(platform.get("appliesTo")))
 
             for device in platform.get("devices"):
+                device_id = device.get("deviceId").replace("g:", "")
+                # kept so devices fetched after this response still get their state
+                self._device_blocked[device_id] = state
                 try:
-                    self.get_device(device.get("deviceId").replace("g:", "")).update_blocked_status(state)
-                finally:
+                    self.get_device(device_id).update_blocked_status(state)
+                except IndexError:
                     pass
         self.blocked_platforms = blocked_platforms
 
     @classmethod
-    async def from_dict(cls, api: FamilySafetyAPI, raw_response: dict, experimental: bool) -> list['Account']:
+    async def from_dict(
+            cls,
+            api: FamilySafetyAPI,
+            raw_response: dict,
+            experimental: bool,
+            lean: bool = False) -> list['Account']:
         """Converts a roster request response to an array."""
         accounts = []
         if "members" in raw_response.keys():
@@ -357,11 +817,14 @@ class Account:
                 if member.get("isDigitalSafetyEnabled"):
                     account = cls(api)
                     account.user_id = member.get("id")
+                    account.app_activity = AppActivityReport(api, account.user_id)
+                    account.spending = Spending(api, account.user_id)
                     account.role = member.get("role")
                     account.profile_picture = member.get("profilePicUrl")
                     account.first_name = member.get("user").get("firstName")
                     account.surname = member.get("user").get("lastName")
                     account.experimental = experimental
+                    account.lean = lean
                     accounts.append(account)
             if accounts:
                 await asyncio.gather(*(account.update() for account in accounts))
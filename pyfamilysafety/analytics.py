@@ -0,0 +1,282 @@
+"""Columnar screen time analytics across accounts and date ranges.
+
+Usage reports are loaded into compact ``array`` columns (one row per app or
+device per member per day) so totals, rankings and moving averages can be
+computed without walking the nested report JSON. NumPy is used for the
+aggregations when it is installed.
+"""
+
+import asyncio
+import logging
+from array import array
+from datetime import date, datetime, time, timedelta
+
+from .account import Account
+from .application import get_platform
+from .helpers import localise_datetime
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+_LOGGER = logging.getLogger(__name__)
+
+class _Interner:
+    """Maps string keys to dense integer codes."""
+
+    def __init__(self) -> None:
+        self.codes: dict = {}
+        self.values: list = []
+
+    def code(self, value) -> int:
+        """Return the code for a value, assigning a new one if needed."""
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+class _Table:
+    """A set of equally sized columns."""
+
+    def __init__(self) -> None:
+        self.user = array("I")
+        self.day = array("i")
+        self.key = array("I")
+        self.platform = array("I")
+        self.usage = array("q")
+        self.keys = _Interner()
+
+    def __len__(self) -> int:
+        return len(self.usage)
+
+    def append(self, user: int, day: int, key, platform: int, usage: int):
+        """Append a single row."""
+        self.user.append(user)
+        self.day.append(day)
+        self.key.append(self.keys.code(key))
+        self.platform.append(platform)
+        self.usage.append(usage)
+
+class UsageAnalytics:
+    """Aggregates app and device usage reports for one or more accounts.
+
+    Load reports with :meth:`add_app_report` / :meth:`add_device_report`, or
+    fetch a whole date range with :meth:`load_history`. All usage values are
+    in milliseconds.
+    """
+
+    def __init__(self) -> None:
+        self._users = _Interner()
+        self._platforms = _Interner()
+        self._apps = _Table()
+        self._devices = _Table()
+        # one row per member per day with the report's totalScreenTime
+        self._daily = _Table()
+        self._loaded: set[tuple[str, int, str]] = set()
+
+    @property
+    def app_rows(self) -> int:
+        """Number of app usage rows loaded."""
+        return len(self._apps)
+
+    @property
+    def device_rows(self) -> int:
+        """Number of device usage rows loaded."""
+        return len(self._devices)
+
+    def add_app_report(self, user_id: str, day: date, raw_response: dict) -> None:
+        """Load an app activity report (``get_user_app_screentime_usage``) for a day.
+
+        Reports for a member and day that were already loaded are ignored.
+        """
+        if not self._mark_loaded(user_id, day, "apps"):
+            return
+        user = self._users.code(user_id)
+        ordinal = day.toordinal()
+        for app in raw_response.get("appActivity", []):
+            self._apps.append(
+                user, ordinal, app["appId"],
+                self._platforms.code(get_platform(app["appId"])), int(app["usage"]))
+
+    def add_device_report(self, user_id: str, day: date, raw_response: dict) -> None:
+        """Load a device screen time report (``get_user_device_screentime_usage``) for a day.
+
+        ``deviceAggregates`` only lists the top devices, so the day's total is
+        taken from ``totalScreenTime``. Reports for a member and day that were
+        already loaded are ignored.
+        """
+        if not self._mark_loaded(user_id, day, "devices"):
+            return
+        user = self._users.code(user_id)
+        ordinal = day.toordinal()
+        platform = self._platforms.code(None)
+        usage = raw_response.get("deviceUsageAggregates", {})
+        devices = usage.get("deviceAggregates", [])
+        for device in devices:
+            self._devices.append(
+                user, ordinal, device["deviceId"].replace("g:", ""),
+                platform, int(device.get("timeUsed") or 0))
+        total = usage.get("totalScreenTime")
+        if total is None:
+            total = sum(int(device.get("timeUsed") or 0) for device in devices)
+        self._daily.append(user, ordinal, None, platform, int(total))
+
+    def _mark_loaded(self, user_id: str, day: date, kind: str) -> bool:
+        """Record a report as loaded, returning ``False`` if it already was."""
+        key = (user_id, day.toordinal(), kind)
+        if key in self._loaded:
+            _LOGGER.debug("Skipping duplicate %s report for %s on %s", kind, user_id, day)
+            return False
+        self._loaded.add(key)
+        return True
+
+    async def load_history(
+            self,
+            account: Account,
+            start: date,
+            end: date,
+            max_concurrency: int = 4) -> None:
+        """Fetch and load one report per day for an account.
+
+        Args:
+            account: Account to fetch usage for.
+            start: First day to fetch (inclusive).
+            end: Last day to fetch (inclusive).
+            max_concurrency: Maximum number of days fetched at once.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _load_day(day: date):
+            async with semaphore:
+                response = await account.get_screentime_usage(
+                    start_time=localise_datetime(datetime.combine(day, time(0, 0, 0))),
+                    end_time=localise_datetime(datetime.combine(day, time(23, 59, 59))),
+                )
+            self.add_device_report(account.user_id, day, response["devices"])
+            self.add_app_report(account.user_id, day, response["applications"])
+
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        await asyncio.gather(*(_load_day(day) for day in days))
+
+    def _select(self, table: _Table, user_id: str = None, start: date = None, end: date = None):
+        """Return the rows matching the filters as a mask (NumPy) or index list."""
+        user = self._users.codes.get(user_id, -1) if user_id is not None else None
+        first = start.toordinal() if start is not None else None
+        last = end.toordinal() if end is not None else None
+        if np is not None:
+            mask = np.ones(len(table), dtype=bool)
+            if user is not None:
+                mask &= np.frombuffer(table.user, dtype=table.user.typecode) == user
+            days = np.frombuffer(table.day, dtype=table.day.typecode)
+            if first is not None:
+                mask &= days >= first
+            if last is not None:
+                mask &= days <= last
+            return mask
+        return [
+            i for i in range(len(table))
+            if (user is None or table.user[i] == user)
+            and (first is None or table.day[i] >= first)
+            and (last is None or table.day[i] <= last)
+        ]
+
+    @staticmethod
+    def _column(values: array, rows):
+        """Return the selected rows of a column."""
+        if np is not None:
+            return np.frombuffer(values, dtype=values.typecode)[rows]
+        return [values[i] for i in rows]
+
+    @staticmethod
+    def _sum_by(keys: array, values: array, rows, size: int, offset: int = 0) -> list:
+        """Sum ``values`` grouped by ``keys - offset`` over the selected rows."""
+        if np is not None:
+            key_data = np.frombuffer(keys, dtype=keys.typecode)[rows].astype(np.int64) - offset
+            value_data = np.frombuffer(values, dtype=values.typecode)[rows]
+            return np.bincount(key_data, weights=value_data, minlength=size).astype(np.int64).tolist()
+        totals = [0] * size
+        for i in rows:
+            totals[keys[i] - offset] += values[i]
+        return totals
+
+    def _totals(self, table: _Table, column: str, user_id, start, end) -> dict:
+        """Group usage by the key or platform column."""
+        if column == "platform":
+            labels = self._platforms.values
+        else:
+            labels = table.keys.values
+        rows = self._select(table, user_id, start, end)
+        totals = self._sum_by(getattr(table, column), table.usage, rows, len(labels))
+        return {label: total for label, total in zip(labels, totals) if total}
+
+    def app_totals(self, user_id: str = None, start: date = None, end: date = None) -> dict[str, int]:
+        """Total usage per app ID, optionally filtered by member and date range."""
+        return self._totals(self._apps, "key", user_id, start, end)
+
+    def platform_totals(self, user_id: str = None, start: date = None, end: date = None) -> dict[str, int]:
+        """Total app usage per platform (``XBOX``, ``WINDOWS``, ``MOBILE``, or ``None``)."""
+        return self._totals(self._apps, "platform", user_id, start, end)
+
+    def device_totals(self, user_id: str = None, start: date = None, end: date = None) -> dict[str, int]:
+        """Total screen time per device ID.
+
+        Only covers the top devices listed in each report, see :meth:`daily_totals`.
+        """
+        return self._totals(self._devices, "key", user_id, start, end)
+
+    def daily_totals(self, user_id: str = None, start: date = None, end: date = None) -> dict[date, int]:
+        """Total device screen time per day, including zero for days without usage.
+
+        Uses each report's ``totalScreenTime``, so devices beyond the top
+        devices in the report are included. Days are limited to
+        ``start``/``end`` when given, otherwise to the range of loaded reports
+        for the selected member.
+        """
+        table = self._daily
+        rows = self._select(table, user_id, start, end)
+        days = self._column(table.day, rows)
+        if len(days) == 0 and (start is None or end is None):
+            return {}
+        first = start.toordinal() if start is not None else int(min(days))
+        last = end.toordinal() if end is not None else int(max(days))
+        if last < first:
+            return {}
+        totals = self._sum_by(table.day, table.usage, rows, last - first + 1, first)
+        return {date.fromordinal(first + i): total for i, total in enumerate(totals)}
+
+    def moving_average(
+            self,
+            window: int = 7,
+            user_id: str = None,
+            start: date = None,
+            end: date = None) -> dict[date, float]:
+        """Trailing moving average of daily screen time.
+
+        Each day's value averages that day and the ``window - 1`` days before it
+        that fall inside the range; days without data count as zero.
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1.")
+        daily = self.daily_totals(user_id, start, end)
+        days = list(daily)
+        values = list(daily.values())
+        if np is not None and values:
+            sums = np.cumsum(np.asarray(values, dtype=np.float64))
+            shifted = np.concatenate((np.zeros(window), sums))[:len(sums)]
+            counts = np.minimum(np.arange(1, len(sums) + 1), window)
+            return dict(zip(days, ((sums - shifted) / counts).tolist()))
+        averages = {}
+        running = 0
+        for i, value in enumerate(values):
+            running += value
+            if i >= window:
+                running -= values[i - window]
+            averages[days[i]] = running / min(i + 1, window)
+        return averages
+
+    def top_apps(self, n: int = 10, user_id: str = None, start: date = None, end: date = None) -> list[tuple[str, int]]:
+        """The ``n`` most used apps as ``(app_id, usage)`` pairs, highest first."""
+        totals = self.app_totals(user_id, start, end)
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:n]
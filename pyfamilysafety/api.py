@@ -1,14 +1,21 @@
 # pylint: disable=line-too-long
 """pyfamilysafety API request handler."""
 
+import asyncio
 import logging
-
-import aiohttp
-import aiohttp.client_exceptions
+from collections import OrderedDict
+from typing import Callable
 
 from .authenticator import Authenticator
-from .const import ENDPOINTS, BASE_URL, AGGREGATOR_ERROR, USER_AGENT
-from .exceptions import HttpException, AggregatorException, Unauthorized, RequestDenied
+from .circuit_breaker import CircuitBreaker
+from .const import (
+    AGGREGATOR_ERROR, CIRCUIT_CACHE_SIZE, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RECOVERY_TIMEOUT, DEFAULT_REQUEST_TIMEOUT
+)
+from .endpoints import ENDPOINT_REGISTRY, STATIC_HEADERS, build_request_method
+from .dispatch import PriorityDispatcher
+from .enum import CircuitState, RequestPriority
+from .exceptions import HttpException, AggregatorException, CircuitOpen, Unauthorized, RequestDenied
+from .response import ApiResponse
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,75 +23,181 @@ def _check_http_success(status: int) -> bool:
     return status >= 200 and status < 300
 
 class FamilySafetyAPI:
-    """The API."""
+    """The API.
+
+    Each endpoint has a :class:`~pyfamilysafety.circuit_breaker.CircuitBreaker`.
+    While an endpoint's circuit is open, GET requests are answered from the
+    last successful response for the same URL (with ``"stale": True`` in the
+    result) when :attr:`serve_stale` is set, and otherwise fail fast with
+    :class:`~pyfamilysafety.exceptions.CircuitOpen`. Only polling reads are
+    cached; ``BULK`` reads such as custom-range reports always fail fast.
+
+    Attributes:
+        circuit_failure_threshold: Consecutive failures that open a circuit.
+        circuit_recovery_timeout: Seconds a circuit stays open before a trial
+            request.
+        serve_stale: Serve cached polling GET responses while a circuit is open.
+        request_timeout: Seconds allowed for each HTTP request once it has left
+            the dispatch queue. A timeout counts as a failure for the circuit.
+        dispatcher: Limits requests in flight, starting waiting requests by
+            :class:`~pyfamilysafety.enum.RequestPriority`. Writes default to
+            ``HIGH`` and reads to ``NORMAL``.
+    """
 
     def __init__(self, auth: Authenticator) -> None:
         """Init API."""
         self._auth: Authenticator = auth
         self.pending_requests = []
+        self.circuit_failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD
+        self.circuit_recovery_timeout: float = CIRCUIT_RECOVERY_TIMEOUT
+        self.serve_stale: bool = True
+        self.request_timeout: float = DEFAULT_REQUEST_TIMEOUT
+        self._circuits: dict[str, CircuitBreaker] = {}
+        self._circuit_listeners: list[Callable] = []
+        self._response_cache: OrderedDict[str, ApiResponse] = OrderedDict()
+        self.dispatcher: PriorityDispatcher = PriorityDispatcher()
+
+    def get_circuit(self, endpoint: str) -> CircuitBreaker:
+        """Return the circuit breaker for an endpoint, creating it if needed."""
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = CircuitBreaker(
+                endpoint,
+                self.circuit_failure_threshold,
+                self.circuit_recovery_timeout,
+                self._notify_circuit_listeners,
+            )
+            self._circuits[endpoint] = circuit
+        return circuit
+
+    def circuit_metrics(self) -> dict[str, dict]:
+        """Return state and counters for every endpoint used so far."""
+        return {name: circuit.metrics() for name, circuit in self._circuits.items()}
+
+    def dispatch_metrics(self) -> dict:
+        """Return slot usage and per-priority counters from :attr:`dispatcher`."""
+        return self.dispatcher.metrics()
+
+    def add_circuit_listener(self, callback: Callable) -> None:
+        """Call ``callback(endpoint, old_state, new_state)`` on circuit state changes."""
+        if not callable(callback):
+            raise ValueError("Object must be callable.")
+        if callback not in self._circuit_listeners:
+            self._circuit_listeners.append(callback)
 
-    async def send_request(self, endpoint: str, body: object=None, headers: dict=None, platform: str=None, **kwargs):
-        """Sends a request to a given endpoint."""
+    def remove_circuit_listener(self, callback: Callable) -> None:
+        """Remove a circuit state listener."""
+        if callback in self._circuit_listeners:
+            self._circuit_listeners.remove(callback)
+
+    def _notify_circuit_listeners(self, endpoint: str, old_state: CircuitState, new_state: CircuitState) -> None:
+        for callback in self._circuit_listeners:
+            callback(endpoint, old_state, new_state)
+
+    def clear_response_cache(self) -> None:
+        """Drop every cached GET response kept for stale serving."""
+        self._response_cache.clear()
+
+    def _cache_response(self, url: str, resp: ApiResponse) -> None:
+        """Keep a successful GET response for serving while the circuit is open."""
+        self._response_cache[url] = resp
+        self._response_cache.move_to_end(url)
+        while len(self._response_cache) > CIRCUIT_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    async def send_request(
+            self,
+            endpoint: str,
+            body: object=None,
+            headers: dict=None,
+            platform: str=None,
+            priority: RequestPriority=None,
+            **kwargs) -> ApiResponse:
+        """Sends a request to a given endpoint.
+
+        ``priority`` selects the dispatch lane; by default writes are ``HIGH``
+        and reads are ``NORMAL``. The result is an
+        :class:`~pyfamilysafety.response.ApiResponse`, read like a dict with
+        ``status``, ``text``, ``json``, ``headers`` and ``stale`` keys.
+        """
         _LOGGER.debug("Sending request to %s", endpoint)
-        # Get the endpoint from the endpoints map
-        e_point = ENDPOINTS.get(endpoint, None)
+        # Get the endpoint from the precompiled registry
+        e_point = ENDPOINT_REGISTRY.get(endpoint, None)
         if e_point is None:
             raise ValueError("Endpoint does not exist")
+        # format the URL using the kwargs
+        url = e_point.build_url(**kwargs)
+        _LOGGER.debug("Built URL %s", url)
+
+        if priority is None:
+            priority = RequestPriority.NORMAL if e_point.method == "GET" else RequestPriority.HIGH
+        cacheable = e_point.method == "GET" and priority != RequestPriority.BULK and self.serve_stale
+
+        circuit = self.get_circuit(endpoint)
+        if not circuit.allow_request():
+            cached = self._response_cache.get(url) if cacheable else None
+            if cached is None:
+                raise CircuitOpen(endpoint, circuit.retry_in)
+            _LOGGER.debug("Circuit for %s is open, serving cached response", endpoint)
+            circuit.record_stale()
+            return cached.as_stale()
+
+        try:
+            async with self.dispatcher.slot(priority):
+                resp = await asyncio.wait_for(
+                    self._send(e_point, url, body, headers, platform), timeout=self.request_timeout)
+        except (asyncio.TimeoutError, *self._auth.transport.errors):
+            circuit.record_failure()
+            raise
+        except HttpException as err:
+            if isinstance(err, AggregatorException) or (len(err.args) > 1 and err.args[1] >= 500):
+                circuit.record_failure()
+            else:
+                # the service answered, so it is reachable
+                circuit.record_success()
+            raise
+        except BaseException:
+            circuit.record_cancelled()
+            raise
+        circuit.record_success()
+        if cacheable:
+            self._cache_response(url, resp)
+        return resp
+
+    async def _send(self, e_point, url: str, body: object, headers: dict, platform: str) -> ApiResponse:
+        """Send a single HTTP request through the authenticator's transport."""
         # refresh the token if it has expired.
         if self._auth.access_token_expired:
             _LOGGER.debug("Token refresh required before continuing")
             await self._auth.perform_refresh()
 
-        if headers is None:
-            headers = {}
+        if headers:
+            headers = {**headers, **STATIC_HEADERS}
+        else:
+            headers = STATIC_HEADERS.copy()
         headers["Authorization"] = self._auth.access_token
-        headers["User-Agent"] = USER_AGENT
-        headers["Content-Type"] = "application/json"
         if platform is not None:
             headers["Plat-Info"] = platform
 
-        # format the URL using the kwargs
-        url = e_point.get("url")
-        if "{BASE_URL" in url:
-            url = url.format(BASE_URL=BASE_URL, **kwargs)
-        else:
-            url = url.format(**kwargs)
-        _LOGGER.debug("Built URL %s", url)
         # now send the HTTP request
-        resp: dict = {
-            "status": 0,
-            "text": "",
-            "json": "",
-            "headers": ""
-        }
-        async with self._auth.client_session.request(
-            method=e_point.get("method"),
+        resp = await self._auth.transport.request(
+            method=e_point.method,
             url=url,
-            json=body,
-            headers=headers
-        ) as response:
-            _LOGGER.debug("Request to %s status code %s", url, response.status)
-            if _check_http_success(response.status):
-                resp["status"] = response.status
-                if response.status != 204:
-                    resp["text"] = await response.text()
-                    try:
-                        resp["json"] = await response.json()
-                    except aiohttp.client_exceptions.ContentTypeError:
-                        _LOGGER.debug("Unable to parse JSON response - invalid content type.")
-                resp["headers"] = response.headers
-            else:
-                text = await response.text()
-                if response.status == 500 and AGGREGATOR_ERROR in text:
-                    raise AggregatorException()
-                if response.status == 401:
-                    raise Unauthorized()
-                if response.status == 403:
-                    raise RequestDenied(text)
+            headers=headers,
+            json=body
+        )
+        _LOGGER.debug("Request to %s status code %s", url, resp.status)
+        if not _check_http_success(resp.status):
+            text = resp.text
+            if resp.status == 500 and AGGREGATOR_ERROR in text:
+                raise AggregatorException()
+            if resp.status == 401:
+                raise Unauthorized()
+            if resp.status == 403:
+                raise RequestDenied(text)
 
-                raise HttpException("HTTP Error", response.status, text)
+            raise HttpException("HTTP Error", resp.status, text)
 
-        # now return the resp dict
         return resp
 
     async def async_get_accounts(self):
@@ -104,7 +217,8 @@ class FamilySafetyAPI:
             user_id,
             begin_time,
             end_time,
-            platform
+            platform,
+            priority: RequestPriority=None
         ):
         """Retrieve data from endpoint get_user_app_screentime_usage."""
         return await self.send_request(
@@ -112,6 +226,7 @@ class FamilySafetyAPI:
             headers={
                 "Plat-Info": platform
             },
+            priority=priority,
             USER_ID=user_id,
             BEGIN_TIME=begin_time,
             END_TIME=end_time
@@ -123,7 +238,8 @@ class FamilySafetyAPI:
             begin_time,
             end_time,
             device_count,
-            platform
+            platform,
+            priority: RequestPriority=None
         ):
         """Retrieve data from endpoint get_user_device_screentime_usage."""
         return await self.send_request(
@@ -131,6 +247,7 @@ class FamilySafetyAPI:
             headers={
                 "Plat-Info": platform
             },
+            priority=priority,
             USER_ID=user_id,
             BEGIN_TIME=begin_time,
             END_TIME=end_time,
@@ -233,3 +350,8 @@ class FamilySafetyAPI:
         calling this directly.
         """
         return await self.send_request("update_schedule", USER_ID=user_id, body=body)
+
+# generate async_<endpoint> methods for endpoints without a hand-written wrapper
+for _endpoint in ENDPOINT_REGISTRY.values():
+    if not hasattr(FamilySafetyAPI, f"async_{_endpoint.name}"):
+        setattr(FamilySafetyAPI, f"async_{_endpoint.name}", build_request_method(_endpoint))
@@ -12,6 +12,16 @@ def get_platform(app_id: str):
     if app_id.startswith("a:"):
         return "MOBILE"
 
+# appActivity keys read by Application and is_blocked
+APP_ACTIVITY_FIELDS = ("appId", "displayName", "iconUrl", "usage", "policy", "blockState", "isLegacyBlocked")
+
+def is_blocked(app: dict) -> bool:
+    """Return if an ``appActivity`` entry is blocked."""
+    return (app["blockState"] == "Blocked") or (
+        app["isLegacyBlocked"]) or (
+            app["blockState"] == "BlockedAlways"
+        )
+
 class Application:
     """An application from the member's app activity report.
 
@@ -86,6 +96,15 @@ class Application:
         )
         self.blocked = False
 
+    def read_activity(self, app: dict):
+        """Updates the data from a single ``appActivity`` entry."""
+        self.app_id = app["appId"]
+        self.name = app["displayName"]
+        self.icon = app["iconUrl"]
+        self._usage = app["usage"]
+        self.policy = app["policy"]
+        self.blocked = is_blocked(app)
+
     @classmethod
     def from_app_activity_report(cls, raw_response: dict, api, user_id) -> list['Application']:
         """Converts the activity report into a list of applications."""
@@ -94,15 +113,7 @@ class Application:
             apps = raw_response.get("appActivity")
             for app in apps:
                 parsed = cls(api, user_id)
-                parsed.app_id = app["appId"]
-                parsed.name = app["displayName"]
-                parsed.icon = app["iconUrl"]
-                parsed._usage = app["usage"]
-                parsed.policy = app["policy"]
-                parsed.blocked = (app["blockState"] == "Blocked") or (
-                    app["isLegacyBlocked"]) or (
-                        app["blockState"] == "BlockedAlways"
-                    )
+                parsed.read_activity(app)
                 parsed_apps.append(parsed)
         else:
             raise ValueError("Missing appActivity in JSON response.")
@@ -116,3 +127,95 @@ class Application:
             Usage in **minutes** (converted from milliseconds in the API).
         """
         return (self._usage/1000)/60
+
+class AppActivityReport:
+    """A lazy view over the member's app activity report.
+
+    Keeps the decoded ``appActivity`` entries and only builds an
+    :class:`Application` the first time it is requested by ID. Usage and
+    blocked state can be read for every app without creating objects.
+    Applications are kept between reports, so objects handed out earlier stay
+    current after :meth:`read_report`. Apps missing from a new report are
+    dropped, and :meth:`get_application` raises ``IndexError`` for them.
+    """
+
+    def __init__(self, api: FamilySafetyAPI, user_id) -> None:
+        self._api: FamilySafetyAPI = api
+        self._user_id = user_id
+        self._entries: list[dict] = []
+        self._index: dict[str, int] = {}
+        self._applications: dict[str, Application] = {}
+
+    def read_report(self, raw_response: dict, compact: bool = False):
+        """Replace the report data, refreshing applications already created.
+
+        Args:
+            raw_response: The ``get_user_app_screentime_usage`` JSON.
+            compact: Copy only :data:`APP_ACTIVITY_FIELDS` from each entry so
+                the rest of the report can be released.
+        """
+        if "appActivity" not in raw_response.keys():
+            raise ValueError("Missing appActivity in JSON response.")
+        self._entries = raw_response.get("appActivity")
+        if compact:
+            self._entries = [{key: app.get(key) for key in APP_ACTIVITY_FIELDS} for app in self._entries]
+        self._index = {app["appId"]: i for i, app in enumerate(self._entries)}
+        self._applications = {
+            app_id: application for app_id, application in self._applications.items() if app_id in self._index
+        }
+        for app_id, application in self._applications.items():
+            application.read_activity(self._entries[self._index[app_id]])
+
+    def clear(self) -> None:
+        """Drop the report and every application created from it."""
+        self._entries = []
+        self._index = {}
+        self._applications = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, app_id) -> bool:
+        return app_id in self._index
+
+    @property
+    def app_ids(self) -> list[str]:
+        """IDs of all apps in the report."""
+        return list(self._index)
+
+    def usage(self, app_id: str) -> float:
+        """Return usage of an app in **minutes**."""
+        return (self._entries[self._index[app_id]]["usage"]/1000)/60
+
+    def blocked(self, app_id: str) -> bool:
+        """Return if an app is currently blocked."""
+        return is_blocked(self._entries[self._index[app_id]])
+
+    def items(self):
+        """Iterate over ``(app_id, usage, blocked)`` tuples, usage in **minutes**."""
+        for app in self._entries:
+            yield app["appId"], (app["usage"]/1000)/60, is_blocked(app)
+
+    @property
+    def total_usage(self) -> float:
+        """Combined usage of all apps in **minutes**."""
+        return (sum(app["usage"] for app in self._entries)/1000)/60
+
+    def get_application(self, app_id: str) -> Application:
+        """Return the application for an ID, creating it on first access.
+
+        Raises:
+            IndexError: If the app is not in the report.
+        """
+        application = self._applications.get(app_id)
+        if application is None:
+            if app_id not in self._index:
+                raise IndexError("Application not found")
+            application = Application(self._api, self._user_id)
+            application.read_activity(self._entries[self._index[app_id]])
+            self._applications[app_id] = application
+        return application
+
+    def applications(self) -> list[Application]:
+        """Return every application in the report, creating any not yet built."""
+        return [self.get_application(app_id) for app_id in self._index]
@@ -9,6 +9,8 @@ from urllib.parse import parse_qs, urlparse
 
 import aiohttp
 from pyfamilysafety.exceptions import Unauthorized
+from pyfamilysafety.response import ApiResponse
+from pyfamilysafety.transport import AiohttpTransport, Transport
 
 from .const import (
     TOKEN_ENDPOINT,
@@ -21,28 +23,55 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 class Authenticator:
-    """The base authenticator class."""
+    """The base authenticator class.
+
+    Attributes:
+        transport: The :class:`~pyfamilysafety.transport.Transport` used for
+            token requests and by :class:`~pyfamilysafety.api.FamilySafetyAPI`.
+    """
 
     def __init__(
             self,
-            client_session: aiohttp.ClientSession = None
+            client_session: aiohttp.ClientSession = None,
+            transport: Transport = None
         ) -> None:
-        """init the class."""
+        """init the class.
+
+        ``client_session`` is used to build the default
+        :class:`~pyfamilysafety.transport.AiohttpTransport` and is ignored
+        when a ``transport`` is given.
+        """
         _LOGGER.debug(">> Init authenticator.")
         self.expires: datetime = None
         self.refresh_token: str = None
         self._access_token: str = None
+        self._access_token_header: tuple[str, str] = ("", "")
         self.user_id: str = None
         self._ppft: str = None
         self._login_lock: asyncio.Lock = asyncio.Lock()
-        if client_session is None:
-            client_session = aiohttp.ClientSession()
-        self.client_session: aiohttp.ClientSession = client_session
+        if transport is None:
+            transport = AiohttpTransport(client_session)
+        self.transport: Transport = transport
+
+    @property
+    def client_session(self) -> aiohttp.ClientSession:
+        """The aiohttp session, or ``None`` with a non-aiohttp transport."""
+        return getattr(self.transport, "client_session", None)
+
+    async def close(self) -> None:
+        """Close the transport's connections if it created them."""
+        await self.transport.close()
 
     @property
     def access_token(self) -> str:
         """Returns the access token."""
-        return f"MSAuth1.0 usertoken=\"{self._access_token}\", type=\"MSACT\""
+        # only rebuild the header value when the token changes
+        if self._access_token_header[0] != self._access_token:
+            self._access_token_header = (
+                self._access_token,
+                f"MSAuth1.0 usertoken=\"{self._access_token}\", type=\"MSACT\""
+            )
+        return self._access_token_header[1]
 
     @property
     def access_token_expired(self) -> bool:
@@ -54,17 +83,35 @@ class Authenticator:
         cls,
         token: str,
         use_refresh_token: bool=False,
-        client_session: aiohttp.ClientSession | None = None) -> 'Authenticator':
-        """Creates and starts a Microsoft auth session without retaining the username and password."""
-        auth = cls(client_session=client_session)
+        client_session: aiohttp.ClientSession | None = None,
+        prewarm_connections: bool = True,
+        transport: Transport | None = None) -> 'Authenticator':
+        """Creates and starts a Microsoft auth session without retaining the username and password.
+
+        While logging in, a connection to the aggregator is opened concurrently
+        unless ``prewarm_connections`` is ``False``. Pass ``transport`` to send
+        requests with something other than aiohttp.
+        """
+        auth = cls(client_session=client_session, transport=transport)
         if use_refresh_token:
             auth.refresh_token = token
-            await auth.perform_refresh()
-            return auth
+            login = auth.perform_refresh()
         else:
             redir_parsed = auth._parse_response_token(token)
-            await auth.perform_login(redir_parsed["code"])
-            return auth
+            login = auth.perform_login(redir_parsed["code"])
+        warming = asyncio.ensure_future(auth.transport.prewarm()) if prewarm_connections else None
+        try:
+            await login
+            if warming is not None:
+                await warming
+        except BaseException:
+            if warming is not None:
+                # stop the prewarm before its transport is closed
+                warming.cancel()
+                await asyncio.gather(warming, return_exceptions=True)
+            await auth.close()
+            raise
+        return auth
 
     def _parse_response_token(self, redirect_url: str) -> dict:
         """Parses a redirect_url."""
@@ -80,14 +127,8 @@ class Authenticator:
         except Exception as exc:
             raise ValueError("Invalid URL provided.") from exc
 
-    async def _request_handler(self, method, url, body=None, headers=None, data=None):
+    async def _request_handler(self, method, url, body=None, headers=None, data=None) -> ApiResponse:
         """Send a HTTP request"""
-        response: dict = {
-            "status": 0,
-            "text": "",
-            "json": "",
-            "headers": ""
-        }
         if not headers:
             headers = {}
         headers = {
@@ -95,18 +136,13 @@ class Authenticator:
             "user-agent": USER_AGENT,
             "X-Requested-With": "com.microsoft.familysafety"
         }
-        async with self.client_session.request(
+        return await self.transport.request(
             method=method,
             url=url,
-            json=body,
             headers=headers,
+            json=body,
             data=data
-        ) as resp:
-            response["status"] = resp.status
-            response["text"] = await resp.text()
-            response["json"] = await resp.json()
-            response["headers"] = resp.headers
-        return response
+        )
 
     async def perform_login(self, auth_code):
         """Performs login from the username and password."""
@@ -116,12 +152,13 @@ class Authenticator:
             return
         async with self._login_lock:
             _LOGGER.debug(">> Performing authenticator login")
-            form = aiohttp.FormData()
-            form.add_field("client_id", CLIENT_ID)
-            form.add_field("code", auth_code)
-            form.add_field("grant_type", "authorization_code")
-            form.add_field("redirect_uri", REDIRECT_URL)
-            form.add_field("scope", SCOPE)
+            form = {
+                "client_id": CLIENT_ID,
+                "code": auth_code,
+                "grant_type": "authorization_code",
+                "redirect_uri": REDIRECT_URL,
+                "scope": SCOPE,
+            }
             tokens = await self._request_handler(
                 method="POST",
                 url=TOKEN_ENDPOINT,
@@ -144,11 +181,12 @@ class Authenticator:
             return
         async with self._login_lock:
             _LOGGER.debug(">> Performing authenticator refresh")
-            form = aiohttp.FormData()
-            form.add_field("client_id", CLIENT_ID)
-            form.add_field("refresh_token", self.refresh_token)
-            form.add_field("grant_type", "refresh_token")
-            form.add_field("scope", SCOPE)
+            form = {
+                "client_id": CLIENT_ID,
+                "refresh_token": self.refresh_token,
+                "grant_type": "refresh_token",
+                "scope": SCOPE,
+            }
             tokens = await self._request_handler(
                 method="POST",
                 url=TOKEN_ENDPOINT,
@@ -0,0 +1,112 @@
+"""Per-endpoint circuit breakers for aggregator outages."""
+
+import logging
+import time
+from typing import Callable
+
+from .const import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RECOVERY_TIMEOUT
+from .enum import CircuitState
+
+_LOGGER = logging.getLogger(__name__)
+
+class CircuitBreaker:
+    """Tracks failures of one endpoint and decides if requests may be sent.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are rejected. Once ``recovery_timeout`` seconds have passed the
+    circuit is half-open: one trial request is let through, closing the
+    circuit on success or opening it again on failure.
+
+    Attributes:
+        name: Endpoint name.
+        state: Current :class:`~pyfamilysafety.enum.CircuitState`.
+        failure_threshold: Consecutive failures that open the circuit.
+        recovery_timeout: Seconds to stay open before a trial request.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout: float = CIRCUIT_RECOVERY_TIMEOUT,
+            on_state_change: Callable = None) -> None:
+        self.name = name
+        self.state = CircuitState.CLOSED
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._on_state_change = on_state_change
+        self._consecutive_failures = 0
+        self._opened_at: float = None
+        self._trial_in_flight = False
+        self._counters = {
+            "successes": 0,
+            "failures": 0,
+            "rejected": 0,
+            "stale_served": 0,
+            "opened": 0,
+        }
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until a trial request is allowed, ``0`` unless open."""
+        if self.state != CircuitState.OPEN:
+            return 0
+        return max(0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return if a request may be sent, moving an expired open circuit to half-open."""
+        if self.state == CircuitState.OPEN and self.retry_in == 0:
+            self._transition(CircuitState.HALF_OPEN)
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        self._counters["rejected"] += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a response from the service, closing the circuit."""
+        self._counters["successes"] += 1
+        self._consecutive_failures = 0
+        self._trial_in_flight = False
+        if self.state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        self._counters["failures"] += 1
+        self._consecutive_failures += 1
+        self._trial_in_flight = False
+        if self.state == CircuitState.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            if self.state != CircuitState.OPEN:
+                self._counters["opened"] += 1
+                self._transition(CircuitState.OPEN)
+
+    def record_cancelled(self) -> None:
+        """Release a trial request that was cancelled before it completed."""
+        self._trial_in_flight = False
+
+    def record_stale(self) -> None:
+        """Record that a cached response was served instead of a request."""
+        self._counters["stale_served"] += 1
+
+    def metrics(self) -> dict:
+        """Return the state and counters as a JSON serializable dict."""
+        return {
+            "state": str(self.state),
+            "consecutive_failures": self._consecutive_failures,
+            "retry_in": self.retry_in,
+            **self._counters,
+        }
+
+    def _transition(self, state: CircuitState) -> None:
+        old_state, self.state = self.state, state
+        if state == CircuitState.OPEN:
+            _LOGGER.warning("Circuit for %s opened after %s failure(s), retrying in %ss",
+                            self.name, self._consecutive_failures, self.recovery_timeout)
+        else:
+            _LOGGER.info("Circuit for %s is now %s", self.name, state)
+        if self._on_state_change is not None:
+            self._on_state_change(self.name, old_state, state)
@@ -0,0 +1,191 @@
+"""The ``pyfamilysafety`` command line tool."""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+from .family_safety import FamilySafety
+from .authenticator import Authenticator
+from .const import REFRESH_MIN_INTERVAL, REFRESH_MAX_INTERVAL
+from .export import (
+    KINDS,
+    USAGE,
+    ACTIVITY,
+    PENDING,
+    CSVWriter,
+    NDJSONWriter,
+    export_partitions,
+    iter_records,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+TOKEN_FILE_ENV = "PYFAMILYSAFETY_TOKEN_FILE"
+
+def default_token_file() -> Path:
+    """Return the token file path, honouring ``PYFAMILYSAFETY_TOKEN_FILE`` and ``XDG_CONFIG_HOME``."""
+    if os.environ.get(TOKEN_FILE_ENV):
+        return Path(os.environ[TOKEN_FILE_ENV])
+    config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(config_home) / "pyfamilysafety" / "token"
+
+def load_token(path: Path) -> str:
+    """Read a stored refresh token."""
+    try:
+        return path.read_text(encoding="utf8").strip()
+    except FileNotFoundError as err:
+        raise SystemExit(f"No stored token at {path}, run 'pyfamilysafety login' first.") from err
+
+def save_token(path: Path, token: str) -> None:
+    """Store a refresh token, readable only by the current user."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf8") as token_file:
+        token_file.write(token)
+    os.replace(tmp_path, path)
+
+async def _login(args) -> int:
+    """Exchange an OAuth redirect URL for a refresh token and store it."""
+    redirect_url = args.url or input("Paste OAuth redirect URL: ")
+    auth = await Authenticator.create(token=redirect_url)
+    try:
+        save_token(args.token_file, auth.refresh_token)
+    finally:
+        await auth.close()
+    print(f"Logged in, token saved to {args.token_file}", file=sys.stderr)
+    return 0
+
+async def _connect(args) -> FamilySafety:
+    """Log in with the stored refresh token."""
+    auth = await Authenticator.create(token=load_token(args.token_file), use_refresh_token=True)
+    return FamilySafety(auth)
+
+async def _close(args, family_safety: FamilySafety) -> None:
+    """Store the latest refresh token and close the client."""
+    try:
+        save_token(args.token_file, family_safety._auth.refresh_token)
+    finally:
+        await family_safety.close()
+
+async def _watch(args) -> int:
+    """Print change events as NDJSON until interrupted."""
+    family_safety = await _connect(args)
+    family_safety.experimental = args.pending
+    try:
+        await family_safety.update()
+        family_safety.start_refresher(args.min_interval, args.max_interval)
+        async for event in family_safety.events():
+            print(json.dumps(event.to_dict(), default=str), flush=True)
+    finally:
+        await _close(args, family_safety)
+    return 0
+
+def _select_accounts(family_safety: FamilySafety, user_ids: list[str]) -> list:
+    """Return the accounts to export, all of them when no IDs are given."""
+    if not user_ids:
+        return family_safety.accounts
+    return [x for x in family_safety.accounts if x.user_id in user_ids]
+
+async def _export(args) -> int:
+    """Write usage, activity and pending request records for a date range."""
+    kinds = args.kind or [USAGE, ACTIVITY]
+    if args.output_dir is None and args.format == "parquet":
+        raise SystemExit("Parquet exports require --output-dir.")
+    if args.output_dir is not None and PENDING in kinds:
+        raise SystemExit("Pending requests cannot be exported with --output-dir.")
+    family_safety = await _connect(args)
+    family_safety.experimental = PENDING in kinds
+    if args.output_dir is not None:
+        try:
+            await family_safety.update()
+            days = await export_partitions(
+                _select_accounts(family_safety, args.user),
+                args.start,
+                args.end or date.today(),
+                args.output_dir,
+                args.format,
+                kinds,
+                args.concurrency)
+            print(f"Exported {len(days)} day(s) to {args.output_dir}", file=sys.stderr)
+        finally:
+            await _close(args, family_safety)
+        return 0
+    output = open(args.output, "w", encoding="utf8", newline="") if args.output else sys.stdout
+    try:
+        await family_safety.update()
+        accounts = _select_accounts(family_safety, args.user)
+        writer = CSVWriter(output) if args.format == "csv" else NDJSONWriter(output)
+        async for record in iter_records(
+                accounts,
+                args.start,
+                args.end or date.today(),
+                kinds,
+                family_safety.pending_requests,
+                args.concurrency):
+            writer.write(record)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        await _close(args, family_safety)
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="pyfamilysafety", description="Microsoft Family Safety command line client.")
+    parser.add_argument(
+        "--token-file", type=Path, default=None,
+        help=f"Refresh token file (default: ${TOKEN_FILE_ENV} or ~/.config/pyfamilysafety/token).")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    login = commands.add_parser("login", help="Log in and store a refresh token.")
+    login.add_argument("--url", help="OAuth redirect URL; prompted for if omitted.")
+    login.set_defaults(func=_login)
+
+    watch = commands.add_parser("watch", help="Stream change events as NDJSON.")
+    watch.add_argument("--pending", action="store_true", help="Include pending request events.")
+    watch.add_argument("--min-interval", type=float, default=REFRESH_MIN_INTERVAL)
+    watch.add_argument("--max-interval", type=float, default=REFRESH_MAX_INTERVAL)
+    watch.set_defaults(func=_watch)
+
+    export = commands.add_parser("export", help="Export history for a date range.")
+    export.add_argument("--start", type=date.fromisoformat, required=True, help="First day, YYYY-MM-DD.")
+    export.add_argument("--end", type=date.fromisoformat, help="Last day, YYYY-MM-DD (default: today).")
+    export.add_argument(
+        "--kind", action="append", choices=KINDS,
+        help="Record kind to export, may be repeated (default: usage and activity).")
+    export.add_argument("--user", action="append", help="Only export this member ID, may be repeated.")
+    export.add_argument("--format", choices=["ndjson", "csv", "parquet"], default="ndjson")
+    output = export.add_mutually_exclusive_group()
+    output.add_argument("-o", "--output", help="Output file (default: stdout).")
+    output.add_argument(
+        "--output-dir", type=Path,
+        help="Write one file per kind and day here, skipping days already exported.")
+    export.add_argument("--concurrency", type=int, default=4, help="Days fetched at once per member.")
+    export.set_defaults(func=_export)
+    return parser
+
+def main(argv: list[str] = None) -> int:
+    """Run the command line tool."""
+    args = build_parser().parse_args(argv)
+    if args.token_file is None:
+        args.token_file = default_token_file()
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(asctime)s %(name)s %(levelname)s: %(message)s",
+        stream=sys.stderr,
+    )
+    try:
+        return asyncio.run(args.func(args))
+    except KeyboardInterrupt:
+        return 130
+
+if __name__ == "__main__":
+    sys.exit(main())
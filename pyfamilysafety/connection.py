@@ -0,0 +1,66 @@
+"""Shared HTTP connection handling for login.live.com and the aggregator."""
+
+import asyncio
+import logging
+import ssl
+
+import aiohttp
+
+from .const import (
+    BASE_URL,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_CONNECTION_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_TOTAL_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_SSL_CONTEXT: ssl.SSLContext = None
+
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the SSL context shared by every session, so TLS sessions can be reused."""
+    global _SSL_CONTEXT  # pylint: disable=global-statement
+    if _SSL_CONTEXT is None:
+        _SSL_CONTEXT = ssl.create_default_context()
+    return _SSL_CONTEXT
+
+def create_client_session() -> aiohttp.ClientSession:
+    """Create a client session tuned for the Family Safety APIs.
+
+    Connections are kept alive between polls, limited per host, and DNS
+    lookups are cached. Connecting and whole requests are time limited, so a
+    stalled response cannot hold up other requests forever. Must be called
+    from a running event loop.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        ssl=get_ssl_context(),
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=HTTP_TOTAL_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    )
+
+async def prewarm(client_session: aiohttp.ClientSession, urls: list[str] = None) -> None:
+    """Open connections to the given hosts concurrently so later requests skip the handshake.
+
+    Failures are logged and ignored.
+
+    Args:
+        client_session: Session whose pool should be warmed.
+        urls: URLs to connect to; defaults to the aggregator base URL.
+    """
+    async def _connect(url: str):
+        try:
+            async with client_session.head(url, allow_redirects=False) as response:
+                await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Unable to pre-warm connection to %s: %s", url, err)
+
+    await asyncio.gather(*(_connect(url) for url in urls or [BASE_URL]))
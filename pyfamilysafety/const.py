@@ -7,6 +7,52 @@ USER_AGENT = f"Family Safety-prod/({APP_VERSION}) Android/33 google/Pixel 4 XL"
 
 AGGREGATOR_ERROR = "Something went wrong in the Aggregator service"
 
+# shared HTTP connection pool settings
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTION_LIMIT_PER_HOST = 20
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 60
+HTTP_CONNECT_TIMEOUT = 10
+# seconds allowed for a whole request, including reading the response
+HTTP_TOTAL_TIMEOUT = 300
+
+# aggregator requests in flight at once, and how many of those slots only
+# high priority requests may use
+DISPATCH_LIMIT = HTTP_CONNECTION_LIMIT_PER_HOST
+DISPATCH_RESERVED_HIGH_PRIORITY = 2
+
+# consecutive failures that open an endpoint's circuit breaker
+CIRCUIT_FAILURE_THRESHOLD = 3
+# seconds an open circuit waits before allowing a trial request
+CIRCUIT_RECOVERY_TIMEOUT = 60
+# GET responses kept for serving while a circuit is open
+CIRCUIT_CACHE_SIZE = 256
+
+# seconds allowed for a single account subrequest and for a whole account update
+DEFAULT_REQUEST_TIMEOUT = 10
+DEFAULT_UPDATE_TIMEOUT = 30
+
+# background refresher intervals in seconds
+REFRESH_MIN_INTERVAL = 15
+REFRESH_MAX_INTERVAL = 300
+REFRESH_BACKOFF_MAX = 900
+REFRESH_GROWTH_FACTOR = 1.5
+
+# change events buffered per events() iterator before the oldest are dropped
+EVENT_QUEUE_SIZE = 1000
+
+# seconds between spending balance refreshes
+SPENDING_REFRESH_INTERVAL = 3600
+
+# maximum web restriction patch operations sent in a single request
+WEB_RESTRICTIONS_BATCH_SIZE = 100
+
+# rows buffered by export writers before a batch is written
+EXPORT_BATCH_SIZE = 10000
+
+# intraday usage samples kept per account and device (24 hours at 5 minute polls)
+USAGE_HISTORY_SIZE = 288
+
 ENDPOINTS = {
     "get_accounts": {
         "url": "{BASE_URL}/v2/roster",
@@ -0,0 +1,54 @@
+"""Cached content restrictions for a family member."""
+
+# payload keys used by the content restrictions API
+AGE_RATING_KEY = "ageRating"
+APP_EXCEPTIONS_KEY = "appExceptions"
+
+class ContentRestrictions:
+    """A local view of the member's content restrictions.
+
+    Wraps the raw ``get_user_content_restrictions`` payload with an index of
+    app exceptions by app ID. It is discarded by
+    :meth:`pyfamilysafety.account.Account.update_content_restrictions`, so it
+    always reflects what the API last returned.
+
+    Attributes:
+        raw: The content restrictions JSON as last returned by the API.
+    """
+
+    def __init__(self, raw_response: dict) -> None:
+        self.raw = raw_response
+        self._apps: dict[str, dict] = {
+            exception["appId"]: exception
+            for exception in raw_response.get(APP_EXCEPTIONS_KEY) or []
+        }
+
+    @property
+    def age_rating(self):
+        """The maximum content age rating."""
+        return self.raw.get(AGE_RATING_KEY)
+
+    def get_app_exception(self, app_id: str) -> dict:
+        """Return the exception for an app, or ``None`` if there is none."""
+        return self._apps.get(app_id)
+
+    def is_app_allowed(self, app_id: str) -> bool:
+        """Return if an app is excepted as allowed (``True``) or blocked (``False``).
+
+        Returns:
+            ``None`` if the app has no exception.
+        """
+        exception = self._apps.get(app_id)
+        if exception is None:
+            return None
+        return exception.get("allowed")
+
+    @property
+    def allowed_apps(self) -> list[str]:
+        """IDs of apps with an allow exception."""
+        return [app_id for app_id, x in self._apps.items() if x.get("allowed")]
+
+    @property
+    def blocked_apps(self) -> list[str]:
+        """IDs of apps with a block exception."""
+        return [app_id for app_id, x in self._apps.items() if not x.get("allowed")]
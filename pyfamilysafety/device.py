@@ -35,6 +35,8 @@ class Device:
 
     def read_screentime_report(self, screentime_report: dict):
         """Processes a screentime report."""
+        if screentime_report is None:
+            return
         usage = screentime_report.get("deviceUsageAggregates")
         device_usage = [x for x in usage.get("deviceAggregates") if x["deviceId"] == self.device_id]
         if len(device_usage) > 0:
@@ -0,0 +1,101 @@
+"""Prioritised dispatch of API requests."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+
+from .const import DISPATCH_LIMIT, DISPATCH_RESERVED_HIGH_PRIORITY
+from .enum import RequestPriority
+
+class PriorityDispatcher:
+    """Limits requests in flight and hands free slots out by priority.
+
+    Waiting requests are started in :class:`~pyfamilysafety.enum.RequestPriority`
+    order, first come first served within a lane. ``reserved`` of the
+    ``limit`` slots can only be used by ``HIGH`` requests, so an interactive
+    write starts straight away even while a large refresh or export fills
+    every other slot.
+    """
+
+    def __init__(self, limit: int = DISPATCH_LIMIT, reserved: int = DISPATCH_RESERVED_HIGH_PRIORITY) -> None:
+        if limit < 1 or not 0 <= reserved < limit:
+            raise ValueError("limit must be positive and reserved must be less than limit.")
+        self.limit = limit
+        self.reserved = reserved
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._lanes = {
+            priority: {"requests": 0, "waiting": 0, "max_wait": 0.0}
+            for priority in RequestPriority
+        }
+
+    @property
+    def active(self) -> int:
+        """Requests currently holding a slot."""
+        return self._active
+
+    def _has_capacity(self, priority: RequestPriority) -> bool:
+        if priority == RequestPriority.HIGH:
+            return self._active < self.limit
+        return self._active < self.limit - self.reserved
+
+    def _first_waiter(self):
+        """Return the highest priority waiter still waiting, dropping cancelled ones."""
+        while self._waiters and self._waiters[0][2].cancelled():
+            heapq.heappop(self._waiters)
+        return self._waiters[0] if self._waiters else None
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.NORMAL) -> None:
+        """Wait for a slot in the given lane."""
+        lane = self._lanes[priority]
+        lane["requests"] += 1
+        first = self._first_waiter()
+        if self._has_capacity(priority) and (first is None or first[0] > priority):
+            self._active += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        lane["waiting"] += 1
+        started = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the slot was granted just before cancellation
+                self.release()
+            raise
+        finally:
+            lane["waiting"] -= 1
+            lane["max_wait"] = max(lane["max_wait"], time.monotonic() - started)
+
+    def release(self) -> None:
+        """Free a slot and start the next waiting request."""
+        self._active -= 1
+        while True:
+            first = self._first_waiter()
+            if first is None or not self._has_capacity(first[0]):
+                return
+            heapq.heappop(self._waiters)
+            self._active += 1
+            first[2].set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority = RequestPriority.NORMAL):
+        """Hold a slot for the duration of the ``async with`` block."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def metrics(self) -> dict:
+        """Return slot usage and per-lane counters, with the longest wait in seconds."""
+        return {
+            "active": self._active,
+            "limit": self.limit,
+            "reserved": self.reserved,
+            "lanes": {str(priority): dict(lane) for priority, lane in self._lanes.items()},
+        }
@@ -0,0 +1,88 @@
+"""Precompiled endpoint registry built from ``const.ENDPOINTS``."""
+
+import inspect
+from string import Formatter
+
+from .const import ENDPOINTS, BASE_URL, USER_AGENT
+from .enum import RequestPriority
+from .response import ApiResponse
+
+# headers sent with every aggregator request, built once
+STATIC_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Content-Type": "application/json",
+}
+
+class Endpoint:
+    """A single aggregator endpoint with its URL template compiled once.
+
+    Attributes:
+        name: Key of the endpoint in ``const.ENDPOINTS``.
+        method: HTTP method.
+        params: Placeholder names the URL requires (``USER_ID``, ``BEGIN_TIME``, ...).
+    """
+
+    def __init__(self, name: str, url: str, method: str) -> None:
+        self.name = name
+        self.method = method
+        self._template = url.replace("{BASE_URL}", BASE_URL)
+        self.params: tuple[str, ...] = tuple(
+            field for _, field, _, _ in Formatter().parse(self._template) if field
+        )
+
+    def build_url(self, **kwargs) -> str:
+        """Return the URL with the given placeholder values filled in.
+
+        Raises:
+            KeyError: If a required placeholder is missing.
+        """
+        if not self.params:
+            return self._template
+        return self._template.format(**kwargs)
+
+ENDPOINT_REGISTRY: dict[str, Endpoint] = {
+    name: Endpoint(name, endpoint["url"], endpoint["method"])
+    for name, endpoint in ENDPOINTS.items()
+}
+
+def build_request_method(endpoint: Endpoint):
+    """Create an ``async_<name>`` coroutine method for an endpoint.
+
+    URL placeholders become lowercase ``str`` parameters, endpoints that are not
+    ``GET`` take a ``body`` and every method accepts keyword-only ``platform``,
+    sent as the ``Plat-Info`` header, and ``priority``, the dispatch lane.
+    """
+    parameters = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    parameters.extend(
+        inspect.Parameter(param.lower(), inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str)
+        for param in endpoint.params
+    )
+    if endpoint.method != "GET":
+        parameters.append(inspect.Parameter("body", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=object))
+    parameters.append(inspect.Parameter(
+        "platform", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=str))
+    parameters.append(inspect.Parameter(
+        "priority", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=RequestPriority))
+    signature = inspect.Signature(parameters, return_annotation=ApiResponse)
+
+    async def method(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        self = bound.arguments.pop("self")
+        return await self.send_request(
+            endpoint.name,
+            body=bound.arguments.pop("body", None),
+            platform=bound.arguments.pop("platform", None),
+            priority=bound.arguments.pop("priority", None),
+            **{name.upper(): value for name, value in bound.arguments.items()}
+        )
+
+    method.__name__ = f"async_{endpoint.name}"
+    method.__qualname__ = f"FamilySafetyAPI.{method.__name__}"
+    method.__signature__ = signature
+    method.__annotations__ = {
+        param.name: param.annotation for param in parameters
+        if param.annotation is not inspect.Parameter.empty
+    }
+    method.__annotations__["return"] = ApiResponse
+    method.__doc__ = f"Send a {endpoint.method} request to endpoint {endpoint.name}."
+    return method
@@ -1,6 +1,6 @@
 """Family Safety enums."""
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 class OverrideTarget(Enum):
     """Platform target for device limits and override actions.
@@ -80,3 +80,78 @@ class DeviceLimitsMode(Enum):
 
     def __str__(self) -> str:
         return self.value
+
+class ChangeEventType(Enum):
+    """Kinds of change reported by :meth:`pyfamilysafety.FamilySafety.events`.
+
+    Attributes:
+        USAGE_CHANGED: Total screen time today changed for an account.
+        DEVICE_USAGE_CHANGED: Screen time today changed for a single device.
+        DEVICE_ADDED: A device appeared on an account.
+        DEVICE_REMOVED: A device is no longer registered to an account.
+        DEVICE_BLOCKED: A device became blocked by a platform override.
+        DEVICE_UNBLOCKED: A device block was removed.
+        APP_ADDED: An application appeared in the activity report.
+        APP_REMOVED: An application is no longer in the activity report.
+        APP_USAGE_CHANGED: Usage of a single application changed.
+        APP_BLOCKED: An application became blocked.
+        APP_UNBLOCKED: An application block was removed.
+        BALANCE_CHANGED: The Microsoft Store allowance balance changed.
+        PENDING_REQUEST_CREATED: A new pending screen-time request was raised.
+        PENDING_REQUEST_RESOLVED: A pending request was approved, denied or expired.
+        CIRCUIT_STATE_CHANGED: An endpoint's circuit breaker changed state; the
+            target is the endpoint name and the values are
+            :class:`CircuitState` strings.
+    """
+    USAGE_CHANGED = "usage_changed"
+    DEVICE_USAGE_CHANGED = "device_usage_changed"
+    DEVICE_ADDED = "device_added"
+    DEVICE_REMOVED = "device_removed"
+    DEVICE_BLOCKED = "device_blocked"
+    DEVICE_UNBLOCKED = "device_unblocked"
+    APP_ADDED = "app_added"
+    APP_REMOVED = "app_removed"
+    APP_USAGE_CHANGED = "app_usage_changed"
+    APP_BLOCKED = "app_blocked"
+    APP_UNBLOCKED = "app_unblocked"
+    BALANCE_CHANGED = "balance_changed"
+    PENDING_REQUEST_CREATED = "pending_request_created"
+    PENDING_REQUEST_RESOLVED = "pending_request_resolved"
+    CIRCUIT_STATE_CHANGED = "circuit_state_changed"
+
+    def __str__(self) -> str:
+        return self.value
+
+class CircuitState(Enum):
+    """State of an endpoint's circuit breaker.
+
+    Attributes:
+        CLOSED: Requests are sent normally.
+        OPEN: Requests fail fast (or are served from cache) until the
+            recovery timeout passes.
+        HALF_OPEN: A single trial request is allowed to test recovery.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __str__(self) -> str:
+        return self.value
+
+class RequestPriority(IntEnum):
+    """Dispatch lane for a request sent through :class:`~pyfamilysafety.api.FamilySafetyAPI`.
+
+    Lower values are dispatched first.
+
+    Attributes:
+        HIGH: Interactive writes such as overrides and pending request
+            approvals. May also use the reserved connection slots.
+        NORMAL: Regular refresh reads.
+        BULK: Historical and export reads.
+    """
+    HIGH = 0
+    NORMAL = 1
+    BULK = 2
+
+    def __str__(self) -> str:
+        return self.name.lower()
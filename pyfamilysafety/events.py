@@ -0,0 +1,118 @@
+"""Change events computed from successive account and pending request snapshots."""
+
+from datetime import datetime
+
+from .account import Account
+from .enum import ChangeEventType
+from .helpers import API_TIMEZONE
+
+class ChangeEvent:
+    """A single change detected between two refreshes.
+
+    Attributes:
+        type: What changed (:class:`~pyfamilysafety.enum.ChangeEventType`).
+        user_id: Member ID the change belongs to.
+        target: Device ID, app ID or pending request ID the change relates to,
+            or ``None`` for account-level changes.
+        old_value: Previous value, or ``None`` for newly created items.
+        new_value: Current value, or ``None`` for removed items.
+        timestamp: UTC time the change was detected.
+    """
+
+    def __init__(
+            self,
+            event_type: ChangeEventType,
+            user_id: str,
+            target: str = None,
+            old_value=None,
+            new_value=None) -> None:
+        self.type = event_type
+        self.user_id = user_id
+        self.target = target
+        self.old_value = old_value
+        self.new_value = new_value
+        self.timestamp = datetime.now(tz=API_TIMEZONE)
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON serializable dict."""
+        return {
+            "type": str(self.type),
+            "user_id": self.user_id,
+            "target": self.target,
+            "old_value": self.old_value,
+            "new_value": self.new_value,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+    def __repr__(self) -> str:
+        return (f"ChangeEvent({self.type}, user_id={self.user_id!r}, target={self.target!r}, "
+                f"{self.old_value!r} -> {self.new_value!r})")
+
+def snapshot_account(account: Account) -> dict:
+    """Capture the comparable state of an account."""
+    return {
+        "usage": account.today_screentime_usage,
+        "devices": {
+            device.device_id: (device.blocked, device.today_time_used)
+            for device in account.devices or []
+        },
+        "apps": {
+            app_id: (blocked, usage)
+            for app_id, usage, blocked in account.app_activity.items()
+        },
+        "balance": (account.account_balance, account.account_currency),
+    }
+
+def snapshot_pending_requests(pending_requests: list[dict]) -> dict:
+    """Capture pending requests keyed by request ID."""
+    return {request["id"]: request for request in pending_requests}
+
+def diff_account(user_id: str, old: dict, new: dict) -> list[ChangeEvent]:
+    """Return the change events between two account snapshots."""
+    events = []
+    if old["usage"] != new["usage"]:
+        events.append(ChangeEvent(ChangeEventType.USAGE_CHANGED, user_id, None, old["usage"], new["usage"]))
+
+    for device_id, (blocked, used) in new["devices"].items():
+        if device_id not in old["devices"]:
+            events.append(ChangeEvent(ChangeEventType.DEVICE_ADDED, user_id, device_id, None, blocked))
+            continue
+        old_blocked, old_used = old["devices"][device_id]
+        if bool(old_blocked) != bool(blocked):
+            events.append(ChangeEvent(
+                ChangeEventType.DEVICE_BLOCKED if blocked else ChangeEventType.DEVICE_UNBLOCKED,
+                user_id, device_id, old_blocked, blocked))
+        if old_used != used:
+            events.append(ChangeEvent(ChangeEventType.DEVICE_USAGE_CHANGED, user_id, device_id, old_used, used))
+    for device_id in old["devices"].keys() - new["devices"].keys():
+        events.append(ChangeEvent(ChangeEventType.DEVICE_REMOVED, user_id, device_id, old["devices"][device_id][0]))
+
+    for app_id, (blocked, usage) in new["apps"].items():
+        if app_id not in old["apps"]:
+            events.append(ChangeEvent(ChangeEventType.APP_ADDED, user_id, app_id, None, blocked))
+            continue
+        old_blocked, old_usage = old["apps"][app_id]
+        if bool(old_blocked) != bool(blocked):
+            events.append(ChangeEvent(
+                ChangeEventType.APP_BLOCKED if blocked else ChangeEventType.APP_UNBLOCKED,
+                user_id, app_id, old_blocked, blocked))
+        if old_usage != usage:
+            events.append(ChangeEvent(ChangeEventType.APP_USAGE_CHANGED, user_id, app_id, old_usage, usage))
+    for app_id in old["apps"].keys() - new["apps"].keys():
+        events.append(ChangeEvent(ChangeEventType.APP_REMOVED, user_id, app_id, old["apps"][app_id][0]))
+
+    if old["balance"] != new["balance"]:
+        events.append(ChangeEvent(ChangeEventType.BALANCE_CHANGED, user_id, None, old["balance"][0], new["balance"][0]))
+    return events
+
+def diff_pending_requests(old: dict, new: dict) -> list[ChangeEvent]:
+    """Return created/resolved events between two pending request snapshots."""
+    events = [
+        ChangeEvent(ChangeEventType.PENDING_REQUEST_CREATED, request["puid"], request_id, None, request)
+        for request_id, request in new.items() if request_id not in old
+    ]
+    events.extend(
+        ChangeEvent(ChangeEventType.PENDING_REQUEST_RESOLVED, request["puid"], request_id, request, None)
+        for request_id, request in old.items() if request_id not in new
+    )
+    return events
@@ -37,3 +37,36 @@ class AggregatorException(HttpException):
 
     def __init__(self) -> None:
         super().__init__("An upstream aggregator error occured.")
+
+class CircuitOpen(AggregatorException):
+    """The endpoint's circuit breaker is open and no cached response is available.
+
+    Raised without sending a request, so it is handled like any other
+    :class:`AggregatorException`.
+
+    Attributes:
+        endpoint: Name of the endpoint.
+        retry_in: Seconds until a trial request will be allowed.
+    """
+
+    def __init__(self, endpoint: str, retry_in: float) -> None:
+        HttpException.__init__(self, f"Circuit for {endpoint} is open, retry in {retry_in:.1f}s.")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+class UpdateFailed(AggregatorException):
+    """Every subrequest of :meth:`pyfamilysafety.account.Account.update` failed.
+
+    Raised when the subrequests errored, timed out or were cancelled at the
+    update deadline, so it is handled like any other
+    :class:`AggregatorException`. The first error is chained as ``__cause__``.
+
+    Attributes:
+        user_id: Member whose update failed.
+        errors: The error for each subrequest.
+    """
+
+    def __init__(self, user_id: str, errors: list[BaseException]) -> None:
+        HttpException.__init__(self, f"Every update subrequest failed for {user_id}.")
+        self.user_id = user_id
+        self.errors = errors
@@ -0,0 +1,430 @@
+"""Stream historical usage, activity and pending requests as flat records."""
+
+import asyncio
+import csv
+import json
+import logging
+import os
+from collections import deque
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, TextIO
+
+from .account import Account
+from .application import get_platform, is_blocked
+from .const import EXPORT_BATCH_SIZE
+from .helpers import localise_datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+_LOGGER = logging.getLogger(__name__)
+
+USAGE = "usage"
+ACTIVITY = "activity"
+PENDING = "pending"
+KINDS = (USAGE, ACTIVITY, PENDING)
+
+# columns written by CSVWriter, covering every record kind
+RECORD_FIELDS = [
+    "kind",
+    "user_id",
+    "date",
+    "device_id",
+    "app_id",
+    "name",
+    "platform",
+    "usage_ms",
+    "blocked",
+    "request_id",
+    "requested_time",
+]
+
+# columns of each record kind, used for per-kind partition files
+KIND_FIELDS = {
+    USAGE: ["kind", "user_id", "date", "device_id", "usage_ms"],
+    ACTIVITY: ["kind", "user_id", "date", "app_id", "name", "platform", "usage_ms", "blocked"],
+    PENDING: ["kind", "user_id", "date", "request_id", "requested_time"],
+}
+
+FILE_EXTENSIONS = {"csv": "csv", "ndjson": "ndjson", "parquet": "parquet"}
+
+def iter_days(start: date, end: date):
+    """Yield every day from ``start`` to ``end`` inclusive."""
+    for offset in range((end - start).days + 1):
+        yield start + timedelta(days=offset)
+
+async def iter_ordered(
+        items,
+        fetch: Callable[..., Awaitable],
+        max_concurrency: int = 4) -> AsyncIterator[tuple]:
+    """Fetch items concurrently, yielding ``(item, result)`` in input order.
+
+    At most ``max_concurrency`` fetches are in flight, so memory stays
+    bounded however many items there are.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+    in_flight = deque()
+    try:
+        for item in items:
+            in_flight.append((item, asyncio.ensure_future(fetch(item))))
+            if len(in_flight) >= max_concurrency:
+                item, task = in_flight.popleft()
+                yield item, await task
+        while in_flight:
+            item, task = in_flight.popleft()
+            yield item, await task
+    finally:
+        for _, task in in_flight:
+            task.cancel()
+
+async def iter_daily_reports(
+        account: Account,
+        start: date,
+        end: date,
+        max_concurrency: int = 4) -> AsyncIterator[tuple[date, dict]]:
+    """Yield ``(day, report)`` for each day, where report is the result of
+    :meth:`~pyfamilysafety.account.Account.get_screentime_usage` for that day."""
+    async def _fetch(day: date) -> dict:
+        return await fetch_daily_report(account, day)
+
+    async for day, report in iter_ordered(iter_days(start, end), _fetch, max_concurrency):
+        yield day, report
+
+async def fetch_daily_report(account: Account, day: date) -> dict:
+    """Fetch the device and app usage reports for one local day."""
+    return await account.get_screentime_usage(
+        start_time=localise_datetime(datetime.combine(day, time(0, 0, 0))),
+        end_time=localise_datetime(datetime.combine(day, time(23, 59, 59))),
+    )
+
+def usage_records(user_id: str, day: date, raw_response: dict):
+    """Yield one ``usage`` record per device in a device screen time report."""
+    usage = (raw_response or {}).get("deviceUsageAggregates") or {}
+    for device in usage.get("deviceAggregates") or []:
+        yield {
+            "kind": USAGE,
+            "user_id": user_id,
+            "date": day.isoformat(),
+            "device_id": device["deviceId"].replace("g:", ""),
+            "usage_ms": int(device.get("timeUsed") or 0),
+        }
+
+def activity_records(user_id: str, day: date, raw_response: dict):
+    """Yield one ``activity`` record per app in an app activity report."""
+    for app in (raw_response or {}).get("appActivity") or []:
+        yield {
+            "kind": ACTIVITY,
+            "user_id": user_id,
+            "date": day.isoformat(),
+            "app_id": app["appId"],
+            "name": app.get("displayName"),
+            "platform": get_platform(app["appId"]),
+            "usage_ms": int(app.get("usage") or 0),
+            "blocked": is_blocked(app),
+        }
+
+def pending_records(pending_requests: list[dict], start: date, end: date):
+    """Yield a ``pending`` record for each request made between ``start`` and ``end``.
+
+    The API only returns requests that are still pending, so older requests
+    that were approved or denied cannot be exported.
+    """
+    for request in pending_requests:
+        requested = request.get("requestedTime")
+        day = _parse_date(requested)
+        if day is not None and not start <= day <= end:
+            continue
+        yield {
+            "kind": PENDING,
+            "user_id": request.get("puid"),
+            "date": day.isoformat() if day else None,
+            "request_id": request.get("id"),
+            "requested_time": requested,
+        }
+
+def _parse_date(value: str | int) -> date:
+    """Return the date of an ISO 8601 or epoch millisecond timestamp, or ``None`` if it cannot be parsed."""
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000).date()
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+async def iter_records(
+        accounts: list[Account],
+        start: date,
+        end: date,
+        kinds: list[str] = (USAGE, ACTIVITY),
+        pending_requests: list[dict] = None,
+        max_concurrency: int = 4) -> AsyncIterator[dict]:
+    """Yield export records for each account, day by day.
+
+    Args:
+        accounts: Accounts to export.
+        start: First day (inclusive).
+        end: Last day (inclusive).
+        kinds: Record kinds to include, from :data:`KINDS`.
+        pending_requests: Current pending requests, used for ``pending``
+            records.
+        max_concurrency: Maximum number of days fetched at once per account.
+    """
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise ValueError(f"Unknown export kinds: {', '.join(sorted(unknown))}")
+    if start > end:
+        raise ValueError("start must not be after end.")
+    if USAGE in kinds or ACTIVITY in kinds:
+        for account in accounts:
+            async for day, report in iter_daily_reports(account, start, end, max_concurrency):
+                if USAGE in kinds:
+                    for record in usage_records(account.user_id, day, report["devices"]):
+                        yield record
+                if ACTIVITY in kinds:
+                    for record in activity_records(account.user_id, day, report["applications"]):
+                        yield record
+    if PENDING in kinds:
+        user_ids = {account.user_id for account in accounts}
+        for record in pending_records(pending_requests or [], start, end):
+            if record["user_id"] in user_ids:
+                yield record
+
+class NDJSONWriter:
+    """Writes records as newline-delimited JSON."""
+
+    def __init__(self, stream: TextIO, fields: list[str] = None) -> None:
+        self._stream = stream
+        self._fields = fields
+
+    def write(self, record: dict) -> None:
+        """Write a single record."""
+        if self._fields is not None:
+            record = {field: record.get(field) for field in self._fields}
+        self._stream.write(json.dumps(record, default=str) + "\n")
+
+    def close(self) -> None:
+        """Flush buffered output; the stream is left open."""
+        self._stream.flush()
+
+class CSVWriter:
+    """Writes records as CSV, by default with the columns in :data:`RECORD_FIELDS`."""
+
+    def __init__(self, stream: TextIO, fields: list[str] = None) -> None:
+        self._stream = stream
+        self._writer = csv.DictWriter(stream, fieldnames=fields or RECORD_FIELDS, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write(self, record: dict) -> None:
+        """Write a single record."""
+        self._writer.writerow(record)
+
+    def close(self) -> None:
+        """Flush buffered output; the stream is left open."""
+        self._stream.flush()
+
+class ParquetWriter:
+    """Writes records to a Parquet file in row groups of ``batch_size`` rows.
+
+    Requires ``pyarrow`` (``pip install "pyfamilysafety[parquet]"``).
+    """
+
+    def __init__(
+            self,
+            path,
+            fields: list[str] = None,
+            batch_size: int = EXPORT_BATCH_SIZE) -> None:
+        if pa is None:
+            raise ImportError("pyarrow is required for Parquet export.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        self._fields = fields or RECORD_FIELDS
+        self._schema = pa.schema([(field, _parquet_type(field)) for field in self._fields])
+        self._writer = pq.ParquetWriter(str(path), self._schema)
+        self._batch_size = batch_size
+        self._columns: dict[str, list] = {field: [] for field in self._fields}
+        self._rows = 0
+
+    def write(self, record: dict) -> None:
+        """Buffer a single record, writing a row group when the batch is full."""
+        for field, column in self._columns.items():
+            value = record.get(field)
+            if field == "date" and value is not None:
+                value = date.fromisoformat(value)
+            column.append(value)
+        self._rows += 1
+        if self._rows >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records as a row group."""
+        if not self._rows:
+            return
+        self._writer.write_table(pa.table(self._columns, schema=self._schema))
+        self._columns = {field: [] for field in self._fields}
+        self._rows = 0
+
+    def close(self) -> None:
+        """Write remaining records and finalise the file."""
+        self.flush()
+        self._writer.close()
+
+def _parquet_type(field: str):
+    """Return the Arrow type for an export column."""
+    if field == "date":
+        return pa.date32()
+    if field == "usage_ms":
+        return pa.int64()
+    if field == "blocked":
+        return pa.bool_()
+    return pa.string()
+
+def partition_path(directory, kind: str, user_id: str, day: date, file_format: str) -> Path:
+    """Return the file holding one member's ``kind`` records for a day.
+
+    Files are laid out as
+    ``<directory>/<kind>/user=<user_id>/date=<YYYY-MM-DD>.<ext>``.
+    """
+    return (Path(directory) / kind / f"user={user_id}"
+            / f"date={day.isoformat()}.{FILE_EXTENSIONS[file_format]}")
+
+class _DayPartition:
+    """Per-kind writers for one member and day, written to temporary files until committed."""
+
+    def __init__(
+            self, directory, user_id: str, day: date, kinds, file_format: str, batch_size: int) -> None:
+        self.key = (day, user_id)
+        self._files = []
+        self._writers = {}
+        for kind in kinds:
+            path = partition_path(directory, kind, user_id, day, file_format)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            stream = None
+            if file_format == "parquet":
+                writer = ParquetWriter(tmp_path, KIND_FIELDS[kind], batch_size)
+            else:
+                stream = open(tmp_path, "w", encoding="utf8", newline="")
+                writer_cls = CSVWriter if file_format == "csv" else NDJSONWriter
+                writer = writer_cls(stream, KIND_FIELDS[kind])
+            self._writers[kind] = writer
+            self._files.append((writer, stream, tmp_path, path))
+
+    def write(self, kind: str, records) -> None:
+        """Write records of one kind."""
+        writer = self._writers[kind]
+        for record in records:
+            writer.write(record)
+
+    def _close(self) -> None:
+        for writer, stream, _, _ in self._files:
+            writer.close()
+            if stream is not None:
+                stream.close()
+
+    def commit(self) -> None:
+        """Close the files and move them into place."""
+        self._close()
+        for _, _, tmp_path, path in self._files:
+            os.replace(tmp_path, path)
+
+    def abort(self) -> None:
+        """Close and remove the temporary files."""
+        try:
+            self._close()
+        finally:
+            for _, _, tmp_path, _ in self._files:
+                tmp_path.unlink(missing_ok=True)
+
+async def export_partitions(
+        accounts: list[Account],
+        start: date,
+        end: date,
+        directory,
+        file_format: str = "parquet",
+        kinds: list[str] = (USAGE, ACTIVITY),
+        max_concurrency: int = 4,
+        batch_size: int = EXPORT_BATCH_SIZE) -> list[date]:
+    """Export usage and activity history to one file per kind, member and day.
+
+    Reports are fetched for every account and day with at most
+    ``max_concurrency`` requests in flight and written as they arrive, so
+    memory use does not depend on the size of the range. Each member's files
+    for a day are written under a temporary name and renamed once complete;
+    members and days whose files already exist are skipped, so an interrupted
+    export can be resumed by running it again with the same range, and other
+    members can be added to an existing export later.
+
+    Args:
+        accounts: Accounts to export.
+        start: First day (inclusive).
+        end: Last day (inclusive).
+        directory: Output directory, see :func:`partition_path`.
+        file_format: ``parquet``, ``csv`` or ``ndjson``.
+        kinds: ``usage`` and/or ``activity``.
+        max_concurrency: Maximum number of reports fetched at once.
+        batch_size: Rows per Parquet row group.
+
+    Returns:
+        The days for which at least one member was written by this call.
+    """
+    if file_format not in FILE_EXTENSIONS:
+        raise ValueError(f"Unknown export format: {file_format}")
+    if file_format == "parquet" and pa is None:
+        raise ImportError("pyarrow is required for Parquet export.")
+    if not kinds or set(kinds) - {USAGE, ACTIVITY}:
+        raise ValueError("Partitioned exports support usage and activity records only.")
+    if start > end:
+        raise ValueError("start must not be after end.")
+
+    def _is_complete(account: Account, day: date) -> bool:
+        return all(
+            partition_path(directory, kind, account.user_id, day, file_format).exists()
+            for kind in kinds)
+
+    def _items():
+        for day in iter_days(start, end):
+            for account in accounts:
+                if _is_complete(account, day):
+                    _LOGGER.debug("Skipping %s for %s, already exported", day, account.user_id)
+                    continue
+                yield day, account
+
+    async def _fetch(item) -> dict:
+        day, account = item
+        return await fetch_daily_report(account, day)
+
+    exported = []
+
+    def _commit(partition: _DayPartition) -> None:
+        partition.commit()
+        day = partition.key[0]
+        if not exported or exported[-1] != day:
+            exported.append(day)
+
+    partition: _DayPartition = None
+    try:
+        async for (day, account), report in iter_ordered(_items(), _fetch, max_concurrency):
+            if partition is None or partition.key != (day, account.user_id):
+                if partition is not None:
+                    _commit(partition)
+                partition = _DayPartition(
+                    directory, account.user_id, day, kinds, file_format, batch_size)
+            if USAGE in kinds:
+                partition.write(USAGE, usage_records(account.user_id, day, report["devices"]))
+            if ACTIVITY in kinds:
+                partition.write(ACTIVITY, activity_records(account.user_id, day, report["applications"]))
+    except BaseException:
+        if partition is not None:
+            partition.abort()
+        raise
+    if partition is not None:
+        _commit(partition)
+    return exported
@@ -0,0 +1,587 @@
+"""The Family Safety client."""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Callable
+
+from .authenticator import Authenticator
+from .api import FamilySafetyAPI
+from .account import Account
+from .const import (
+    EVENT_QUEUE_SIZE,
+    REFRESH_MIN_INTERVAL,
+    REFRESH_MAX_INTERVAL,
+    REFRESH_BACKOFF_MAX,
+    REFRESH_GROWTH_FACTOR,
+)
+from .events import (
+    ChangeEvent,
+    diff_account,
+    diff_pending_requests,
+    snapshot_account,
+    snapshot_pending_requests,
+)
+from .enum import ChangeEventType, CircuitState
+from .exceptions import AggregatorException
+from .helpers import API_TIMEZONE
+from .update_cycle import UpdateCycle
+from .utils import run_callback
+
+_LOGGER = logging.getLogger(__name__)
+
+class FamilySafety:
+    """Main client for Microsoft Family Safety.
+
+    Holds the authenticated API session, family member accounts, and optional
+    pending screen-time request handling.
+
+    Attributes:
+        accounts: Family members with Digital Safety enabled, populated after
+            the first :meth:`update`.
+        experimental: When ``True``, :meth:`update` fetches pending screen-time
+            requests and invokes registered callbacks.
+        pending_requests: Latest pending request payloads (experimental mode).
+        last_updated: UTC time the last refresh cycle finished.
+        pending_requests_updated: UTC time pending requests were last fetched.
+    """
+
+    def __init__(self, auth: Authenticator) -> None:
+        """Initialize the client.
+
+        Use as an async context manager (``async with FamilySafety(auth)``) to
+        stop the refresher and close the HTTP session on exit.
+
+        Args:
+            auth: Authenticated :class:`~pyfamilysafety.authenticator.Authenticator`
+                session.
+        """
+        self._auth: Authenticator = auth
+        self._api: FamilySafetyAPI = FamilySafetyAPI(auth=auth)
+        self._api.add_circuit_listener(self._on_circuit_state_change)
+        self.accounts: list[Account] = []
+        self.experimental: bool = False
+        self._lean: bool = False
+        self._pending_by_id: dict[str, dict] = {}
+        self._pending_by_puid: dict[str, dict[str, dict]] = {}
+        self._pending_request_callbacks = []
+        self._event_queues: list[asyncio.Queue] = []
+        self._account_snapshots: dict[str, dict] = {}
+        self._pending_loaded: bool = False
+        self._event_count: int = 0
+        self._update_lock: asyncio.Lock = asyncio.Lock()
+        self._refresher: asyncio.Task = None
+        self._revalidation: asyncio.Task = None
+        self.last_updated: datetime = None
+        self.pending_requests_updated: datetime = None
+
+    async def __aenter__(self) -> "FamilySafety":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop the background refresher and close the HTTP session.
+
+        A session passed in by the caller when creating the
+        :class:`~pyfamilysafety.authenticator.Authenticator` is left open.
+        """
+        await self.stop_refresher()
+        if self.revalidating:
+            self._revalidation.cancel()
+            await asyncio.gather(self._revalidation, return_exceptions=True)
+        await self._auth.close()
+
+    def get_account(self, user_id: str) -> Account:
+        """Return the account with the given member ID.
+
+        Args:
+            user_id: Microsoft family member ID from the roster.
+
+        Returns:
+            Matching :class:`~pyfamilysafety.account.Account`.
+
+        Raises:
+            IndexError: If no account matches ``user_id``.
+        """
+        return [x for x in self.accounts if x.user_id == user_id][0]
+
+    @property
+    def lean(self) -> bool:
+        """Keep only parsed fields instead of raw report payloads.
+
+        Intended for processes that monitor many families at once. When
+        ``True``, every account drops ``screentime_usage`` and
+        ``application_usage`` once they are parsed and app activity keeps only
+        the fields applications need. Responses cached for stale serving are
+        not affected; see ``FamilySafetyAPI.serve_stale``.
+        """
+        return self._lean
+
+    @lean.setter
+    def lean(self, value: bool) -> None:
+        self._lean = value
+        for account in self.accounts:
+            account.lean = value
+
+    @property
+    def pending_requests(self) -> list[dict]:
+        """Latest pending request payloads (experimental mode)."""
+        return list(self._pending_by_id.values())
+
+    def get_request(self, request_id: str) -> dict:
+        """Return a single pending request by ID.
+
+        Args:
+            request_id: Pending request identifier from the API.
+
+        Returns:
+            Raw pending request dictionary.
+
+        Raises:
+            ValueError: If the request is not in :attr:`pending_requests`.
+        """
+        request = self._pending_by_id.get(request_id)
+        if request is not None:
+            return request
+        raise ValueError("Pending request not found")
+
+    def get_account_requests(self, user_id: str) -> list:
+        """Return pending requests for a family member.
+
+        Args:
+            user_id: Member ID (``puid`` field on pending requests).
+
+        Returns:
+            List of pending request dictionaries for that member.
+        """
+        return list(self._pending_by_puid.get(user_id, {}).values())
+
+    def add_pending_request_callback(self, callback: Callable) -> None:
+        """Register a callback invoked when pending requests change.
+
+        The callback is called with three lists of request dicts: ``added``,
+        ``removed`` and ``updated`` since the previous refresh. It only runs
+        when at least one of them is non-empty. Callables that take no
+        arguments are still supported and are called without them.
+
+        Args:
+            callback: Callable; may be sync or async.
+
+        Raises:
+            ValueError: If ``callback`` is not callable.
+        """
+        if not callable(callback):
+            raise ValueError("Object must be callable.")
+        if callback not in self._pending_request_callbacks:
+            self._pending_request_callbacks.append(callback)
+
+    def remove_pending_request_callback(self, callback: Callable) -> None:
+        """Remove a pending request callback.
+
+        Args:
+            callback: Previously registered callable.
+
+        Raises:
+            ValueError: If ``callback`` is not callable.
+        """
+        if not callable(callback):
+            raise ValueError("Object must be callable.")
+        if callback in self._pending_request_callbacks:
+            self._pending_request_callbacks.remove(callback)
+
+    async def events(self, max_queue: int = EVENT_QUEUE_SIZE) -> AsyncIterator[ChangeEvent]:
+        """Iterate over change events detected by subsequent updates.
+
+        Events are computed by diffing each account (and the pending requests
+        in experimental mode) against the state from the previous refresh, so
+        nothing is yielded for refreshes that changed nothing. The first refresh
+        only records a baseline. Iteration runs until the consumer stops it, for
+        example by breaking out of the loop or cancelling its task.
+
+        Args:
+            max_queue: Events buffered for a consumer that falls behind; once
+                full, the oldest event is dropped for each new one.
+
+        Yields:
+            :class:`~pyfamilysafety.events.ChangeEvent` instances.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._event_queues.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._event_queues.remove(queue)
+
+    def circuit_metrics(self) -> dict[str, dict]:
+        """Return circuit breaker state and counters per endpoint.
+
+        See :meth:`pyfamilysafety.api.FamilySafetyAPI.circuit_metrics`.
+        """
+        return self._api.circuit_metrics()
+
+    def _on_circuit_state_change(self, endpoint: str, old_state: CircuitState, new_state: CircuitState) -> None:
+        """Report circuit breaker changes without resetting the refresher interval."""
+        self._deliver_events([ChangeEvent(
+            ChangeEventType.CIRCUIT_STATE_CHANGED, None, endpoint, str(old_state), str(new_state))])
+
+    def _publish_events(self, events: list[ChangeEvent]) -> None:
+        """Deliver change events to every active :meth:`events` iterator."""
+        self._event_count += len(events)
+        self._deliver_events(events)
+
+    def _deliver_events(self, events: list[ChangeEvent]) -> None:
+        for event in events:
+            _LOGGER.debug("Change event %s", event)
+            for queue in self._event_queues:
+                if queue.full():
+                    dropped = queue.get_nowait()
+                    _LOGGER.warning("Change event queue full, dropping %s", dropped)
+                queue.put_nowait(event)
+
+    def _publish_account_changes(self) -> None:
+        """Diff every account against its previous snapshot."""
+        events = []
+        for account in self.accounts:
+            snapshot = snapshot_account(account)
+            previous = self._account_snapshots.get(account.user_id)
+            if previous is not None:
+                events.extend(diff_account(account.user_id, previous, snapshot))
+            self._account_snapshots[account.user_id] = snapshot
+        self._publish_events(events)
+
+    async def _get_pending_requests(self):
+        """Returns pending requests on the account."""
+        response = await self._api.send_request("get_pending_requests")
+        pending_requests = response.get("json").get("pendingRequests", [])
+        self.pending_requests_updated = datetime.now(tz=API_TIMEZONE)
+        # restrict pending requests to only screentime, other types not supported yet
+        await self._notify_pending_requests(*self._apply_pending_requests(
+            [x for x in pending_requests if x["type"] == "DeviceScreenTime"]))
+        return self.pending_requests
+
+    def _apply_pending_requests(self, pending_requests: list[dict]) -> tuple[list, list, list]:
+        """Replace the pending request indexes, returning added, removed and updated requests."""
+        previous = self._pending_by_id
+        current = snapshot_pending_requests(pending_requests)
+        added = [x for request_id, x in current.items() if request_id not in previous]
+        removed = [x for request_id, x in previous.items() if request_id not in current]
+        updated = [
+            x for request_id, x in current.items()
+            if request_id in previous and previous[request_id] != x
+        ]
+        by_puid: dict[str, dict[str, dict]] = {}
+        for request_id, request in current.items():
+            by_puid.setdefault(request["puid"], {})[request_id] = request
+        self._pending_by_id = current
+        self._pending_by_puid = by_puid
+        if self._pending_loaded:
+            self._publish_events(diff_pending_requests(previous, current))
+        self._pending_loaded = True
+        return added, removed, updated
+
+    async def _notify_pending_requests(self, added: list, removed: list, updated: list) -> None:
+        """Invoke pending request callbacks with the latest changes."""
+        if not (added or removed or updated):
+            return
+        for cb in self._pending_request_callbacks:
+            await run_callback(cb, added, removed, updated)
+
+    def _remove_pending_requests(self, requests: list[dict]) -> list[dict]:
+        """Drop requests from the local indexes, returning those that were present."""
+        previous = dict(self._pending_by_id)
+        removed = []
+        for request in requests:
+            if self._pending_by_id.pop(request["id"], None) is None:
+                continue
+            member_requests = self._pending_by_puid.get(request["puid"], {})
+            member_requests.pop(request["id"], None)
+            if not member_requests:
+                self._pending_by_puid.pop(request["puid"], None)
+            removed.append(request)
+        if self._pending_loaded:
+            self._publish_events(diff_pending_requests(previous, self._pending_by_id))
+        return removed
+
+    async def _process_pending_requests(
+            self,
+            request_ids: list[str],
+            approved: bool,
+            extension_time: int = 0,
+            return_exceptions: bool = False) -> list:
+        """Approve or deny requests concurrently, then refresh pending requests once.
+
+        Requests are removed from local state before posting. A single refresh
+        at the end reconciles local state with the server, restoring any
+        request whose action failed. With ``return_exceptions`` a failed
+        refresh is logged, so it never hides the results of the batch.
+        """
+        requests = [self.get_request(request_id) for request_id in request_ids]
+        await self._notify_pending_requests([], self._remove_pending_requests(requests), [])
+        try:
+            return await asyncio.gather(
+                *(self._api.async_process_pending_request(
+                    request,
+                    approved,
+                    extension_time*1000 # convert seconds to ms
+                ) for request in requests),
+                return_exceptions=return_exceptions
+            )
+        finally:
+            try:
+                await self._get_pending_requests()
+            except Exception as err:  # pylint: disable=broad-except
+                if not return_exceptions:
+                    raise
+                _LOGGER.warning("Unable to refresh pending requests after batch: %s", err)
+
+    async def approve_pending_request(self, request_id: str, extension_time: int) -> bool:
+        """Approve a pending screen-time request.
+
+        Args:
+            request_id: Pending request identifier.
+            extension_time: Extra screen time to grant, in **seconds**.
+
+        Returns:
+            ``True`` if the API responded with HTTP 204.
+        """
+        response = (await self._process_pending_requests([request_id], True, extension_time))[0]
+        return response["status"] == 204
+
+    async def deny_pending_request(self, request_id: str) -> bool:
+        """Deny a pending screen-time request.
+
+        Args:
+            request_id: Pending request identifier.
+
+        Returns:
+            ``True`` if the API responded with HTTP 204.
+        """
+        response = (await self._process_pending_requests([request_id], False))[0]
+        return response["status"] == 204
+
+    async def approve_pending_requests(self, request_ids: list[str], extension_time: int) -> dict[str, bool]:
+        """Approve several pending screen-time requests at once.
+
+        Requests are posted concurrently and pending requests are refreshed
+        once at the end, instead of after every request.
+
+        Args:
+            request_ids: Pending request identifiers.
+            extension_time: Extra screen time to grant to each, in **seconds**.
+
+        Returns:
+            Mapping of request ID to ``True`` if the API responded with HTTP 204.
+            Requests that raised an error map to ``False``.
+
+        Raises:
+            ValueError: If any request is not in :attr:`pending_requests`.
+        """
+        responses = await self._process_pending_requests(request_ids, True, extension_time, True)
+        return self._parse_batch_responses(request_ids, responses)
+
+    async def deny_pending_requests(self, request_ids: list[str]) -> dict[str, bool]:
+        """Deny several pending screen-time requests at once.
+
+        Args:
+            request_ids: Pending request identifiers.
+
+        Returns:
+            Mapping of request ID to ``True`` if the API responded with HTTP 204.
+            Requests that raised an error map to ``False``.
+
+        Raises:
+            ValueError: If any request is not in :attr:`pending_requests`.
+        """
+        responses = await self._process_pending_requests(request_ids, False, return_exceptions=True)
+        return self._parse_batch_responses(request_ids, responses)
+
+    def _parse_batch_responses(self, request_ids: list[str], responses: list) -> dict[str, bool]:
+        """Convert batch responses into a success map."""
+        results = {}
+        for request_id, response in zip(request_ids, responses):
+            if isinstance(response, Exception):
+                _LOGGER.warning("Unable to process pending request %s: %s", request_id, response)
+                results[request_id] = False
+            else:
+                results[request_id] = response["status"] == 204
+        return results
+
+    async def update_content_restrictions(
+            self,
+            operations: dict[str, list[dict]],
+            max_concurrency: int = 4) -> dict[str, object]:
+        """Patch content restrictions for several members concurrently.
+
+        Args:
+            operations: JSON Patch operations keyed by member ID.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            The API response body per member ID, or the exception raised for
+            that member.
+
+        Raises:
+            IndexError: If a member ID is not a known account.
+        """
+        accounts = {user_id: self.get_account(user_id) for user_id in operations}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _patch(user_id: str):
+            async with semaphore:
+                return await accounts[user_id].update_content_restrictions(operations[user_id])
+
+        results = await asyncio.gather(*(_patch(user_id) for user_id in accounts), return_exceptions=True)
+        return dict(zip(accounts, results))
+
+    async def update(self, wait: bool = True):
+        """Refresh family roster and all account data.
+
+        On the first call, loads the roster and creates :class:`Account`
+        instances. On every call, runs :meth:`Account.update` for each member
+        with one shared :class:`~pyfamilysafety.update_cycle.UpdateCycle`.
+        When :attr:`experimental` is enabled, also refreshes pending requests.
+        Concurrent calls are serialized so refresh cycles never overlap, and a
+        call made while a background revalidation is running waits for that
+        refresh instead of starting another.
+
+        With ``wait=False`` this returns at once and the cached state stays
+        readable while :meth:`revalidate` refreshes it in the background. Use
+        :meth:`pyfamilysafety.account.Account.data_age` to decide if cached
+        data is too old to show.
+
+        Args:
+            wait: Wait for the refresh to finish. When ``False``, a background
+                revalidation is started unless one is already running.
+
+        Raises:
+            AggregatorException: Not raised directly; transient aggregator errors
+                are logged and ignored so cached data remains available.
+        """
+        if not wait:
+            self.revalidate()
+            return
+        if self.revalidating:
+            # shielded so a cancelled caller does not cancel the shared refresh
+            await asyncio.shield(self._revalidation)
+            return
+        await self._refresh()
+
+    async def _refresh(self):
+        """Run :meth:`_update`, logging and ignoring aggregator errors."""
+        try:
+            await self._update()
+        except AggregatorException:
+            _LOGGER.warning("Aggregator exception occured, ignoring this update request.")
+
+    @property
+    def revalidating(self) -> bool:
+        """Whether a background revalidation is running."""
+        return self._revalidation is not None and not self._revalidation.done()
+
+    def revalidate(self) -> asyncio.Task:
+        """Start a background :meth:`update`, or return the one already running.
+
+        Returns:
+            The revalidation task; await it to wait for fresh data.
+        """
+        if not self.revalidating:
+            self._revalidation = asyncio.ensure_future(self._refresh())
+            self._revalidation.add_done_callback(self._revalidation_done)
+        return self._revalidation
+
+    @staticmethod
+    def _revalidation_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            _LOGGER.warning("Background revalidation failed: %s", task.exception())
+
+    async def _update(self):
+        """Run a single refresh cycle, raising any aggregator error."""
+        async with self._update_lock:
+            if len(self.accounts) == 0:
+                data = await self._api.send_request("get_accounts")
+                self.accounts = await Account.from_dict(
+                    self._api,
+                    data["json"],
+                    self.experimental,
+                    self.lean
+                )
+            cycle = UpdateCycle()
+            coros = []
+            if self.experimental:
+                coros.append(self._get_pending_requests())
+            for account in self.accounts:
+                coros.append(account.update(cycle))
+            await asyncio.gather(*coros)
+            self.last_updated = datetime.now(tz=API_TIMEZONE)
+            self._publish_account_changes()
+
+    @property
+    def refresher_running(self) -> bool:
+        """Whether the background refresher is active."""
+        return self._refresher is not None and not self._refresher.done()
+
+    def start_refresher(
+            self,
+            min_interval: float = REFRESH_MIN_INTERVAL,
+            max_interval: float = REFRESH_MAX_INTERVAL) -> asyncio.Task:
+        """Start refreshing all data in the background.
+
+        The delay between cycles starts at ``min_interval`` and grows towards
+        ``max_interval`` while refreshes produce no change events. It drops back
+        to ``min_interval`` as soon as something changes or pending requests are
+        waiting for a decision. Aggregator errors double the delay, up to
+        ``REFRESH_BACKOFF_MAX`` seconds. Cycles never overlap.
+
+        Args:
+            min_interval: Shortest delay between cycles, in seconds.
+            max_interval: Longest delay between cycles while idle, in seconds.
+
+        Returns:
+            The refresher task.
+
+        Raises:
+            ValueError: If ``min_interval`` is not positive or exceeds
+                ``max_interval``.
+        """
+        if min_interval <= 0 or min_interval > max_interval:
+            raise ValueError("min_interval must be positive and not exceed max_interval.")
+        if self.refresher_running:
+            return self._refresher
+        self._refresher = asyncio.ensure_future(self._refresh_loop(min_interval, max_interval))
+        return self._refresher
+
+    async def stop_refresher(self) -> None:
+        """Stop the background refresher and wait for it to finish."""
+        if self._refresher is None:
+            return
+        self._refresher.cancel()
+        try:
+            await self._refresher
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._refresher = None
+
+    async def _refresh_loop(self, min_interval: float, max_interval: float):
+        """Background refresh loop started by :meth:`start_refresher`."""
+        interval = min_interval
+        while True:
+            events_before = self._event_count
+            try:
+                await self._update()
+            except AggregatorException:
+                interval = min(max(interval, min_interval) * 2, REFRESH_BACKOFF_MAX)
+                _LOGGER.warning("Aggregator exception occured, next refresh in %ss", interval)
+            except Exception:  # pylint: disable=broad-except
+                interval = min(max(interval, min_interval) * 2, REFRESH_BACKOFF_MAX)
+                _LOGGER.exception("Background refresh failed, next refresh in %ss", interval)
+            else:
+                if self._event_count > events_before or len(self.pending_requests) > 0:
+                    interval = min_interval
+                else:
+                    interval = min(interval * REFRESH_GROWTH_FACTOR, max_interval)
+                _LOGGER.debug("Background refresh complete, next refresh in %ss", interval)
+            await asyncio.sleep(interval)
@@ -1,15 +1,25 @@
 """Helper functions for pyfamilysafety."""
 
-from datetime import datetime
-from dateutil import tz
+from datetime import datetime, timezone
+from urllib.parse import quote_plus
 
-API_TIMEZONE = tz.tzutc()
-LOCAL_TIMEZONE = tz.tzlocal()
+API_TIMEZONE = timezone.utc
 
 def localise_datetime(dt: datetime) -> datetime:
-    """Localise the datetime into the current timezone."""
-    return dt.replace(tzinfo=LOCAL_TIMEZONE)
+    """Localise the datetime into the current timezone.
+
+    Naive datetimes are taken to be local time; aware datetimes are converted.
+    The offset is the system's for that instant, so daylight saving applies.
+    """
+    return dt.astimezone()
 
 def standardise_datetime(dt: datetime) -> datetime:
-    """Standardise the datetime into UTC."""
-    return dt.replace(tzinfo=API_TIMEZONE)
+    """Standardise the datetime into UTC.
+
+    Naive datetimes are taken to be local time; aware datetimes are converted.
+    """
+    return localise_datetime(dt).astimezone(API_TIMEZONE)
+
+def format_query_time(dt: datetime) -> str:
+    """Format a datetime as a URL-encoded ``beginTime``/``endTime`` query value."""
+    return quote_plus(localise_datetime(dt).strftime('%Y-%m-%dT%H:%M:%S%z'))
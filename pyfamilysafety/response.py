@@ -0,0 +1,90 @@
+"""Lazily decoded HTTP responses."""
+
+import json
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+class ApiResponse(Mapping):
+    """A response from the Family Safety API.
+
+    Read like the dict returned by earlier versions, with the keys
+    ``status``, ``text``, ``json``, ``headers`` and ``stale``. The body is
+    kept once as bytes and only decoded when ``text`` or ``json`` is first
+    read. Once ``json`` has been parsed the raw body is dropped, so a
+    response never holds the payload more than once.
+
+    Args:
+        status: HTTP status code.
+        headers: Response headers.
+        body: Raw response body.
+        content_type: Response content type; ``json`` is ``""`` unless this
+            is a JSON type.
+        charset: Encoding used to decode ``text``.
+        stale: Served from cache while the endpoint's circuit is open.
+    """
+
+    __slots__ = ("status", "headers", "stale", "_body", "_json", "_content_type", "_charset")
+
+    _KEYS = ("status", "text", "json", "headers", "stale")
+    _UNSET = object()
+
+    def __init__(
+            self,
+            status: int,
+            headers: Mapping = None,
+            body: bytes = b"",
+            content_type: str = "",
+            charset: str = None,
+            stale: bool = False) -> None:
+        self.status: int = status
+        self.headers: Mapping = headers if headers is not None else ""
+        self.stale: bool = stale
+        self._body: bytes = body or b""
+        self._json: Any = self._UNSET if self._body else ""
+        self._content_type: str = content_type or ""
+        self._charset: str = charset or "utf-8"
+
+    @property
+    def json(self) -> Any:
+        """The decoded JSON body, or ``""`` for empty or non-JSON responses."""
+        if self._json is self._UNSET:
+            if "json" not in self._content_type:
+                _LOGGER.debug("Unable to parse JSON response - invalid content type.")
+                return ""
+            self._json = json.loads(self._body.decode(self._charset))
+            self._body = b""
+        return self._json
+
+    @property
+    def text(self) -> str:
+        """The body as a string, re-encoded from ``json`` once that is parsed."""
+        if self._body:
+            return self._body.decode(self._charset, errors="replace")
+        if self._json is self._UNSET or self._json == "":
+            return ""
+        return json.dumps(self._json)
+
+    def as_stale(self) -> "ApiResponse":
+        """Return a copy sharing this body, marked as served from cache."""
+        response = ApiResponse.__new__(ApiResponse)
+        for attr in self.__slots__:
+            setattr(response, attr, getattr(self, attr))
+        response.stale = True
+        return response
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} status={self.status} stale={self.stale}>"
@@ -2,9 +2,11 @@
 
 Use these classes to build the payload for ``Account.set_device_limits``.
 Limits apply to a platform (Desktop, Xbox, or Mobile) rather than a single device.
+:class:`CompiledSchedule` evaluates a schedule locally, without a round-trip.
 """
 
-from datetime import time
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
 
 from .enum import DayOfWeek, DeviceLimitsMode, OverrideTarget
 
@@ -35,6 +37,11 @@ class AllottedInterval:
             "end": self.end,
         }
 
+    @classmethod
+    def from_dict(cls, raw: dict) -> "AllottedInterval":
+        """Parse an interval from the API format."""
+        return cls(begin=raw["begin"], end=raw["end"])
+
 
 class DailyRestriction:
     """Screen time limits for a single day.
@@ -70,6 +77,17 @@ class DailyRestriction:
             ]
         return result
 
+    @classmethod
+    def from_dict(cls, raw: dict) -> "DailyRestriction":
+        """Parse a daily restriction from the API format."""
+        return cls(
+            allowance=raw.get("allowance"),
+            allotted_intervals=[
+                AllottedInterval.from_dict(interval)
+                for interval in raw.get("allottedIntervals") or []
+            ],
+        )
+
 
 class DeviceLimitsSchedule:
     """Device screen time limits for a platform.
@@ -100,3 +118,189 @@ class DeviceLimitsSchedule:
             "appliesTo": str(self.platform),
             "culture": self.culture,
         }
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "DeviceLimitsSchedule":
+        """Parse a platform schedule from the API format.
+
+        Accepts the same shape produced by :meth:`to_dict`, as returned by the
+        server for the current schedule.
+        """
+        return cls(
+            platform=OverrideTarget.from_pretty(raw["appliesTo"]),
+            daily_restrictions={
+                DayOfWeek(day): DailyRestriction.from_dict(restriction)
+                for day, restriction in (raw.get("dailyRestrictions") or {}).items()
+            },
+            mode=DeviceLimitsMode(raw.get("mode", str(DeviceLimitsMode.PER_DEVICE_TYPE))),
+            culture=raw.get("culture", "en-GB"),
+        )
+
+
+def diff_schedules(current: DeviceLimitsSchedule, requested: DeviceLimitsSchedule) -> dict[str, tuple]:
+    """Structurally compare two platform schedules.
+
+    Args:
+        current: Schedule currently configured, or ``None`` if unknown.
+        requested: Schedule about to be applied.
+
+    Returns:
+        Mapping of changed field to ``(old, new)`` values. Daily restrictions
+        are reported per day as ``dailyRestrictions.<day>``. Empty when the
+        schedules are identical.
+    """
+    old = current.to_dict() if current is not None else {}
+    new = requested.to_dict()
+    changes = {}
+    for key in ("appliesTo", "mode", "culture"):
+        if old.get(key) != new.get(key):
+            changes[key] = (old.get(key), new.get(key))
+    old_days = old.get("dailyRestrictions", {})
+    new_days = new.get("dailyRestrictions", {})
+    for day in list(old_days) + [day for day in new_days if day not in old_days]:
+        if old_days.get(day) != new_days.get(day):
+            changes[f"dailyRestrictions.{day}"] = (old_days.get(day), new_days.get(day))
+    return changes
+
+
+_DAY_SECONDS = 24 * 60 * 60
+_WEEKDAYS = list(DayOfWeek)
+
+
+def _parse_seconds(value: str) -> int:
+    """Convert ``HH:MM[:SS]`` into seconds after midnight."""
+    parts = [int(part) for part in value.split(":")]
+    while len(parts) < 3:
+        parts.append(0)
+    return parts[0] * 3600 + parts[1] * 60 + parts[2]
+
+
+class ScheduleStatus:
+    """Result of evaluating a schedule at a point in time.
+
+    Attributes:
+        allowed: Whether use is permitted right now.
+        in_allotted_interval: Whether the time falls inside an allowed window.
+        remaining_allowance: Milliseconds of allowance left today, or ``None``
+            if the day has no allowance limit.
+        next_transition: When the allowed window next opens or closes, or
+            ``None`` if the schedule has no windows.
+    """
+
+    def __init__(
+            self,
+            allowed: bool,
+            in_allotted_interval: bool,
+            remaining_allowance: int,
+            next_transition: datetime) -> None:
+        self.allowed = allowed
+        self.in_allotted_interval = in_allotted_interval
+        self.remaining_allowance = remaining_allowance
+        self.next_transition = next_transition
+
+
+class CompiledSchedule:
+    """A :class:`DeviceLimitsSchedule` compiled for fast local evaluation.
+
+    Allotted intervals are merged and sorted into per-weekday tables of start
+    and end offsets, so each lookup is a binary search. Intervals whose end is
+    not after their begin run past midnight into the next day. Days missing
+    from the schedule are unrestricted.
+    """
+
+    def __init__(self, schedule: DeviceLimitsSchedule) -> None:
+        self.platform = schedule.platform
+        self._allowances: list[int] = [None] * 7
+        windows: list[list[tuple[int, int]]] = [[] for _ in range(7)]
+        self._restricted: list[bool] = [False] * 7
+        for day, restriction in schedule.daily_restrictions.items():
+            weekday = _WEEKDAYS.index(day)
+            self._allowances[weekday] = restriction.allowance
+            if not restriction.allotted_intervals:
+                continue
+            self._restricted[weekday] = True
+            for interval in restriction.allotted_intervals:
+                begin = _parse_seconds(interval.begin)
+                end = _parse_seconds(interval.end)
+                if end > begin:
+                    windows[weekday].append((begin, end))
+                    continue
+                windows[weekday].append((begin, _DAY_SECONDS))
+                if end > 0:
+                    windows[(weekday + 1) % 7].append((0, end))
+        self._starts: list[list[int]] = []
+        self._ends: list[list[int]] = []
+        for weekday in range(7):
+            starts, ends = [], []
+            for begin, end in sorted(windows[weekday]):
+                if ends and begin <= ends[-1]:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(begin)
+                    ends.append(end)
+            self._starts.append(starts)
+            self._ends.append(ends)
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "CompiledSchedule":
+        """Compile a schedule straight from the API format."""
+        return cls(DeviceLimitsSchedule.from_dict(raw))
+
+    def in_allotted_interval(self, when: datetime) -> bool:
+        """Whether ``when`` falls inside an allowed window."""
+        weekday = when.weekday()
+        if not self._restricted[weekday]:
+            return True
+        offset = when.hour * 3600 + when.minute * 60 + when.second
+        position = bisect_right(self._starts[weekday], offset) - 1
+        return position >= 0 and offset < self._ends[weekday][position]
+
+    def remaining_allowance(self, when: datetime, used: int = 0) -> int:
+        """Milliseconds of allowance left on the day of ``when``.
+
+        Returns:
+            The remaining allowance, or ``None`` if the day has no limit.
+        """
+        allowance = self._allowances[when.weekday()]
+        if allowance is None:
+            return None
+        return max(allowance - (used or 0), 0)
+
+    def next_transition(self, when: datetime) -> datetime:
+        """When the allowed window next opens or closes after ``when``.
+
+        Returns:
+            The next boundary within the coming week, or ``None`` if there is none.
+        """
+        midnight = datetime.combine(when.date(), time(0, 0, 0), tzinfo=when.tzinfo)
+        offset = when.hour * 3600 + when.minute * 60 + when.second
+        currently = self.in_allotted_interval(when)
+        for day in range(8):
+            weekday = (when.weekday() + day) % 7
+            if self._restricted[weekday]:
+                boundaries = sorted(set(self._starts[weekday] + self._ends[weekday]) | {0})
+            else:
+                boundaries = [0]
+            position = bisect_right(boundaries, offset) if day == 0 else 0
+            for boundary in boundaries[position:]:
+                candidate = midnight + timedelta(days=day, seconds=boundary)
+                if self.in_allotted_interval(candidate) != currently:
+                    return candidate
+        return None
+
+    def evaluate(self, when: datetime = None, used: int = 0) -> ScheduleStatus:
+        """Evaluate the schedule at ``when`` given the usage so far that day.
+
+        Args:
+            when: Local time to evaluate; defaults to now.
+            used: Screen time already used that day, in milliseconds.
+        """
+        when = when or datetime.now()
+        in_interval = self.in_allotted_interval(when)
+        remaining = self.remaining_allowance(when, used)
+        return ScheduleStatus(
+            allowed=in_interval and (remaining is None or remaining > 0),
+            in_allotted_interval=in_interval,
+            remaining_allowance=remaining,
+            next_transition=self.next_transition(when),
+        )
@@ -0,0 +1,94 @@
+"""Spending balances and payment methods for a family member."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from .api import FamilySafetyAPI
+from .const import SPENDING_REFRESH_INTERVAL
+from .helpers import API_TIMEZONE
+
+_LOGGER = logging.getLogger(__name__)
+
+class Spending:
+    """Cached Microsoft Store spending data with its own refresh policy.
+
+    Balances rarely change, so :meth:`refresh` only calls the API once every
+    :attr:`refresh_interval` unless forced. Payment methods are fetched on
+    demand and cached; concurrent lookups share a single request.
+
+    Attributes:
+        balances: Every balance entry returned by the API (``balance`` and
+            ``currency`` keys).
+        last_refreshed: UTC time the balances were last fetched.
+        refresh_interval: Minimum time between balance refreshes.
+    """
+
+    def __init__(
+            self,
+            api: FamilySafetyAPI,
+            user_id,
+            refresh_interval: timedelta = timedelta(seconds=SPENDING_REFRESH_INTERVAL)) -> None:
+        self._api: FamilySafetyAPI = api
+        self._user_id = user_id
+        self.balances: list[dict] = []
+        self.last_refreshed: datetime = None
+        self.refresh_interval = refresh_interval
+        self._payment_methods: dict[str, dict] = {}
+        self._payment_method_requests: dict[str, asyncio.Future] = {}
+
+    @property
+    def needs_refresh(self) -> bool:
+        """Whether the balances are older than :attr:`refresh_interval`."""
+        return self.last_refreshed is None or (
+            datetime.now(tz=API_TIMEZONE) - self.last_refreshed >= self.refresh_interval)
+
+    def get_balance(self, currency: str) -> float:
+        """Return the balance for a currency, or ``None`` if there is none."""
+        for balance in self.balances:
+            if balance.get("currency") == currency:
+                return balance.get("balance")
+        return None
+
+    async def refresh(self, force: bool = False) -> bool:
+        """Fetch balances if they are due for a refresh.
+
+        Args:
+            force: Fetch even if the cached balances are still fresh.
+
+        Returns:
+            ``True`` if the API was called. Balances served from cache while
+            the endpoint's circuit is open do not reset the refresh interval.
+        """
+        if not force and not self.needs_refresh:
+            return False
+        response = await self._api.async_get_user_spending(user_id=self._user_id)
+        self.balances = (response.get("json") or {}).get("balances", [])
+        if not response.get("stale"):
+            self.last_refreshed = datetime.now(tz=API_TIMEZONE)
+        return True
+
+    async def get_payment_methods(self, cid: str, refresh: bool = False) -> dict:
+        """Return the payment methods for a customer ID.
+
+        The response is cached per ``cid``. Concurrent calls for the same
+        ``cid`` share one request.
+
+        Args:
+            cid: Customer ID sent as the ``cid`` query parameter.
+            refresh: Fetch again even if a cached response exists.
+
+        Returns:
+            Parsed JSON from the payment methods API.
+        """
+        if not refresh and cid in self._payment_methods:
+            return self._payment_methods[cid]
+        request = self._payment_method_requests.get(cid)
+        if request is None:
+            request = asyncio.ensure_future(
+                self._api.async_get_user_payment_methods(user_id=self._user_id, cid=cid))
+            self._payment_method_requests[cid] = request
+            request.add_done_callback(lambda _: self._payment_method_requests.pop(cid, None))
+        response = await asyncio.shield(request)
+        self._payment_methods[cid] = response.get("json")
+        return self._payment_methods[cid]
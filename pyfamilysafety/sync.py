@@ -0,0 +1,334 @@
+"""Synchronous wrapper for non-async applications."""
+
+import asyncio
+import functools
+import inspect
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable
+
+from .family_safety import FamilySafety
+from .account import Account
+from .authenticator import Authenticator
+from .transport import Transport
+
+class EventLoopThread:
+    """A long-lived event loop running on a daemon thread.
+
+    Coroutines can be submitted from any thread and are run on the loop,
+    so HTTP connections and cached state are shared between calls.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, name="pyfamilysafety-loop", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop thread is still alive."""
+        return self._thread.is_alive()
+
+    def submit(self, coro: Awaitable) -> Future:
+        """Schedule a coroutine on the loop and return a thread-safe future."""
+        if not self.running:
+            raise RuntimeError("Event loop thread has been stopped.")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    @property
+    def in_loop_thread(self) -> bool:
+        """Whether the current thread is the loop thread."""
+        return threading.current_thread() is self._thread
+
+    def check_blocking_allowed(self) -> None:
+        """Raise if a blocking call would wait on the loop from its own thread.
+
+        Raises:
+            RuntimeError: If called from the loop thread, for example from a
+                client callback, where blocking would freeze the loop.
+        """
+        if self.in_loop_thread:
+            raise RuntimeError("Blocking calls cannot be made from the event loop thread.")
+
+    def run(self, coro: Awaitable, timeout: float = None) -> Any:
+        """Run a coroutine on the loop and block until it returns.
+
+        The coroutine is cancelled if ``timeout`` expires.
+
+        Raises:
+            RuntimeError: If called from the loop thread, where it would
+                deadlock.
+        """
+        try:
+            self.check_blocking_allowed()
+        except RuntimeError:
+            coro.close()
+            raise
+        return wait_or_cancel(self.submit(coro), timeout)
+
+    def call(self, func, *args, timeout: float = None, **kwargs) -> Any:
+        """Call a plain function on the loop thread and block until it returns."""
+        if self.in_loop_thread:
+            return func(*args, **kwargs)
+
+        async def _call():
+            return func(*args, **kwargs)
+
+        return self.run(_call(), timeout)
+
+    def stop(self) -> None:
+        """Stop the loop and wait for the thread to exit."""
+        if not self.running:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+def wait_or_cancel(future: Future, timeout: float = None, cancel: Future = None) -> Any:
+    """Wait for a future, cancelling ``cancel`` (default ``future``) on timeout."""
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        (cancel or future).cancel()
+        raise
+
+class SyncMethod:
+    """A blocking wrapper around a bound coroutine method.
+
+    Calling it blocks until the coroutine finishes, cancelling it if the
+    timeout expires; :meth:`submit` returns a
+    :class:`concurrent.futures.Future` instead. Blocking calls raise
+    ``RuntimeError`` when made from the loop thread, such as from a client
+    callback.
+    """
+
+    def __init__(self, method, loop_thread: EventLoopThread, timeout: float = None) -> None:
+        functools.update_wrapper(self, method)
+        self._method = method
+        self._loop_thread = loop_thread
+        self._timeout = timeout
+
+    def __call__(self, *args, **kwargs) -> Any:
+        self._loop_thread.check_blocking_allowed()
+        future, inner = self._schedule(*args, **kwargs)
+        return wait_or_cancel(future, self._timeout, inner)
+
+    def submit(self, *args, **kwargs) -> Future:
+        """Schedule the call on the loop thread and return its future."""
+        return self._schedule(*args, **kwargs)[0]
+
+    def _schedule(self, *args, **kwargs) -> tuple[Future, Future]:
+        """Schedule the call, returning the wrapped result future and the coroutine's future."""
+        future = Future()
+        inner = self._loop_thread.submit(self._method(*args, **kwargs))
+
+        def _done(done: Future):
+            if done.cancelled():
+                future.cancel()
+            elif done.exception() is not None:
+                future.set_exception(done.exception())
+            else:
+                future.set_result(_wrap(done.result(), self._loop_thread, self._timeout))
+
+        future.set_running_or_notify_cancel()
+        inner.add_done_callback(_done)
+        return future, inner
+
+class SyncIterator:
+    """A blocking iterator over an async iterator that runs on the loop thread.
+
+    Each step waits without a timeout, as event streams can stay idle for a
+    long time. Call :meth:`close`, or use it as a context manager, to stop
+    iterating early.
+    """
+
+    def __init__(self, aiterator, loop_thread: EventLoopThread, timeout: float = None) -> None:
+        self._aiterator = aiterator
+        self._loop_thread = loop_thread
+        self._timeout = timeout
+
+    def __iter__(self) -> "SyncIterator":
+        return self
+
+    def __next__(self) -> Any:
+        async def _next():
+            return await self._aiterator.__anext__()
+
+        try:
+            value = self._loop_thread.run(_next())
+        except StopAsyncIteration:
+            raise StopIteration from None
+        return _wrap(value, self._loop_thread, self._timeout)
+
+    def close(self) -> None:
+        """Stop the underlying async iterator."""
+        if self._loop_thread.running:
+            self._loop_thread.run(self._aiterator.aclose(), self._timeout)
+
+    def __enter__(self) -> "SyncIterator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class _SyncProxy:
+    """Exposes an async object to synchronous code.
+
+    Coroutine methods become :class:`SyncMethod`, async generator methods
+    return a :class:`SyncIterator`, and plain methods and attribute
+    assignments run on the loop thread.
+    """
+
+    _PROXY_ATTRIBUTES = ("_target", "_loop_thread", "_timeout")
+
+    def __init__(self, target, loop_thread: EventLoopThread, timeout: float = None) -> None:
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_loop_thread", loop_thread)
+        object.__setattr__(self, "_timeout", timeout)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if inspect.iscoroutinefunction(attr):
+            return SyncMethod(attr, self._loop_thread, self._timeout)
+        if inspect.isasyncgenfunction(attr):
+            @functools.wraps(attr)
+            def _iterate(*args, **kwargs):
+                return SyncIterator(attr(*args, **kwargs), self._loop_thread, self._timeout)
+            return _iterate
+        if inspect.ismethod(attr):
+            @functools.wraps(attr)
+            def _call(*args, **kwargs):
+                result = self._loop_thread.call(attr, *args, timeout=self._timeout, **kwargs)
+                return _wrap(result, self._loop_thread, self._timeout)
+            return _call
+        return _wrap(attr, self._loop_thread, self._timeout)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._PROXY_ATTRIBUTES:
+            object.__setattr__(self, name, value)
+        else:
+            self._loop_thread.call(setattr, self._target, name, value, timeout=self._timeout)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self._target!r}>"
+
+class SyncAccount(_SyncProxy):
+    """Blocking view of an :class:`~pyfamilysafety.account.Account`.
+
+    Attributes are read straight from the wrapped account; coroutine methods
+    such as ``update`` or ``override_device`` block until they finish.
+    """
+
+    @property
+    def account(self) -> Account:
+        """The wrapped async account."""
+        return self._target
+
+class SyncFamilySafety(_SyncProxy):
+    """Blocking client for synchronous applications.
+
+    Wraps :class:`~pyfamilysafety.FamilySafety` and runs it on one event loop
+    owned by a background thread, so connections are pooled across calls and
+    many threads can submit work at the same time. Every coroutine method is
+    available as a blocking call, or as a future through ``.submit()``:
+
+    ```python
+    client = SyncFamilySafety.create(token, use_refresh_token=True)
+    client.update()
+    futures = [a.update.submit() for a in client.accounts]
+    ```
+
+    Plain methods such as ``start_refresher`` and attribute assignments
+    such as ``client.experimental = True`` are run on the loop thread too.
+    Tasks they return are handed back as :class:`concurrent.futures.Future`,
+    and ``events()`` returns a blocking :class:`SyncIterator`. Callbacks
+    registered on the client run on the loop thread and must not make
+    blocking calls on it.
+
+    Args:
+        family_safety: The async client to wrap.
+        loop_thread: Loop thread that ``family_safety`` was created on.
+        timeout: Seconds a blocking call waits before raising
+            ``TimeoutError``; ``None`` waits forever.
+    """
+
+    def __init__(
+            self,
+            family_safety: FamilySafety,
+            loop_thread: EventLoopThread,
+            timeout: float = None) -> None:
+        super().__init__(family_safety, loop_thread, timeout)
+
+    @classmethod
+    def create(
+            cls,
+            token: str,
+            use_refresh_token: bool = False,
+            timeout: float = None,
+            transport: Transport = None) -> "SyncFamilySafety":
+        """Authenticate and return a client running on a new loop thread.
+
+        Args:
+            token: OAuth redirect URL, or a refresh token when
+                ``use_refresh_token`` is ``True``.
+            use_refresh_token: Treat ``token`` as a refresh token.
+            timeout: Default timeout for blocking calls.
+            transport: Transport to send requests with; see
+                :meth:`pyfamilysafety.authenticator.Authenticator.create`.
+        """
+        loop_thread = EventLoopThread()
+
+        async def _create() -> FamilySafety:
+            auth = await Authenticator.create(
+                token=token, use_refresh_token=use_refresh_token, transport=transport)
+            return FamilySafety(auth)
+
+        try:
+            family_safety = loop_thread.run(_create(), timeout)
+        except BaseException:
+            loop_thread.stop()
+            raise
+        return cls(family_safety, loop_thread, timeout)
+
+    @property
+    def family_safety(self) -> FamilySafety:
+        """The wrapped async client."""
+        return self._target
+
+    @property
+    def refresh_token(self) -> str:
+        """The current refresh token, for persisting between runs."""
+        return self._target._auth.refresh_token
+
+    def close(self) -> None:
+        """Close the async client and stop the loop thread."""
+        if not self._loop_thread.running:
+            return
+        try:
+            self._loop_thread.run(self._target.close(), self._timeout)
+        finally:
+            self._loop_thread.stop()
+
+    def __enter__(self) -> "SyncFamilySafety":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+async def _await(awaitable: Awaitable) -> Any:
+    return await awaitable
+
+def _wrap(value: Any, loop_thread: EventLoopThread, timeout: float) -> Any:
+    """Wrap accounts and tasks returned from the async client."""
+    if isinstance(value, asyncio.Future):
+        return loop_thread.submit(_await(value))
+    if isinstance(value, Account):
+        return SyncAccount(value, loop_thread, timeout)
+    if isinstance(value, list) and value and all(isinstance(x, Account) for x in value):
+        return [SyncAccount(x, loop_thread, timeout) for x in value]
+    return value
@@ -0,0 +1,265 @@
+"""Pluggable HTTP transports used by the authenticator and the API."""
+
+import asyncio
+import logging
+import re
+from abc import ABC, abstractmethod
+from json import dumps
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from .connection import create_client_session, get_ssl_context, prewarm
+from .const import (
+    BASE_URL,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_TOTAL_TIMEOUT,
+)
+from .response import ApiResponse
+from .utils import is_awaitable
+
+if TYPE_CHECKING:
+    import httpx
+
+_LOGGER = logging.getLogger(__name__)
+
+class Transport(ABC):
+    """Sends HTTP requests for the authenticator and :class:`~pyfamilysafety.api.FamilySafetyAPI`.
+
+    Subclasses implement :meth:`request`, and :meth:`close` if they hold
+    connections.
+
+    Attributes:
+        errors: Exception types raised when the server cannot be reached.
+            These count as failures for the endpoint's circuit breaker.
+    """
+
+    errors: tuple[type[Exception], ...] = ()
+
+    @abstractmethod
+    async def request(
+            self,
+            method: str,
+            url: str,
+            headers: dict = None,
+            json: Any = None,
+            data: dict = None) -> ApiResponse:
+        """Send a request and read the whole response.
+
+        Args:
+            method: HTTP method.
+            url: Absolute URL.
+            headers: Request headers.
+            json: Body to send as JSON.
+            data: Form fields to send URL-encoded.
+
+        Returns:
+            The response, for any status code.
+        """
+
+    async def prewarm(self, urls: list[str] = None) -> None:
+        """Open connections to the given hosts so later requests skip the handshake.
+
+        Failures are logged and ignored.
+
+        Args:
+            urls: URLs to connect to; defaults to the aggregator base URL.
+        """
+        async def _connect(url: str):
+            try:
+                await self.request("HEAD", url)
+            except (asyncio.TimeoutError, *self.errors) as err:
+                _LOGGER.debug("Unable to pre-warm connection to %s: %s", url, err)
+
+        await asyncio.gather(*(_connect(url) for url in urls or [BASE_URL]))
+
+    async def close(self) -> None:
+        """Release any connections held by the transport."""
+
+class AiohttpTransport(Transport):
+    """The default transport, backed by an :class:`aiohttp.ClientSession`.
+
+    Args:
+        client_session: Session to send requests with. When omitted a pooled
+            session is created with
+            :func:`~pyfamilysafety.connection.create_client_session` and
+            closed by :meth:`close`; a session passed in is left open.
+    """
+
+    errors = (aiohttp.ClientError,)
+
+    def __init__(self, client_session: aiohttp.ClientSession = None) -> None:
+        self._owns_session: bool = client_session is None
+        if client_session is None:
+            client_session = create_client_session()
+        self.client_session: aiohttp.ClientSession = client_session
+
+    async def request(
+            self,
+            method: str,
+            url: str,
+            headers: dict = None,
+            json: Any = None,
+            data: dict = None) -> ApiResponse:
+        async with self.client_session.request(
+            method=method,
+            url=url,
+            json=json,
+            headers=headers,
+            data=data
+        ) as response:
+            return ApiResponse(
+                status=response.status,
+                headers=response.headers,
+                body=await response.read() if response.status != 204 else b"",
+                content_type=response.content_type,
+                charset=response.charset,
+            )
+
+    async def prewarm(self, urls: list[str] = None) -> None:
+        await prewarm(self.client_session, urls)
+
+    async def close(self) -> None:
+        """Close the client session if it was created by this transport."""
+        if self._owns_session and not self.client_session.closed:
+            await self.client_session.close()
+
+class Http2Transport(Transport):
+    """Multiplexes requests over a single HTTP/2 connection per host.
+
+    Every account's requests to the aggregator share one connection instead
+    of a pool of HTTP/1.1 connections. Requires the ``http2`` extra
+    (``httpx`` with ``h2``).
+
+    Args:
+        client: An ``httpx.AsyncClient`` to send requests with. When omitted
+            an HTTP/2 client is created and closed by :meth:`close`; a client
+            passed in is left open.
+
+    Raises:
+        ImportError: If ``httpx`` is not installed.
+    """
+
+    def __init__(self, client: "httpx.AsyncClient" = None) -> None:
+        # imported here so the default transport does not pay for httpx
+        try:
+            import httpx  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise ImportError(
+                "HTTP/2 support requires httpx with h2, install 'pyfamilysafety[http2]'.") from err
+        self.errors = (httpx.TransportError,)
+        self._owns_client: bool = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=HTTP_CONNECTION_LIMIT,
+                    keepalive_expiry=HTTP_KEEPALIVE_TIMEOUT,
+                ),
+                # httpx has no overall deadline, so this bounds each read, write and pool wait
+                timeout=httpx.Timeout(HTTP_TOTAL_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+                verify=get_ssl_context(),
+            )
+        self.client: "httpx.AsyncClient" = client
+
+    async def request(
+            self,
+            method: str,
+            url: str,
+            headers: dict = None,
+            json: Any = None,
+            data: dict = None) -> ApiResponse:
+        response = await self.client.request(
+            method, url, headers=headers, json=json, data=data)
+        _LOGGER.debug("%s %s over %s", method, url, response.http_version)
+        return ApiResponse(
+            status=response.status_code,
+            headers=response.headers,
+            body=response.content,
+            content_type=response.headers.get("content-type", ""),
+            charset=response.charset_encoding,
+        )
+
+    async def close(self) -> None:
+        """Close the HTTP/2 client if it was created by this transport."""
+        if self._owns_client:
+            await self.client.aclose()
+
+class MemoryTransport(Transport):
+    """Answers requests from registered routes without any network access.
+
+    Meant for tests and benchmarks:
+
+    ```python
+    transport = MemoryTransport()
+    transport.add_route("GET", r"/v2/roster", {"members": []})
+    auth = Authenticator(transport=transport)
+    ```
+
+    Unmatched requests get an empty ``404`` response.
+
+    Attributes:
+        requests: Every request sent, as dicts with ``method``, ``url``,
+            ``headers``, ``json`` and ``data`` keys.
+    """
+
+    errors = (ConnectionError,)
+
+    def __init__(self) -> None:
+        self._routes: list[tuple[str, re.Pattern, Any, int]] = []
+        self.requests: list[dict] = []
+
+    def add_route(self, method: str, pattern: str, response: Any, status: int = 200) -> None:
+        """Answer matching requests; later routes take precedence.
+
+        Args:
+            method: HTTP method to match.
+            pattern: Regular expression searched for in the URL.
+            response: JSON body to return, an :class:`ApiResponse`, an
+                exception to raise, or a callable (sync or async) taking the
+                request dict and returning any of these.
+            status: Status code used when ``response`` is a JSON body.
+        """
+        self._routes.insert(0, (method.upper(), re.compile(pattern), response, status))
+
+    def clear(self) -> None:
+        """Remove every route and recorded request."""
+        self._routes.clear()
+        self.requests.clear()
+
+    async def request(
+            self,
+            method: str,
+            url: str,
+            headers: dict = None,
+            json: Any = None,
+            data: dict = None) -> ApiResponse:
+        request = {"method": method, "url": url, "headers": headers, "json": json, "data": data}
+        self.requests.append(request)
+        for route_method, pattern, response, status in self._routes:
+            if route_method == method.upper() and pattern.search(url):
+                break
+        else:
+            return ApiResponse(status=404)
+        if callable(response):
+            response = await response(request) if is_awaitable(response) else response(request)
+        if isinstance(response, BaseException):
+            raise response
+        if isinstance(response, ApiResponse):
+            return response
+        return _json_response(response, status)
+
+    async def prewarm(self, urls: list[str] = None) -> None:
+        """Nothing to connect to."""
+
+def _json_response(value: Any, status: int) -> ApiResponse:
+    """Build an in-memory JSON response."""
+    return ApiResponse(
+        status=status,
+        headers={"Content-Type": "application/json"},
+        body=dumps(value).encode(),
+        content_type="application/json",
+        charset="utf-8",
+    )
@@ -0,0 +1,33 @@
+"""Time values shared by every account during one refresh cycle."""
+
+from datetime import date, datetime, time
+
+from .helpers import API_TIMEZONE, format_query_time, localise_datetime
+
+class UpdateCycle:
+    """The local day being reported on by a refresh cycle.
+
+    :meth:`pyfamilysafety.FamilySafety.update` creates one per cycle and
+    passes it to every :meth:`~pyfamilysafety.account.Account.update`, so the
+    day window and its query parameters are computed once and all members
+    report on the same day even if the cycle crosses midnight.
+
+    Attributes:
+        now: Local time the cycle started.
+        day: Local date being reported on.
+        start_time: Start of ``day`` (00:00:00 local).
+        end_time: End of ``day`` (23:59:59 local).
+        begin_param: ``start_time`` formatted for ``beginTime`` query parameters.
+        end_param: ``end_time`` formatted for ``endTime`` query parameters.
+    """
+
+    def __init__(self, now: datetime = None) -> None:
+        self.now: datetime = (now or datetime.now(tz=API_TIMEZONE)).astimezone()
+        self.day: date = self.now.date()
+        self.start_time = localise_datetime(datetime.combine(self.day, time(0, 0, 0)))
+        self.end_time = localise_datetime(datetime.combine(self.day, time(23, 59, 59)))
+        self.begin_param = format_query_time(self.start_time)
+        self.end_param = format_query_time(self.end_time)
+
+    def __repr__(self) -> str:
+        return f"<UpdateCycle day={self.day.isoformat()}>"
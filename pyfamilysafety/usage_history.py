@@ -0,0 +1,124 @@
+"""Intraday screen time samples with burn-rate and time-to-limit projection."""
+
+from array import array
+from datetime import datetime, timedelta
+
+from .const import USAGE_HISTORY_SIZE
+from .helpers import API_TIMEZONE
+
+class UsageHistory:
+    """A fixed-size ring buffer of ``(timestamp, usage)`` samples.
+
+    Samples are stored in two ``array`` columns, so memory stays constant no
+    matter how long the client runs. When usage goes down (a new day has
+    started) the buffer is cleared, so projections only ever use today's
+    trajectory.
+
+    Attributes:
+        capacity: Maximum number of samples kept.
+    """
+
+    def __init__(self, capacity: int = USAGE_HISTORY_SIZE) -> None:
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2.")
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._usage = array("q", bytes(8 * capacity))
+        self._start = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._start = 0
+        self._count = 0
+
+    def append(self, usage: int, timestamp: datetime = None) -> None:
+        """Add a sample, overwriting the oldest when full.
+
+        Args:
+            usage: Screen time used so far today, in milliseconds.
+            timestamp: When the usage was observed; defaults to now.
+        """
+        if usage is None:
+            return
+        when = (timestamp or datetime.now(tz=API_TIMEZONE)).timestamp()
+        if self._count and usage < self._usage[self._index(self._count - 1)]:
+            self.clear()
+        if self._count and when <= self._timestamps[self._index(self._count - 1)]:
+            # same or older observation, only keep the newest value
+            self._usage[self._index(self._count - 1)] = usage
+            return
+        if self._count < self.capacity:
+            position = self._index(self._count)
+            self._count += 1
+        else:
+            position = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._timestamps[position] = when
+        self._usage[position] = usage
+
+    def _index(self, offset: int) -> int:
+        """Physical position of the ``offset``-th oldest sample."""
+        return (self._start + offset) % self.capacity
+
+    def samples(self) -> list[tuple[datetime, int]]:
+        """All samples, oldest first."""
+        return [
+            (datetime.fromtimestamp(self._timestamps[self._index(i)], tz=API_TIMEZONE), self._usage[self._index(i)])
+            for i in range(self._count)
+        ]
+
+    @property
+    def latest(self) -> int:
+        """The most recent usage value, or ``None`` if empty."""
+        if not self._count:
+            return None
+        return self._usage[self._index(self._count - 1)]
+
+    def burn_rate(self, window: timedelta = timedelta(minutes=30)) -> float:
+        """Screen time consumed per second of wall-clock time.
+
+        Computed from the oldest and newest samples inside ``window``. ``1.0``
+        means continuous use, ``0.0`` means no use.
+
+        Returns:
+            The rate, or ``None`` when fewer than two samples are in the window.
+        """
+        if self._count < 2:
+            return None
+        newest = self._index(self._count - 1)
+        cutoff = self._timestamps[newest] - window.total_seconds()
+        oldest = None
+        for i in range(self._count - 1):
+            if self._timestamps[self._index(i)] >= cutoff:
+                oldest = self._index(i)
+                break
+        if oldest is None:
+            return None
+        elapsed = self._timestamps[newest] - self._timestamps[oldest]
+        return ((self._usage[newest] - self._usage[oldest]) / 1000) / elapsed
+
+    def time_to_limit(self, allowance: int, window: timedelta = timedelta(minutes=30)) -> timedelta:
+        """Projected wall-clock time until usage reaches ``allowance``.
+
+        Args:
+            allowance: Daily allowance in milliseconds.
+            window: How far back to look when computing the burn rate.
+
+        Returns:
+            ``timedelta(0)`` if the allowance is already used, ``None`` if no
+            usage is currently being recorded, otherwise the projected time left.
+        """
+        latest = self.latest
+        if latest is None:
+            return None
+        remaining = allowance - latest
+        if remaining <= 0:
+            return timedelta(0)
+        rate = self.burn_rate(window)
+        if not rate or rate <= 0:
+            return None
+        return timedelta(seconds=(remaining / 1000) / rate)
@@ -5,3 +5,22 @@ import inspect
 def is_awaitable(func):
     """Check if a function is awaitable or not."""
     return inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func)
+
+def accepts_arguments(func, count: int) -> bool:
+    """Check if a callable can be called with the given number of positional arguments."""
+    try:
+        inspect.signature(func).bind(*([None] * count))
+    except TypeError:
+        return False
+    except ValueError:
+        # no signature available (some builtins), assume it accepts them
+        return True
+    return True
+
+async def run_callback(func, *args):
+    """Run a sync or async callback, dropping the arguments if it takes none."""
+    if args and not accepts_arguments(func, len(args)):
+        args = ()
+    result = func(*args)
+    if inspect.isawaitable(result):
+        await result
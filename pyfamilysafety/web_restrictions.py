@@ -0,0 +1,68 @@
+"""Cached web restrictions for a family member."""
+
+def normalise_website(website: str) -> str:
+    """Return the lookup key for a website."""
+    return website.strip().lower().rstrip("/")
+
+class WebRestrictions:
+    """A local view of the member's web restrictions.
+
+    Wraps the raw ``get_user_web_restrictions`` payload with an index of
+    exceptions by website, and is kept in sync with patches sent through
+    :meth:`pyfamilysafety.account.Account.update_web_restrictions`.
+
+    Attributes:
+        raw: The web restrictions JSON as last returned by the API, with
+            local patches applied to ``exceptions``.
+    """
+
+    def __init__(self, raw_response: dict) -> None:
+        self.raw = raw_response
+        self._exceptions: dict[str, dict] = {
+            normalise_website(exception["website"]): exception
+            for exception in raw_response.get("exceptions") or []
+        }
+
+    def __len__(self) -> int:
+        return len(self._exceptions)
+
+    def __contains__(self, website: str) -> bool:
+        return normalise_website(website) in self._exceptions
+
+    def get_exception(self, website: str) -> dict:
+        """Return the exception for a website, or ``None`` if there is none."""
+        return self._exceptions.get(normalise_website(website))
+
+    def is_allowed(self, website: str) -> bool:
+        """Return if a website is excepted as allowed (``True``) or blocked (``False``).
+
+        Returns:
+            ``None`` if the website has no exception.
+        """
+        exception = self.get_exception(website)
+        if exception is None:
+            return None
+        return exception.get("allowed")
+
+    @property
+    def allowed_websites(self) -> list[str]:
+        """Websites with an allow exception."""
+        return [x["website"] for x in self._exceptions.values() if x.get("allowed")]
+
+    @property
+    def blocked_websites(self) -> list[str]:
+        """Websites with a block exception."""
+        return [x["website"] for x in self._exceptions.values() if not x.get("allowed")]
+
+    def apply_operations(self, operations: list[dict]) -> None:
+        """Apply exception patch operations that were accepted by the API."""
+        for operation in operations:
+            if operation.get("path") != "/exceptions":
+                continue
+            value = operation.get("value") or {}
+            key = normalise_website(value.get("website", ""))
+            if operation.get("op") == "Add":
+                self._exceptions[key] = dict(value)
+            elif operation.get("op") == "Remove":
+                self._exceptions.pop(key, None)
+        self.raw["exceptions"] = list(self._exceptions.values())
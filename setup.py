@@ -15,7 +15,18 @@ with open('pyfamilysafety/_version.py', 'r', encoding='utf8') as version_file:
 
 REQUIREMENTS = [
     "aiohttp >= 3.7.0",
-    "python-dateutil >= 2.7.0"
+]
+
+ANALYTICS_REQUIREMENTS = [
+    "numpy >= 1.22",
+]
+
+PARQUET_REQUIREMENTS = [
+    "pyarrow >= 10",
+]
+
+HTTP2_REQUIREMENTS = [
+    "httpx[http2] >= 0.23",
 ]
 
 DEV_REQUIREMENTS = [
@@ -53,10 +64,13 @@ setuptools.setup(
     install_requires=REQUIREMENTS,
     extras_require={
         'dev': DEV_REQUIREMENTS,
+        'analytics': ANALYTICS_REQUIREMENTS,
+        'parquet': PARQUET_REQUIREMENTS,
+        'http2': HTTP2_REQUIREMENTS,
     },
     entry_points={
         'console_scripts': [
-            'pyfamilysafety=pyfamilysafety:main',
+            'pyfamilysafety=pyfamilysafety.cli:main',
         ]
     },
     python_requires='>=3.8, <4',
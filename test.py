@@ -21,16 +21,17 @@ async def main():
         except Exception as err:
             _LOGGER.critical(err)
 
-    while True:
-        for account in family_safety.accounts:
-            _LOGGER.debug("Discovered account %s, label %s", account.user_id, account.first_name)
-            _LOGGER.debug(account)
-            _LOGGER.debug("Usage today %s", account.today_screentime_usage)
+    for account in family_safety.accounts:
+        _LOGGER.debug("Discovered account %s, label %s", account.user_id, account.first_name)
+        _LOGGER.debug(account)
+        _LOGGER.debug("Usage today %s", account.today_screentime_usage)
 
-        _LOGGER.debug("ping")
-        await asyncio.sleep(15)
-        _LOGGER.debug("pong")
-        await family_safety.update()
+    family_safety.start_refresher()
+    try:
+        async for event in family_safety.events():
+            _LOGGER.debug(event)
+    finally:
+        await family_safety.stop_refresher()
 
 if __name__ == "__main__":
     logging.basicConfig(
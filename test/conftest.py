@@ -0,0 +1,133 @@
+"""Shared fixtures for the pyfamilysafety tests."""
+
+import copy
+
+import pytest
+
+from pyfamilysafety import Authenticator, FamilySafety
+from pyfamilysafety.transport import MemoryTransport
+
+TOKEN = {"access_token": "access", "expires_in": 3600, "refresh_token": "refresh", "user_id": "parent"}
+
+ROSTER = {
+    "members": [
+        {
+            "id": "child-1",
+            "role": "User",
+            "isDigitalSafetyEnabled": True,
+            "profilePicUrl": "",
+            "user": {"firstName": "Alex", "lastName": "Smith"},
+        },
+        {
+            "id": "child-2",
+            "role": "User",
+            "isDigitalSafetyEnabled": True,
+            "profilePicUrl": "",
+            "user": {"firstName": "Sam", "lastName": "Smith"},
+        },
+    ]
+}
+
+DEVICES = {
+    "devices": [
+        {
+            "deviceId": "g:xbox",
+            "deviceName": "Xbox",
+            "deviceClass": "Console",
+            "deviceMake": "Microsoft",
+            "deviceModel": "Series X",
+            "deviceFormFactor": "Console",
+            "osName": "Xbox",
+            "issues": [],
+            "states": [],
+            "lastSeenOn": "2024-01-01T00:00:00Z",
+        }
+    ]
+}
+
+DEVICE_USAGE = {
+    "deviceUsageAggregates": {
+        "totalScreenTime": 3600000,
+        "dailyAverage": 1800000.0,
+        "deviceAggregates": [{"deviceId": "xbox", "timeUsed": 3600000}],
+    }
+}
+
+APP_USAGE = {
+    "appActivity": [
+        {
+            "appId": "x:game",
+            "displayName": "Game",
+            "iconUrl": "",
+            "usage": 2400000,
+            "policy": {},
+            "blockState": "NotBlocked",
+            "isLegacyBlocked": False,
+        },
+        {
+            "appId": "appx:browser",
+            "displayName": "Browser",
+            "iconUrl": "",
+            "usage": 1200000,
+            "policy": {},
+            "blockState": "Blocked",
+            "isLegacyBlocked": False,
+        },
+    ]
+}
+
+OVERRIDES = {"lockablePlatforms": [{"appliesTo": "Xbox", "overrides": [], "devices": [{"deviceId": "g:xbox"}]}]}
+
+SPENDING = {"balances": [{"balance": 5.0, "currency": "GBP"}]}
+
+PENDING_REQUESTS = {
+    "pendingRequests": [
+        {
+            "id": "request-1",
+            "puid": "child-1",
+            "type": "DeviceScreenTime",
+            "platform": "Xbox",
+            "lockTime": "2024-01-01T20:00:00Z",
+            "requestedTime": 1704139200000,
+        },
+        {
+            "id": "request-2",
+            "puid": "child-2",
+            "type": "DeviceScreenTime",
+            "platform": "Windows",
+            "lockTime": "2024-01-01T20:00:00Z",
+            "requestedTime": 1704139200000,
+        },
+    ]
+}
+
+ROUTES = [
+    ("POST", r"oauth20_token", TOKEN),
+    ("GET", r"/v2/roster$", ROSTER),
+    ("GET", r"/v1/devices/", DEVICES),
+    ("GET", r"/deviceScreenTimeUsage/", DEVICE_USAGE),
+    ("GET", r"/activityReport/appUsage/", APP_USAGE),
+    ("GET", r"/devicelimits/[^/]+/overrides$", OVERRIDES),
+    ("GET", r"/v1/Spending/", SPENDING),
+    ("GET", r"/v1/PendingRequests$", PENDING_REQUESTS),
+]
+
+
+@pytest.fixture
+def transport() -> MemoryTransport:
+    """An in-memory transport answering every endpoint used by ``FamilySafety.update``."""
+    memory = MemoryTransport()
+    for method, pattern, body in ROUTES:
+        memory.add_route(method, pattern, copy.deepcopy(body))
+    return memory
+
+
+@pytest.fixture
+def connect(transport: MemoryTransport):
+    """Return a coroutine function creating a client on the in-memory transport."""
+
+    async def _connect() -> FamilySafety:
+        auth = await Authenticator.create("refresh", use_refresh_token=True, transport=transport)
+        return FamilySafety(auth)
+
+    return _connect
@@ -0,0 +1,141 @@
+"""Tests for independent account update subrequests."""
+
+import asyncio
+from datetime import timedelta
+
+from pyfamilysafety.exceptions import Unauthorized, UpdateFailed
+from pyfamilysafety.response import ApiResponse
+from pyfamilysafety.update_cycle import UpdateCycle
+
+ACCOUNT_ROUTES = [
+    r"/v1/devices/",
+    r"/deviceScreenTimeUsage/",
+    r"/activityReport/appUsage/",
+    r"/devicelimits/[^/]+/overrides$",
+    r"/v1/Spending/",
+]
+
+
+async def _hang(request):
+    await asyncio.Event().wait()
+
+
+def _update(transport, connect, responses: dict, **timeouts):
+    """Load the roster, replace account routes with ``responses`` and update child-1."""
+
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        for name, value in timeouts.items():
+            setattr(account, name, value)
+        for pattern, response in responses.items():
+            transport.add_route("GET", pattern, response)
+        account.spending.last_refreshed = None
+        calls = []
+        account.add_account_callback(lambda: calls.append(True))
+        before = dict(account.last_updated)
+        try:
+            await account.update()
+            return account, before, calls, None
+        except Exception as err:  # pylint: disable=broad-except
+            return account, before, calls, err
+        finally:
+            await family_safety.close()
+
+    return asyncio.run(run())
+
+
+def test_partial_failure_keeps_other_fields(transport, connect):
+    account, before, calls, error = _update(
+        transport, connect, {r"/v1/devices/": ConnectionError("unreachable")})
+    assert error is None
+    assert calls == [True]
+    assert account.last_updated["devices"] == before["devices"]
+    assert account.last_updated["screentime_usage"] > before["screentime_usage"]
+
+
+def test_all_failed_raises_update_failed(transport, connect):
+    account, _, calls, error = _update(
+        transport, connect, {pattern: ConnectionError("unreachable") for pattern in ACCOUNT_ROUTES})
+    assert isinstance(error, UpdateFailed)
+    assert error.user_id == "child-1"
+    assert len(error.errors) == len(ACCOUNT_ROUTES)
+    assert isinstance(error.__cause__, ConnectionError)
+    assert calls == []
+
+
+def test_deadline_counts_as_failure(transport, connect):
+    responses = {pattern: ConnectionError("unreachable") for pattern in ACCOUNT_ROUTES}
+    responses[r"/v1/devices/"] = _hang
+    _, _, calls, error = _update(
+        transport, connect, responses, update_timeout=0.05)
+    assert isinstance(error, UpdateFailed)
+    assert sum(isinstance(err, asyncio.TimeoutError) for err in error.errors) == 1
+    assert calls == []
+
+
+def test_hung_request_opens_circuit(transport, connect):
+    async def run():
+        family_safety = await connect()
+        api = family_safety._api
+        api.circuit_failure_threshold = 2
+        api.serve_stale = False
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        api.request_timeout = 0.01
+        transport.add_route("GET", r"/v1/devices/", _hang)
+        for _ in range(3):
+            await account.update()
+        await family_safety.close()
+        return account, api.circuit_metrics()["get_user_devices"]
+
+    account, metrics = asyncio.run(run())
+    assert metrics["state"] == "open"
+    assert metrics["failures"] == 2
+    assert metrics["rejected"] == 1
+    assert account.last_updated["screentime_usage"] > account.last_updated["devices"]
+
+
+def test_family_update_ignores_failed_account(transport, connect):
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        for pattern in ACCOUNT_ROUTES:
+            transport.add_route("GET", pattern, ConnectionError("unreachable"))
+        await family_safety.update()
+        await family_safety.close()
+
+    asyncio.run(run())
+
+
+def test_unauthorized_is_not_wrapped(transport, connect):
+    responses = {pattern: ConnectionError("unreachable") for pattern in ACCOUNT_ROUTES}
+    responses[r"/v1/devices/"] = ApiResponse(status=401)
+    _, _, _, error = _update(transport, connect, responses)
+    assert isinstance(error, Unauthorized)
+
+
+def test_midnight_clears_usage_until_new_reports_arrive(transport, connect):
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        today = UpdateCycle()
+        await account.update(today)
+        assert account.devices[0].today_time_used is not None
+        assert len(account.app_activity) == 2
+        for pattern in (r"/deviceScreenTimeUsage/", r"/activityReport/appUsage/"):
+            transport.add_route("GET", pattern, ConnectionError("unreachable"))
+        tomorrow = UpdateCycle(today.now + timedelta(days=1))
+        await account.update(tomorrow)
+        await family_safety.close()
+        return account, tomorrow
+
+    account, tomorrow = asyncio.run(run())
+    assert account.day == tomorrow.day
+    assert account.today_screentime_usage is None
+    assert account.screentime_usage is None
+    assert account.application_usage is None
+    assert len(account.app_activity) == 0
+    assert [device.today_time_used for device in account.devices] == [None]
@@ -0,0 +1,56 @@
+"""Tests for the usage analytics module."""
+
+from datetime import date
+
+import pytest
+
+from pyfamilysafety import analytics
+from pyfamilysafety.analytics import UsageAnalytics
+
+# totalScreenTime covers five devices, deviceAggregates only the top four
+REPORT = {
+    "deviceUsageAggregates": {
+        "totalScreenTime": 5000,
+        "deviceAggregates": [{"deviceId": f"g:device-{i}", "timeUsed": 1000} for i in range(4)],
+    }
+}
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def usage(request, monkeypatch) -> UsageAnalytics:
+    if not request.param:
+        monkeypatch.setattr(analytics, "np", None)
+    elif analytics.np is None:
+        pytest.skip("numpy not installed")
+    result = UsageAnalytics()
+    result.add_device_report("child-1", date(2024, 1, 1), REPORT)
+    result.add_device_report("child-1", date(2024, 1, 3), REPORT)
+    result.add_device_report("child-2", date(2024, 1, 1), {"deviceUsageAggregates": {"totalScreenTime": 700}})
+    return result
+
+
+def test_daily_totals_use_total_screen_time(usage):
+    assert usage.daily_totals("child-1") == {date(2024, 1, 1): 5000, date(2024, 1, 2): 0, date(2024, 1, 3): 5000}
+    assert usage.daily_totals(start=date(2024, 1, 1), end=date(2024, 1, 1)) == {date(2024, 1, 1): 5700}
+
+
+def test_daily_totals_range_follows_selected_member(usage):
+    usage.add_device_report("child-2", date(2024, 1, 5), {"deviceUsageAggregates": {"totalScreenTime": 100}})
+    assert list(usage.daily_totals("child-1")) == [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)]
+    assert usage.daily_totals("child-3") == {}
+    assert usage.daily_totals("child-3", date(2024, 1, 1), date(2024, 1, 2)) == {
+        date(2024, 1, 1): 0,
+        date(2024, 1, 2): 0,
+    }
+
+
+def test_device_totals_cover_listed_devices(usage):
+    assert usage.device_totals("child-1") == {f"device-{i}": 2000 for i in range(4)}
+
+
+def test_moving_average(usage):
+    assert usage.moving_average(2, "child-1") == {
+        date(2024, 1, 1): 5000.0,
+        date(2024, 1, 2): 2500.0,
+        date(2024, 1, 3): 2500.0,
+    }
@@ -0,0 +1,30 @@
+"""Tests for the lazy app activity report."""
+
+import copy
+
+import pytest
+
+from pyfamilysafety.application import AppActivityReport
+
+from .conftest import APP_USAGE
+
+
+def test_applications_stay_current_between_reports():
+    report = AppActivityReport(None, "child-1")
+    report.read_report(copy.deepcopy(APP_USAGE))
+    game = report.get_application("x:game")
+    updated = copy.deepcopy(APP_USAGE)
+    updated["appActivity"][0]["usage"] = 3000000
+    report.read_report(updated)
+    assert report.get_application("x:game") is game
+    assert game.usage == 50
+
+
+def test_apps_missing_from_new_report_are_dropped():
+    report = AppActivityReport(None, "child-1")
+    report.read_report(copy.deepcopy(APP_USAGE))
+    report.get_application("appx:browser")
+    report.read_report({"appActivity": copy.deepcopy(APP_USAGE["appActivity"][:1])})
+    assert [x.app_id for x in report.applications()] == ["x:game"]
+    with pytest.raises(IndexError):
+        report.get_application("appx:browser")
@@ -0,0 +1,105 @@
+"""Tests for the command line tool."""
+
+import json
+
+import pytest
+
+from pyfamilysafety import cli
+from pyfamilysafety.enum import ChangeEventType
+from pyfamilysafety.events import ChangeEvent
+
+
+@pytest.fixture
+def run_cli(tmp_path, monkeypatch, connect):
+    """Run the CLI against the in-memory transport, returning the exit code."""
+    clients = []
+
+    async def _connect(args):
+        family_safety = await connect()
+        clients.append(family_safety)
+        return family_safety
+
+    monkeypatch.setattr(cli, "_connect", _connect)
+    token_file = tmp_path / "token"
+
+    def _run(*argv) -> int:
+        return cli.main(["--token-file", str(token_file), *argv])
+
+    _run.clients = clients
+    _run.token_file = token_file
+    return _run
+
+
+def _lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf8").splitlines()]
+
+
+@pytest.mark.parametrize("argv", [
+    ["export"],
+    ["export", "--start", "2024-13-01"],
+    ["export", "--start", "2024-01-01", "--kind", "unknown"],
+    ["export", "--start", "2024-01-01", "-o", "out.json", "--output-dir", "out"],
+    ["export", "--start", "2024-01-01", "--format", "xml"],
+    ["watch", "--min-interval", "soon"],
+])
+def test_invalid_arguments(argv, capsys):
+    with pytest.raises(SystemExit) as err:
+        cli.build_parser().parse_args(argv)
+    assert err.value.code == 2
+
+
+@pytest.mark.parametrize(("argv", "message"), [
+    (["--format", "parquet"], "Parquet exports require --output-dir."),
+    (["--output-dir", "out", "--kind", "pending"], "Pending requests cannot be exported with --output-dir."),
+])
+def test_export_rejects_invalid_combinations(run_cli, argv, message):
+    with pytest.raises(SystemExit, match=message):
+        run_cli("export", "--start", "2024-01-01", *argv)
+    assert run_cli.clients == []
+
+
+def test_export_selected_members_and_kinds(run_cli, tmp_path):
+    output = tmp_path / "records.ndjson"
+    assert run_cli(
+        "export", "--start", "2024-01-01", "--end", "2024-01-02",
+        "--user", "child-1", "--kind", "usage", "-o", str(output)) == 0
+    records = _lines(output)
+    assert [(x["kind"], x["user_id"], x["date"]) for x in records] == [
+        ("usage", "child-1", "2024-01-01"),
+        ("usage", "child-1", "2024-01-02"),
+    ]
+    assert run_cli.token_file.read_text(encoding="utf8") == "refresh"
+
+
+def test_export_pending_requests_enables_experimental(run_cli, tmp_path):
+    output = tmp_path / "records.csv"
+    assert run_cli("export", "--start", "2024-01-01", "--kind", "pending", "--format", "csv", "-o", str(output)) == 0
+    assert run_cli.clients[0].experimental is True
+    rows = output.read_text(encoding="utf8").splitlines()
+    assert rows[0].startswith("kind,")
+    assert len(rows) == 3
+
+
+def test_export_to_partitions(run_cli, tmp_path, capsys):
+    output_dir = tmp_path / "warehouse"
+    assert run_cli(
+        "export", "--start", "2024-01-01", "--end", "2024-01-02",
+        "--format", "csv", "--output-dir", str(output_dir)) == 0
+    assert "Exported 2 day(s)" in capsys.readouterr().err
+    assert len(list(output_dir.glob("usage/user=*/date=*.csv"))) == 4
+
+
+def test_watch_streams_events(run_cli, monkeypatch, capsys):
+    refresher = []
+
+    async def events(self, max_queue=None):
+        yield ChangeEvent(ChangeEventType.USAGE_CHANGED, "child-1", None, 1, 2)
+
+    monkeypatch.setattr(cli.FamilySafety, "events", events)
+    monkeypatch.setattr(cli.FamilySafety, "start_refresher", lambda self, *args: refresher.append(args))
+    assert run_cli("watch", "--pending", "--min-interval", "5", "--max-interval", "60") == 0
+    event = json.loads(capsys.readouterr().out)
+    assert (event["type"], event["user_id"], event["new_value"]) == ("usage_changed", "child-1", 2)
+    assert refresher == [(5.0, 60.0)]
+    assert run_cli.clients[0].experimental is True
+    assert run_cli.token_file.exists()
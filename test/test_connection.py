@@ -0,0 +1,55 @@
+"""Tests for the shared connection pool."""
+
+import asyncio
+
+import pytest
+
+from pyfamilysafety.authenticator import Authenticator
+from pyfamilysafety.connection import create_client_session
+from pyfamilysafety.const import HTTP_CONNECT_TIMEOUT, HTTP_TOTAL_TIMEOUT
+from pyfamilysafety.transport import MemoryTransport
+
+
+def test_session_limits_total_request_time():
+    async def run():
+        session = create_client_session()
+        try:
+            return session.timeout
+        finally:
+            await session.close()
+
+    timeout = asyncio.run(run())
+    assert timeout.total == HTTP_TOTAL_TIMEOUT
+    assert timeout.connect == HTTP_CONNECT_TIMEOUT
+
+
+class _SlowPrewarmTransport(MemoryTransport):
+    """Records whether the prewarm was stopped before the transport closed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = []
+
+    async def prewarm(self, urls: list[str] = None) -> None:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.calls.append("prewarm cancelled")
+            raise
+
+    async def close(self) -> None:
+        self.calls.append("close")
+
+
+async def _unreachable(request):
+    # let the prewarm start first
+    await asyncio.sleep(0.01)
+    raise ConnectionError("unreachable")
+
+
+def test_failed_login_stops_prewarm_before_closing():
+    transport = _SlowPrewarmTransport()
+    transport.add_route("POST", r"oauth20_token", _unreachable)
+    with pytest.raises(ConnectionError):
+        asyncio.run(Authenticator.create("refresh", use_refresh_token=True, transport=transport))
+    assert transport.calls == ["prewarm cancelled", "close"]
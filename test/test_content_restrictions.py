@@ -0,0 +1,28 @@
+"""Tests for content restrictions."""
+
+import asyncio
+
+RESTRICTIONS = {"appExceptions": [{"appId": "x:game", "allowed": False}]}
+
+
+def test_patch_clears_cache(transport, connect):
+    operations = [{"op": "Add", "path": "/example", "value": 1}]
+
+    async def run():
+        transport.add_route("GET", r"/v1/ContentRestrictions/", RESTRICTIONS)
+        transport.add_route("PATCH", r"/v1/ContentRestrictions/", {})
+        family_safety = await connect()
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        await account.get_content_restrictions()
+        assert account.content_restrictions.blocked_apps == ["x:game"]
+        results = await family_safety.update_content_restrictions({"child-1": operations})
+        assert account.content_restrictions is None
+        await account.get_content_restrictions()
+        await family_safety.close()
+        return results
+
+    assert asyncio.run(run()) == {"child-1": {}}
+    patches = [x["json"] for x in transport.requests if x["method"] == "PATCH"]
+    assert patches == [{"operations": operations}]
+    assert len([x for x in transport.requests if "/ContentRestrictions/" in x["url"] and x["method"] == "GET"]) == 2
@@ -0,0 +1,61 @@
+"""Tests for applying device limit schedules."""
+
+import asyncio
+
+from pyfamilysafety.enum import DayOfWeek, OverrideTarget
+from pyfamilysafety.schedule import DailyRestriction, DeviceLimitsSchedule
+
+
+def _schedule(minutes: int) -> DeviceLimitsSchedule:
+    return DeviceLimitsSchedule(
+        OverrideTarget.XBOX, {day: DailyRestriction.from_minutes(minutes) for day in DayOfWeek}
+    )
+
+
+def _patches(transport) -> list[dict]:
+    return [x["json"] for x in transport.requests if x["method"] == "PATCH" and "/devicelimits/schedules/" in x["url"]]
+
+
+def _apply(transport, connect, *calls) -> list:
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        results = [await call(account) for call in calls]
+        await family_safety.close()
+        return results
+
+    transport.add_route("PATCH", r"/devicelimits/schedules/", {})
+    return asyncio.run(run())
+
+
+def test_unchanged_schedule_is_sent_by_default(transport, connect):
+    schedule = _schedule(60)
+    _apply(transport, connect, lambda a: a.set_device_limits(schedule), lambda a: a.set_device_limits(schedule))
+    assert len(_patches(transport)) == 2
+
+
+def test_skip_unchanged_is_opt_in(transport, connect):
+    results = _apply(
+        transport,
+        connect,
+        lambda a: a.set_device_limits(_schedule(60), skip_unchanged=True),
+        lambda a: a.set_device_limits(_schedule(60), skip_unchanged=True),
+        lambda a: a.set_device_limits(_schedule(90), skip_unchanged=True),
+    )
+    assert results[1] is None
+    assert [x["dailyRestrictions"]["monday"]["allowance"] for x in _patches(transport)] == [3600000, 5400000]
+
+
+def test_update_device_limits_sends_every_platform_by_default(transport, connect):
+    schedule = _schedule(60)
+    results = _apply(
+        transport,
+        connect,
+        lambda a: a.update_device_limits([schedule]),
+        lambda a: a.update_device_limits([schedule]),
+        lambda a: a.update_device_limits([schedule], skip_unchanged=True),
+    )
+    assert results[1] == {OverrideTarget.XBOX: {}}
+    assert results[2] == {}
+    assert len(_patches(transport)) == 2
@@ -0,0 +1,53 @@
+"""Tests for the order writes and bulk reads are dispatched in."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from pyfamilysafety.enum import OverrideTarget, OverrideType, RequestPriority
+
+from .conftest import APP_USAGE, DEVICE_USAGE, OVERRIDES
+
+# custom-range reports queued before the write, two requests each
+BULK_REPORTS = 60
+
+
+def _gated(body, name: str, dispatched: list, gate: asyncio.Event = None):
+    async def respond(request):
+        dispatched.append(name)
+        if gate is not None:
+            await gate.wait()
+        return body
+
+    return respond
+
+
+def test_high_priority_write_dispatched_before_queued_bulk(transport, connect):
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        dispatcher = family_safety._api.dispatcher
+        dispatched = []
+        gate = asyncio.Event()
+        transport.add_route("GET", r"/deviceScreenTimeUsage/", _gated(DEVICE_USAGE, "bulk", dispatched, gate))
+        transport.add_route("GET", r"/activityReport/appUsage/", _gated(APP_USAGE, "bulk", dispatched, gate))
+        transport.add_route("POST", r"/devicelimits/[^/]+/overrides$", _gated(OVERRIDES, "write", dispatched))
+        end = datetime.now().astimezone()
+        reads = [
+            asyncio.ensure_future(account.get_screentime_usage(end - timedelta(days=day + 1), end))
+            for day in range(BULK_REPORTS)
+        ]
+        while not dispatcher.metrics()["lanes"][str(RequestPriority.BULK)]["waiting"]:
+            await asyncio.sleep(0)
+        # every bulk request holding a slot is blocked on the gate
+        await asyncio.wait_for(account.override_device(OverrideTarget.XBOX, OverrideType.CANCEL), timeout=5)
+        queued = dispatcher.metrics()["lanes"][str(RequestPriority.BULK)]["waiting"]
+        gate.set()
+        await asyncio.gather(*reads)
+        await family_safety.close()
+        return dispatched, queued, dispatcher.limit - dispatcher.reserved
+
+    dispatched, queued, bulk_slots = asyncio.run(run())
+    assert queued > 0
+    assert dispatched.index("write") == bulk_slots
+    assert dispatched.count("bulk") == BULK_REPORTS * 2
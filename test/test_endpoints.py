@@ -0,0 +1,90 @@
+"""Tests for the endpoint registry and generated request methods."""
+
+import asyncio
+import inspect
+from datetime import datetime, timedelta
+
+import pytest
+
+from pyfamilysafety.api import FamilySafetyAPI
+from pyfamilysafety.authenticator import Authenticator
+from pyfamilysafety.endpoints import ENDPOINT_REGISTRY
+from pyfamilysafety.enum import RequestPriority
+from pyfamilysafety.response import ApiResponse
+from pyfamilysafety.transport import Transport
+
+
+class ConstantTransport(Transport):
+    """Returns the same response for every request and records the URLs."""
+
+    def __init__(self, body: bytes = b'{"devices": []}') -> None:
+        self.body = body
+        self.urls: list[str] = []
+
+    async def request(self, method, url, headers=None, json=None, data=None) -> ApiResponse:
+        self.urls.append(url)
+        return ApiResponse(200, {}, self.body, "application/json")
+
+
+def _api(transport: Transport) -> FamilySafetyAPI:
+    auth = Authenticator(transport=transport)
+    auth._access_token = "access"
+    auth.expires = datetime.now() + timedelta(hours=1)
+    return FamilySafetyAPI(auth)
+
+
+def test_generated_methods_have_signatures():
+    signature = inspect.signature(FamilySafetyAPI.async_get_user_web_activity)
+    assert list(signature.parameters) == [
+        "self", "user_id", "begin_time", "end_time", "allow_status", "platform", "priority"
+    ]
+    assert signature.return_annotation is ApiResponse
+    assert "body" in inspect.signature(FamilySafetyAPI.async_update_content_restrictions).parameters
+
+
+def test_generated_method_builds_url():
+    transport = ConstantTransport()
+
+    async def run():
+        return await _api(transport).async_get_user_web_activity("child-1", "b", "e", "Allowed")
+
+    assert asyncio.run(run())["json"] == {"devices": []}
+    assert transport.urls == [
+        ENDPOINT_REGISTRY["get_user_web_activity"].build_url(
+            USER_ID="child-1", BEGIN_TIME="b", END_TIME="e", ALLOW_STATUS="Allowed"
+        )
+    ]
+
+
+def test_generated_method_passes_priority():
+    async def run():
+        api = _api(ConstantTransport())
+        await api.async_get_user_web_activity("child-1", "b", "e", "Allowed", priority=RequestPriority.BULK)
+        return api.dispatch_metrics()["lanes"]
+
+    lanes = asyncio.run(run())
+    assert lanes[str(RequestPriority.BULK)]["requests"] == 1
+    assert lanes[str(RequestPriority.NORMAL)]["requests"] == 0
+
+
+def test_one_transport_call_per_request():
+    transport = ConstantTransport()
+
+    async def run():
+        api = _api(transport)
+        for _ in range(10):
+            await api.send_request("get_user_devices", USER_ID="child-1")
+
+    asyncio.run(run())
+    assert len(transport.urls) == 10
+
+
+def test_response_body_is_parsed_on_first_read():
+    async def run():
+        return await _api(ConstantTransport(b"not json")).send_request("get_user_devices", USER_ID="child-1")
+
+    response = asyncio.run(run())
+    assert response["status"] == 200
+    assert response["text"] == "not json"
+    with pytest.raises(ValueError):
+        response["json"]  # pylint: disable=pointless-statement
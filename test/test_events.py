@@ -0,0 +1,123 @@
+"""Tests for change events."""
+
+import asyncio
+import copy
+
+from pyfamilysafety.enum import ChangeEventType
+from pyfamilysafety.events import ChangeEvent, diff_account, diff_pending_requests
+
+from .conftest import APP_USAGE, DEVICES, PENDING_REQUESTS
+
+BASELINE = {
+    "usage": 3600000,
+    "devices": {"xbox": (False, 3600000), "pc": (False, 0)},
+    "apps": {"x:game": (False, 40.0), "appx:browser": (True, 20.0)},
+    "balance": (5.0, "GBP"),
+}
+
+
+def _changed(**changes) -> dict:
+    snapshot = copy.deepcopy(BASELINE)
+    snapshot.update(changes)
+    return snapshot
+
+
+def _types(events: list[ChangeEvent]) -> list[tuple]:
+    return sorted((str(event.type), event.target) for event in events)
+
+
+def test_no_changes():
+    assert not diff_account("child-1", BASELINE, _changed())
+
+
+def test_device_changes():
+    new = _changed(devices={"xbox": (True, 3700000), "phone": (False, 0)})
+    events = diff_account("child-1", BASELINE, new)
+    assert _types(events) == [
+        ("device_added", "phone"),
+        ("device_blocked", "xbox"),
+        ("device_removed", "pc"),
+        ("device_usage_changed", "xbox"),
+    ]
+    usage = [x for x in events if x.type is ChangeEventType.DEVICE_USAGE_CHANGED][0]
+    assert (usage.user_id, usage.old_value, usage.new_value) == ("child-1", 3600000, 3700000)
+
+
+def test_app_changes():
+    new = _changed(apps={"x:game": (False, 45.0), "appx:browser": (False, 20.0), "x:new": (False, 1.0)})
+    assert _types(diff_account("child-1", BASELINE, new)) == [
+        ("app_added", "x:new"),
+        ("app_unblocked", "appx:browser"),
+        ("app_usage_changed", "x:game"),
+    ]
+    assert _types(diff_account("child-1", BASELINE, _changed(apps={}))) == [
+        ("app_removed", "appx:browser"),
+        ("app_removed", "x:game"),
+    ]
+
+
+def test_usage_and_balance_changes():
+    events = diff_account("child-1", BASELINE, _changed(usage=3700000, balance=(2.5, "GBP")))
+    assert _types(events) == [("balance_changed", None), ("usage_changed", None)]
+
+
+def test_pending_request_changes():
+    old = {request["id"]: request for request in PENDING_REQUESTS["pendingRequests"][:1]}
+    new = {request["id"]: request for request in PENDING_REQUESTS["pendingRequests"][1:]}
+    assert _types(diff_pending_requests(old, new)) == [
+        ("pending_request_created", "request-2"),
+        ("pending_request_resolved", "request-1"),
+    ]
+
+
+def test_update_publishes_changes(transport, connect):
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        events = family_safety.events()
+        first = asyncio.ensure_future(events.__anext__())
+        await asyncio.sleep(0)
+        devices = copy.deepcopy(DEVICES)
+        devices["devices"][0]["deviceId"] = "g:pc"
+        app_usage = copy.deepcopy(APP_USAGE)
+        app_usage["appActivity"][0]["usage"] += 60000
+        transport.add_route("GET", r"/v1/devices/", devices)
+        transport.add_route("GET", r"/activityReport/appUsage/", app_usage)
+        await family_safety.update()
+        received = [await first]
+        while True:
+            try:
+                received.append(await asyncio.wait_for(events.__anext__(), 0.01))
+            except asyncio.TimeoutError:
+                break
+        await events.aclose()
+        await family_safety.close()
+        return received
+
+    received = asyncio.run(run())
+    for user_id in ("child-1", "child-2"):
+        assert _types([x for x in received if x.user_id == user_id]) == [
+            ("app_usage_changed", "x:game"),
+            ("device_added", "pc"),
+            ("device_removed", "xbox"),
+        ]
+
+
+def test_slow_consumer_drops_oldest_events(connect):
+    def event(index: int) -> ChangeEvent:
+        return ChangeEvent(ChangeEventType.USAGE_CHANGED, "child-1", None, index, index + 1)
+
+    async def run():
+        family_safety = await connect()
+        events = family_safety.events(max_queue=2)
+        first = asyncio.ensure_future(events.__anext__())
+        await asyncio.sleep(0)
+        family_safety._publish_events([event(0)])
+        received = [await first]
+        family_safety._publish_events([event(index) for index in range(1, 6)])
+        received.extend([await events.__anext__(), await events.__anext__()])
+        await events.aclose()
+        await family_safety.close()
+        return received
+
+    assert [x.old_value for x in asyncio.run(run())] == [0, 4, 5]
@@ -0,0 +1,42 @@
+"""Tests for partitioned exports."""
+
+import asyncio
+import csv
+from datetime import date
+
+from pyfamilysafety.export import USAGE, export_partitions, partition_path
+
+START = date(2024, 1, 1)
+END = date(2024, 1, 2)
+
+
+def _export(transport, connect, directory, user_ids) -> tuple[list[date], list[str]]:
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        transport.requests.clear()
+        accounts = [family_safety.get_account(user_id) for user_id in user_ids]
+        days = await export_partitions(accounts, START, END, directory, "csv")
+        urls = [x["url"] for x in transport.requests]
+        await family_safety.close()
+        return days, urls
+
+    return asyncio.run(run())
+
+
+def test_partitions_are_written_per_member(tmp_path, transport, connect):
+    days, _ = _export(transport, connect, tmp_path, ["child-1"])
+    assert days == [START, END]
+    path = partition_path(tmp_path, USAGE, "child-1", START, "csv")
+    assert path == tmp_path / "usage" / "user=child-1" / "date=2024-01-01.csv"
+    with open(path, encoding="utf8", newline="") as stream:
+        assert [row["user_id"] for row in csv.DictReader(stream)] == ["child-1"]
+
+
+def test_adding_a_member_does_not_skip_their_days(tmp_path, transport, connect):
+    _export(transport, connect, tmp_path, ["child-1"])
+    days, urls = _export(transport, connect, tmp_path, ["child-1", "child-2"])
+    assert days == [START, END]
+    assert urls and all("child-2" in url for url in urls)
+    assert partition_path(tmp_path, USAGE, "child-2", END, "csv").exists()
+    assert _export(transport, connect, tmp_path, ["child-1", "child-2"])[0] == []
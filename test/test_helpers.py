@@ -0,0 +1,48 @@
+"""Tests for datetime localisation across daylight saving changes."""
+
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from pyfamilysafety.helpers import format_query_time, localise_datetime, standardise_datetime
+from pyfamilysafety.update_cycle import UpdateCycle
+
+pytestmark = pytest.mark.skipif(not hasattr(time, "tzset"), reason="requires time.tzset")
+
+
+@pytest.fixture(autouse=True)
+def london(monkeypatch):
+    monkeypatch.setenv("TZ", "Europe/London")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_naive_datetimes_use_the_offset_for_that_date():
+    assert localise_datetime(datetime(2024, 1, 15, 12)).utcoffset() == timedelta(0)
+    assert localise_datetime(datetime(2024, 7, 15, 12)).utcoffset() == timedelta(hours=1)
+    assert standardise_datetime(datetime(2024, 7, 15, 12)) == datetime(2024, 7, 15, 11, tzinfo=timezone.utc)
+
+
+def test_aware_datetimes_keep_their_instant():
+    before = datetime(2024, 3, 31, 0, 30, tzinfo=timezone.utc)
+    after = datetime(2024, 3, 31, 1, 30, tzinfo=timezone.utc)
+    assert localise_datetime(before).hour == 0
+    assert localise_datetime(after).hour == 2
+    assert localise_datetime(after) == after
+    assert standardise_datetime(after) == after
+
+
+def test_query_times_follow_daylight_saving():
+    assert format_query_time(datetime(2024, 3, 30, 12)).endswith("%2B0000")
+    assert format_query_time(datetime(2024, 3, 31, 12)).endswith("%2B0100")
+
+
+def test_update_cycle_spans_a_daylight_saving_day():
+    cycle = UpdateCycle(datetime(2024, 3, 31, 12, tzinfo=timezone.utc))
+    assert cycle.day == date(2024, 3, 31)
+    assert cycle.start_time.utcoffset() == timedelta(0)
+    assert cycle.end_time.utcoffset() == timedelta(hours=1)
+    assert cycle.end_time - cycle.start_time == timedelta(hours=22, minutes=59, seconds=59)
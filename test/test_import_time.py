@@ -0,0 +1,36 @@
+"""Tests for the cost of importing the package."""
+
+import subprocess
+import sys
+
+# cumulative import time budget for ``import pyfamilysafety``, in microseconds;
+# loading aiohttp alone takes several times this
+IMPORT_TIME_BUDGET = 50_000
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_is_within_budget():
+    times = _import_times("import pyfamilysafety")
+    assert times["pyfamilysafety"] < IMPORT_TIME_BUDGET
+    assert "aiohttp" not in times
+
+
+def test_public_names_are_loaded_on_access():
+    times = _import_times("import pyfamilysafety; pyfamilysafety.FamilySafety")
+    assert "aiohttp" in times
@@ -0,0 +1,80 @@
+"""Tests and memory benchmark for lean mode."""
+
+import asyncio
+import gc
+import tracemalloc
+
+from .conftest import APP_USAGE
+
+# apps in the simulated activity report
+APP_COUNT = 500
+
+
+def _large_app_usage() -> dict:
+    app = APP_USAGE["appActivity"][0]
+    return {
+        "appActivity": [
+            {
+                **app,
+                "appId": f"x:game-{index}",
+                "displayName": f"Game {index}",
+                "iconUrl": f"https://store-images.example.com/icons/{index:064d}.png",
+                # fields the client does not read, dropped in lean mode
+                "usageByDevice": [{"deviceId": f"g:device-{x}", "usage": 600000} for x in range(4)],
+                "categories": ["Games", "Entertainment"],
+            }
+            for index in range(APP_COUNT)
+        ]
+    }
+
+
+def _retained(transport, connect, lean: bool) -> int:
+    """Return the bytes still allocated by a client after one update."""
+    transport.add_route("GET", r"/activityReport/appUsage/", _large_app_usage())
+
+    async def run():
+        family_safety = await connect()
+        family_safety.lean = lean
+        # cached responses are kept in both modes, measure the accounts only
+        family_safety._api.serve_stale = False
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+        await family_safety.update()
+        transport.requests.clear()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        await family_safety.close()
+        return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    tracemalloc.start()
+    try:
+        return asyncio.run(run())
+    finally:
+        tracemalloc.stop()
+
+
+def test_lean_mode_keeps_serving_stale(transport, connect):
+    async def run():
+        family_safety = await connect()
+        family_safety.lean = True
+        family_safety._api.circuit_failure_threshold = 1
+        await family_safety.update()
+        transport.add_route("GET", r"/deviceScreenTimeUsage/", ConnectionError("unreachable"))
+        await family_safety.update()
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        metrics = family_safety._api.circuit_metrics()["get_user_device_screentime_usage"]
+        await family_safety.close()
+        return family_safety, account, metrics
+
+    family_safety, account, metrics = asyncio.run(run())
+    assert family_safety._api.serve_stale is True
+    assert metrics["stale_served"] > 0
+    assert account.screentime_usage is None
+    assert account.today_screentime_usage == 3600000
+
+
+def test_lean_mode_retains_less(transport, connect):
+    normal = _retained(transport, connect, False)
+    lean = _retained(transport, connect, True)
+    assert lean < normal / 2
@@ -0,0 +1,58 @@
+"""Tests for pending request indexes and delta callbacks."""
+
+import asyncio
+import copy
+
+from .conftest import PENDING_REQUESTS
+
+
+def _pending(*requests) -> dict:
+    return {"pendingRequests": list(requests)}
+
+
+def test_callbacks_receive_only_changes(transport, connect):
+    first, second = copy.deepcopy(PENDING_REQUESTS["pendingRequests"])
+    third = {**copy.deepcopy(first), "id": "request-3"}
+    extended = {**first, "requestedTime": first["requestedTime"] + 60000}
+
+    async def run():
+        family_safety = await connect()
+        family_safety.experimental = True
+        calls = []
+        no_arguments = []
+
+        async def on_change(added, removed, updated):
+            calls.append(([x["id"] for x in added], [x["id"] for x in removed], [x["id"] for x in updated]))
+
+        family_safety.add_pending_request_callback(on_change)
+        family_safety.add_pending_request_callback(lambda: no_arguments.append(True))
+        await family_safety.update()
+        await family_safety.update()
+        transport.add_route("GET", r"/v1/PendingRequests$", _pending(extended, third))
+        await family_safety.update()
+        by_member = family_safety.get_account_requests("child-1")
+        await family_safety.close()
+        return calls, no_arguments, by_member
+
+    calls, no_arguments, by_member = asyncio.run(run())
+    assert calls == [
+        (["request-1", "request-2"], [], []),
+        (["request-3"], ["request-2"], ["request-1"]),
+    ]
+    assert len(no_arguments) == 2
+    assert sorted(x["id"] for x in by_member) == ["request-1", "request-3"]
+
+
+def test_non_screen_time_requests_are_ignored(transport, connect):
+    other = {**copy.deepcopy(PENDING_REQUESTS["pendingRequests"][0]), "id": "request-9", "type": "AppUnblock"}
+    transport.add_route("GET", r"/v1/PendingRequests$", _pending(other))
+
+    async def run():
+        family_safety = await connect()
+        family_safety.experimental = True
+        await family_safety.update()
+        pending = family_safety.pending_requests
+        await family_safety.close()
+        return pending
+
+    assert asyncio.run(run()) == []
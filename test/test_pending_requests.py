@@ -0,0 +1,72 @@
+"""Tests for approving and denying pending requests."""
+
+import asyncio
+
+import pytest
+
+from pyfamilysafety.exceptions import HttpException
+
+
+def _posted(transport, action: str) -> list[dict]:
+    return [
+        x["json"] for x in transport.requests if x["method"] == "POST" and f"/pendingRequests/{action}/" in x["url"]
+    ]
+
+
+def test_approve_sends_extension_in_milliseconds(transport, connect):
+    async def run():
+        transport.add_route("POST", r"/pendingRequests/approve/", None, status=204)
+        family_safety = await connect()
+        family_safety.experimental = True
+        await family_safety.update()
+        assert await family_safety.approve_pending_request("request-1", extension_time=1800)
+        await family_safety.close()
+
+    asyncio.run(run())
+    posted = _posted(transport, "approve")
+    assert len(posted) == 1
+    assert posted[0]["request"]["extension"] == 1800 * 1000
+
+
+def test_batch_approve_sends_extension_for_every_request(transport, connect):
+    async def run():
+        transport.add_route("POST", r"/pendingRequests/approve/", None, status=204)
+        family_safety = await connect()
+        family_safety.experimental = True
+        await family_safety.update()
+        results = await family_safety.approve_pending_requests(["request-1", "request-2"], extension_time=60)
+        await family_safety.close()
+        return results
+
+    assert asyncio.run(run()) == {"request-1": True, "request-2": True}
+    assert [x["request"]["extension"] for x in _posted(transport, "approve")] == [60000, 60000]
+
+
+def test_batch_keeps_results_when_refresh_fails(transport, connect):
+    async def run():
+        transport.add_route("POST", r"/pendingRequests/deny/", None, status=204)
+        family_safety = await connect()
+        family_safety.experimental = True
+        await family_safety.update()
+        transport.add_route("GET", r"/v1/PendingRequests$", {}, status=503)
+        results = await family_safety.deny_pending_requests(["request-1", "request-2"])
+        await family_safety.close()
+        return results
+
+    assert asyncio.run(run()) == {"request-1": True, "request-2": True}
+
+
+def test_single_request_raises_when_refresh_fails(transport, connect):
+    async def run():
+        transport.add_route("POST", r"/pendingRequests/deny/", None, status=204)
+        family_safety = await connect()
+        family_safety.experimental = True
+        await family_safety.update()
+        transport.add_route("GET", r"/v1/PendingRequests$", {}, status=503)
+        try:
+            await family_safety.deny_pending_request("request-1")
+        finally:
+            await family_safety.close()
+
+    with pytest.raises(HttpException):
+        asyncio.run(run())
@@ -0,0 +1,93 @@
+"""Tests for the adaptive background refresher."""
+
+import asyncio
+import copy
+
+import pytest
+
+from .conftest import DEVICE_USAGE
+
+ACCOUNT_ROUTES = [
+    r"/v1/devices/",
+    r"/deviceScreenTimeUsage/",
+    r"/activityReport/appUsage/",
+    r"/devicelimits/[^/]+/overrides$",
+    r"/v1/Spending/",
+]
+
+
+def _intervals(monkeypatch, connect, setup, cycles: int = 5, **kwargs) -> list[float]:
+    """Run the refresher until it has scheduled ``cycles`` delays and return them."""
+    sleep = asyncio.sleep
+    delays = []
+    done = asyncio.Event()
+
+    async def record(delay, *args, **kw):
+        # refresher delays are whole seconds here; anything shorter is the library's own
+        if delay >= 1:
+            delays.append(delay)
+            if len(delays) >= cycles:
+                done.set()
+        await sleep(0)
+
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        setup(family_safety)
+        monkeypatch.setattr(asyncio, "sleep", record)
+        family_safety.start_refresher(**kwargs)
+        await done.wait()
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        await family_safety.stop_refresher()
+        await family_safety.close()
+
+    asyncio.run(run())
+    return delays[:cycles]
+
+
+def test_idle_refreshes_slow_down(monkeypatch, connect):
+    delays = _intervals(monkeypatch, connect, lambda family_safety: None, min_interval=1, max_interval=4)
+    assert delays == [1.5, 2.25, 3.375, 4, 4]
+
+
+def test_changes_keep_minimum_interval(monkeypatch, transport, connect):
+    usage = copy.deepcopy(DEVICE_USAGE)
+
+    def growing_usage(request):
+        usage["deviceUsageAggregates"]["totalScreenTime"] += 60000
+        return usage
+
+    transport.add_route("GET", r"/deviceScreenTimeUsage/", growing_usage)
+    delays = _intervals(monkeypatch, connect, lambda family_safety: None, min_interval=1, max_interval=4)
+    assert delays == [1, 1, 1, 1, 1]
+
+
+def test_pending_requests_keep_minimum_interval(monkeypatch, connect):
+    def setup(family_safety):
+        family_safety.experimental = True
+
+    delays = _intervals(monkeypatch, connect, setup, min_interval=1, max_interval=4)
+    assert delays == [1, 1, 1, 1, 1]
+
+
+def test_failures_back_off(monkeypatch, transport, connect):
+    def setup(family_safety):
+        # open circuits then fail fast instead of serving cached responses
+        family_safety._api.serve_stale = False
+        for pattern in ACCOUNT_ROUTES:
+            transport.add_route("GET", pattern, ConnectionError("unreachable"))
+
+    delays = _intervals(monkeypatch, connect, setup, cycles=6, min_interval=100, max_interval=200)
+    assert delays == [200, 400, 800, 900, 900, 900]
+
+
+def test_rejects_invalid_intervals(connect):
+    async def run():
+        family_safety = await connect()
+        with pytest.raises(ValueError):
+            family_safety.start_refresher(min_interval=0)
+        with pytest.raises(ValueError):
+            family_safety.start_refresher(min_interval=10, max_interval=5)
+        await family_safety.close()
+
+    asyncio.run(run())
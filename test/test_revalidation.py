@@ -0,0 +1,57 @@
+"""Tests for background revalidation."""
+
+import asyncio
+
+from .conftest import DEVICES
+
+
+def test_update_joins_running_revalidation(transport, connect):
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        release = asyncio.Event()
+
+        async def slow_devices(request):
+            await release.wait()
+            return DEVICES
+
+        transport.add_route("GET", r"/v1/devices/", slow_devices)
+        transport.requests.clear()
+        await family_safety.update(wait=False)
+        waiting = asyncio.ensure_future(family_safety.update())
+        await asyncio.sleep(0.01)
+        assert family_safety.revalidating
+        assert not waiting.done()
+        release.set()
+        await waiting
+        revalidating = family_safety.revalidating
+        await family_safety.close()
+        return revalidating
+
+    assert asyncio.run(run()) is False
+    assert len([x for x in transport.requests if "/v1/devices/" in x["url"]]) == 2
+
+
+def test_cancelled_update_does_not_cancel_revalidation(transport, connect):
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        release = asyncio.Event()
+
+        async def slow_devices(request):
+            await release.wait()
+            return DEVICES
+
+        transport.add_route("GET", r"/v1/devices/", slow_devices)
+        revalidation = family_safety.revalidate()
+        waiting = asyncio.ensure_future(family_safety.update())
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        release.set()
+        await revalidation
+        cancelled = revalidation.cancelled()
+        await family_safety.close()
+        return cancelled
+
+    assert asyncio.run(run()) is False
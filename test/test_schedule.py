@@ -0,0 +1,68 @@
+"""Tests for local device limit schedule evaluation."""
+
+from datetime import datetime
+
+import pytest
+
+from pyfamilysafety.enum import DayOfWeek, OverrideTarget
+from pyfamilysafety.schedule import AllottedInterval, CompiledSchedule, DailyRestriction, DeviceLimitsSchedule
+
+
+def _at(day: int, hour: int, minute: int = 0) -> datetime:
+    """A time in the week starting Monday 2024-01-01."""
+    return datetime(2024, 1, day, hour, minute)
+
+
+@pytest.fixture
+def schedule() -> CompiledSchedule:
+    return CompiledSchedule(DeviceLimitsSchedule(OverrideTarget.XBOX, {
+        # overnight, runs into Tuesday morning
+        DayOfWeek.MONDAY: DailyRestriction.from_minutes(60, [AllottedInterval("20:00:00", "07:00:00")]),
+        # overlapping windows merge into 08:00-10:00
+        DayOfWeek.TUESDAY: DailyRestriction.from_minutes(120, [
+            AllottedInterval("08:00:00", "09:00:00"),
+            AllottedInterval("08:30:00", "10:00:00"),
+        ]),
+        DayOfWeek.WEDNESDAY: DailyRestriction.from_minutes(30),
+    }))
+
+
+@pytest.mark.parametrize(("when", "allowed"), [
+    (_at(1, 6), False),
+    (_at(1, 19, 59), False),
+    (_at(1, 20), True),
+    (_at(1, 23, 59), True),
+    (_at(2, 6, 59), True),
+    (_at(2, 7), False),
+    (_at(2, 9, 30), True),
+    (_at(2, 10), False),
+    (_at(3, 3), True),
+])
+def test_in_allotted_interval(schedule, when, allowed):
+    assert schedule.in_allotted_interval(when) is allowed
+
+
+@pytest.mark.parametrize(("when", "transition"), [
+    (_at(1, 19), _at(1, 20)),
+    (_at(1, 21), _at(2, 7)),
+    (_at(2, 7, 30), _at(2, 8)),
+    (_at(2, 9), _at(2, 10)),
+    (_at(2, 11), _at(3, 0)),
+    (_at(3, 12), _at(8, 0)),
+])
+def test_next_transition(schedule, when, transition):
+    assert schedule.next_transition(when) == transition
+
+
+def test_unrestricted_schedule_has_no_transition():
+    schedule = CompiledSchedule(DeviceLimitsSchedule(OverrideTarget.XBOX, {}))
+    assert schedule.next_transition(_at(1, 12)) is None
+    assert schedule.remaining_allowance(_at(1, 12)) is None
+
+
+def test_evaluate_combines_interval_and_allowance(schedule):
+    status = schedule.evaluate(_at(1, 21), used=30 * 60000)
+    assert (status.allowed, status.remaining_allowance) == (True, 30 * 60000)
+    status = schedule.evaluate(_at(1, 21), used=90 * 60000)
+    assert (status.allowed, status.in_allotted_interval, status.remaining_allowance) == (False, True, 0)
+    assert status.next_transition == _at(2, 7)
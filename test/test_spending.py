@@ -0,0 +1,89 @@
+"""Tests for spending balances and payment methods."""
+
+import asyncio
+from datetime import timedelta
+
+PAYMENT_METHODS = {"paymentMethods": [{"id": "card-1"}]}
+
+
+def _spending_requests(transport) -> int:
+    return len([x for x in transport.requests if "/v1/Spending/" in x["url"]])
+
+
+def test_balances_refresh_on_their_own_interval(transport, connect):
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        counts = [_spending_requests(transport)]
+        await family_safety.update()
+        counts.append(_spending_requests(transport))
+        account.spending.refresh_interval = timedelta(0)
+        await account.update()
+        counts.append(_spending_requests(transport))
+        account.spending.refresh_interval = timedelta(hours=1)
+        await account.refresh_spending()
+        counts.append(_spending_requests(transport))
+        await family_safety.close()
+        return account, counts
+
+    account, counts = asyncio.run(run())
+    # one request per member on the first update, none while fresh
+    assert counts == [2, 2, 3, 4]
+    assert (account.account_balance, account.account_currency) == (5.0, "GBP")
+    assert account.spending.get_balance("GBP") == 5.0
+    assert account.spending.get_balance("USD") is None
+    assert account.last_updated["account_balance"] == account.spending.last_refreshed
+
+
+def test_concurrent_payment_method_lookups_share_a_request(transport, connect):
+    release = asyncio.Event()
+
+    async def slow_payment_methods(request):
+        await release.wait()
+        return PAYMENT_METHODS
+
+    transport.add_route("GET", r"/paymentmethods/", slow_payment_methods)
+
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        lookups = [asyncio.ensure_future(account.get_payment_methods("cid-1")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*lookups)
+        results.append(await account.get_payment_methods("cid-1"))
+        results.append(await account.get_payment_methods("cid-1", refresh=True))
+        await family_safety.close()
+        return results
+
+    results = asyncio.run(run())
+    assert results == [PAYMENT_METHODS] * 5
+    assert len([x for x in transport.requests if "/paymentmethods/" in x["url"]]) == 2
+
+
+def test_cancelled_lookup_does_not_cancel_shared_request(transport, connect):
+    release = asyncio.Event()
+
+    async def slow_payment_methods(request):
+        await release.wait()
+        return PAYMENT_METHODS
+
+    transport.add_route("GET", r"/paymentmethods/", slow_payment_methods)
+
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        first = asyncio.ensure_future(account.get_payment_methods("cid-1"))
+        second = asyncio.ensure_future(account.get_payment_methods("cid-1"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        release.set()
+        result = await second
+        await family_safety.close()
+        return result
+
+    assert asyncio.run(run()) == PAYMENT_METHODS
+    assert len([x for x in transport.requests if "/paymentmethods/" in x["url"]]) == 1
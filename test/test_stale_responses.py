@@ -0,0 +1,50 @@
+"""Tests for responses served from cache while a circuit is open."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from pyfamilysafety.exceptions import CircuitOpen
+
+
+def test_stale_response_keeps_refresh_time_and_history(transport, connect):
+    async def run():
+        family_safety = await connect()
+        family_safety._api.circuit_failure_threshold = 1
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        refreshed = account.last_updated["screentime_usage"]
+        samples = len(account.usage_history)
+        transport.add_route("GET", r"/deviceScreenTimeUsage/", ConnectionError("unreachable"))
+        await family_safety.update()
+        await family_safety.update()
+        metrics = family_safety._api.circuit_metrics()["get_user_device_screentime_usage"]
+        await family_safety.close()
+        return account, refreshed, samples, metrics
+
+    account, refreshed, samples, metrics = asyncio.run(run())
+    assert metrics["stale_served"] > 0
+    assert account.today_screentime_usage == 3600000
+    assert account.last_updated["screentime_usage"] == refreshed
+    assert account.last_updated["devices"] > refreshed
+    assert len(account.usage_history) == samples
+
+
+def test_custom_range_reads_are_not_cached(connect):
+    async def run():
+        family_safety = await connect()
+        family_safety._api.circuit_failure_threshold = 1
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        end = datetime.now().astimezone() - timedelta(days=1)
+        await account.get_screentime_usage(end - timedelta(hours=1), end)
+        family_safety._api.get_circuit("get_user_device_screentime_usage").record_failure()
+        try:
+            with pytest.raises(CircuitOpen):
+                await account.get_screentime_usage(end - timedelta(hours=1), end)
+            return await account.get_screentime_usage()
+        finally:
+            await family_safety.close()
+
+    assert asyncio.run(run()) is not None
@@ -0,0 +1,100 @@
+"""Tests for the synchronous client."""
+
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+import pytest
+
+from pyfamilysafety.enum import ChangeEventType
+from pyfamilysafety.sync import SyncAccount, SyncFamilySafety
+
+from .conftest import DEVICE_USAGE
+
+
+@pytest.fixture
+def client(transport):
+    sync_client = SyncFamilySafety.create("refresh", use_refresh_token=True, timeout=10, transport=transport)
+    yield sync_client
+    sync_client.close()
+
+
+def test_attribute_assignment_reaches_client(client, transport):
+    client.experimental = True
+    assert client.family_safety.experimental is True
+    client.update()
+    assert any("/v1/PendingRequests" in x["url"] for x in transport.requests)
+    assert [x["id"] for x in client.pending_requests] == ["request-1", "request-2"]
+
+
+def test_accounts_are_wrapped(client):
+    client.update()
+    account = client.get_account("child-1")
+    assert isinstance(account, SyncAccount)
+    assert account.today_screentime_usage == DEVICE_USAGE["deviceUsageAggregates"]["totalScreenTime"]
+
+
+def test_plain_methods_run_on_loop_thread(client):
+    client.update()
+    revalidation = client.revalidate()
+    assert isinstance(revalidation, Future)
+    revalidation.result(10)
+    refresher = client.start_refresher(60, 60)
+    assert isinstance(refresher, Future)
+    assert client.refresher_running
+    client.close()
+    assert refresher.cancelled() or refresher.done()
+
+
+def test_events_are_a_blocking_iterator(client, transport):
+    client.update()
+    events = client.events()
+    received = []
+    consumer = threading.Thread(target=lambda: received.append(next(events)))
+    consumer.start()
+    while not client.family_safety._event_queues:
+        consumer.join(0.01)
+    usage = {"deviceUsageAggregates": {**DEVICE_USAGE["deviceUsageAggregates"], "totalScreenTime": 7200000}}
+    transport.add_route("GET", r"/deviceScreenTimeUsage/", usage)
+    client.update()
+    consumer.join(10)
+    events.close()
+    assert received[0].type is ChangeEventType.USAGE_CHANGED
+    assert received[0].new_value == 7200000
+
+
+def test_blocking_call_from_callback_raises(client):
+    client.update()
+    account = client.get_account("child-1")
+    errors = []
+
+    def on_update():
+        try:
+            account.get_web_restrictions()
+        except RuntimeError as err:
+            errors.append(err)
+
+    account.add_account_callback(on_update)
+    client.update()
+    assert len(errors) == 1
+
+
+def test_timeout_cancels_the_coroutine(transport):
+    cancelled = threading.Event()
+
+    async def hang(request):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    sync_client = SyncFamilySafety.create("refresh", use_refresh_token=True, timeout=0.2, transport=transport)
+    try:
+        sync_client.update()
+        transport.add_route("GET", r"/WebRestrictions/", hang)
+        with pytest.raises(FutureTimeoutError):
+            sync_client.get_account("child-1").get_web_restrictions()
+        assert cancelled.wait(5)
+    finally:
+        sync_client.close()
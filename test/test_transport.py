@@ -0,0 +1,95 @@
+"""Tests for the HTTP transports."""
+
+import asyncio
+import json
+import socket
+
+import pytest
+
+from pyfamilysafety.response import ApiResponse
+from pyfamilysafety.transport import MemoryTransport, Transport
+
+
+def test_transport_requires_request():
+    with pytest.raises(TypeError):
+        Transport()  # pylint: disable=abstract-class-instantiated
+
+
+def test_memory_transport_routes():
+    async def run():
+        transport = MemoryTransport()
+        transport.add_route("GET", r"/items$", {"items": []})
+        transport.add_route("GET", r"/items$", lambda request: ApiResponse(status=204))
+        transport.add_route("POST", r"/items$", ConnectionError("unreachable"))
+        latest = await transport.request("GET", "https://example.com/items")
+        missing = await transport.request("GET", "https://example.com/other")
+        with pytest.raises(ConnectionError):
+            await transport.request("POST", "https://example.com/items", json={"name": "x"})
+        return latest, missing, transport.requests
+
+    latest, missing, requests = asyncio.run(run())
+    assert latest.status == 204
+    assert missing.status == 404
+    assert [x["method"] for x in requests] == ["GET", "GET", "POST"]
+    assert requests[2]["json"] == {"name": "x"}
+
+
+async def _echo_app(scope, receive, send):
+    """Answer every request with the HTTP version and client address it arrived on."""
+    if scope["type"] != "http":
+        return
+    body = json.dumps({"http_version": scope["http_version"], "client": list(scope["client"])}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json")],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_http2_transport_multiplexes_requests():
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    pytest.importorskip("hypercorn")
+    from hypercorn.asyncio import serve  # pylint: disable=import-outside-toplevel
+    from hypercorn.config import Config  # pylint: disable=import-outside-toplevel
+
+    from pyfamilysafety.transport import Http2Transport  # pylint: disable=import-outside-toplevel
+
+    async def run():
+        port = _free_port()
+        config = Config()
+        config.bind = [f"127.0.0.1:{port}"]
+        config.accesslog = None
+        shutdown = asyncio.Event()
+        server = asyncio.ensure_future(serve(_echo_app, config, shutdown_trigger=shutdown.wait))
+        # plain-text HTTP/2 with prior knowledge, as TLS needs a certificate
+        client = httpx.AsyncClient(http1=False, http2=True)
+        transport = Http2Transport(client)
+        try:
+            for _ in range(100):
+                try:
+                    await transport.request("GET", f"http://127.0.0.1:{port}/")
+                    break
+                except transport.errors:
+                    await asyncio.sleep(0.05)
+            responses = await asyncio.gather(*(
+                transport.request("GET", f"http://127.0.0.1:{port}/v2/roster") for _ in range(20)
+            ))
+        finally:
+            await transport.close()
+            await client.aclose()
+            shutdown.set()
+            await server
+        return responses
+
+    responses = asyncio.run(run())
+    assert all(response["status"] == 200 for response in responses)
+    assert {response["json"]["http_version"] for response in responses} == {"2"}
+    assert len({tuple(response["json"]["client"]) for response in responses}) == 1
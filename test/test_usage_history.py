@@ -0,0 +1,78 @@
+"""Tests for intraday usage history."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pyfamilysafety.usage_history import UsageHistory
+
+START = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _history(capacity: int, samples) -> UsageHistory:
+    history = UsageHistory(capacity)
+    for minutes, usage in samples:
+        history.append(usage, START + timedelta(minutes=minutes))
+    return history
+
+
+def test_wraparound_keeps_newest_samples():
+    history = _history(3, [(i, i * 60000) for i in range(5)])
+    assert len(history) == 3
+    assert [usage for _, usage in history.samples()] == [120000, 180000, 240000]
+    assert history.samples()[0][0] == START + timedelta(minutes=2)
+    assert history.latest == 240000
+
+
+def test_same_timestamp_replaces_latest():
+    history = _history(3, [(0, 0), (1, 60000), (1, 90000)])
+    assert [usage for _, usage in history.samples()] == [0, 90000]
+
+
+def test_usage_drop_starts_a_new_day():
+    history = _history(3, [(0, 60000), (1, 120000), (2, 0)])
+    assert [usage for _, usage in history.samples()] == [0]
+
+
+def test_burn_rate_uses_window():
+    # idle for the first 30 minutes, then continuous use
+    history = _history(10, [(0, 0), (30, 0), (40, 600000), (50, 1200000)])
+    assert history.burn_rate(timedelta(minutes=20)) == pytest.approx(1.0)
+    assert history.burn_rate(timedelta(minutes=50)) == pytest.approx(0.4)
+    assert history.burn_rate(timedelta(minutes=5)) is None
+
+
+def test_burn_rate_after_wraparound():
+    history = _history(2, [(0, 0), (10, 0), (20, 300000)])
+    assert history.burn_rate(timedelta(hours=1)) == pytest.approx(0.5)
+
+
+def test_time_to_limit():
+    history = _history(10, [(0, 0), (10, 600000)])
+    assert history.time_to_limit(1200000) == timedelta(minutes=10)
+    assert history.time_to_limit(600000) == timedelta(0)
+    assert _history(10, [(0, 0), (10, 0)]).time_to_limit(600000) is None
+    assert UsageHistory().time_to_limit(600000) is None
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        UsageHistory(1)
+
+
+def test_account_records_samples_per_update(transport, connect):
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        before = len(account.usage_history)
+        await asyncio.sleep(0.01)
+        await family_safety.update()
+        await family_safety.close()
+        return account, before
+
+    account, before = asyncio.run(run())
+    assert len(account.usage_history) == before + 1
+    assert account.get_burn_rate() == 0
+    assert len(account.device_usage_history["xbox"]) == before + 1
@@ -0,0 +1,70 @@
+"""Tests for batched web restriction exceptions."""
+
+import asyncio
+
+import pytest
+
+WEB_RESTRICTIONS = {
+    "exceptions": [
+        {"website": "example.com", "allowed": True},
+        {"website": "games.example.com", "allowed": False},
+    ]
+}
+
+
+def _patches(transport) -> list[list[dict]]:
+    return [
+        x["json"]["operations"] for x in transport.requests
+        if x["method"] == "PATCH" and "/WebRestrictions/" in x["url"]
+    ]
+
+
+def _run(transport, connect, call):
+    transport.add_route("GET", r"/WebRestrictions/", WEB_RESTRICTIONS)
+    transport.add_route("PATCH", r"/WebRestrictions/", {})
+
+    async def run():
+        family_safety = await connect()
+        await family_safety.update()
+        account = family_safety.get_account("child-1")
+        result = await call(account)
+        await family_safety.close()
+        return account, result
+
+    return asyncio.run(run())
+
+
+def test_add_skips_duplicates_and_existing(transport, connect):
+    account, sent = _run(transport, connect, lambda account: account.add_web_exceptions(
+        ["new.example.com", "NEW.example.com/", "example.com", "games.example.com"], allowed=True))
+    assert [(x["op"], x["value"]["website"]) for x in sent] == [
+        ("Add", "new.example.com"),
+        ("Remove", "games.example.com"),
+        ("Add", "games.example.com"),
+    ]
+    assert _patches(transport) == [sent]
+    assert account.web_restrictions.is_allowed("games.example.com") is True
+
+
+def test_operations_are_chunked_without_splitting_replacements(transport, connect):
+    websites = ["games.example.com"] + [f"site-{i}.example.com" for i in range(4)]
+    _, sent = _run(transport, connect, lambda account: account.add_web_exceptions(
+        websites, allowed=True, batch_size=3))
+    patches = _patches(transport)
+    assert [len(x) for x in patches] == [3, 3]
+    assert [x["op"] for x in patches[0]] == ["Remove", "Add", "Add"]
+    assert sum(patches, []) == sent
+
+
+def test_remove_skips_missing(transport, connect):
+    account, sent = _run(transport, connect, lambda account: account.remove_web_exceptions(
+        ["example.com", "missing.example.com", "Example.com"]))
+    assert [(x["op"], x["value"]["website"]) for x in sent] == [("Remove", "example.com")]
+    assert "example.com" not in account.web_restrictions
+
+
+@pytest.mark.parametrize("websites", [[], ["example.com"]])
+def test_no_changes_sends_nothing(transport, connect, websites):
+    _, sent = _run(transport, connect, lambda account: account.add_web_exceptions(websites, allowed=True))
+    assert sent == []
+    assert _patches(transport) == []